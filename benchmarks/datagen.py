@@ -0,0 +1,187 @@
+"""Synthetic hostel dataset generator.
+
+Fills a database with students, rooms, managers, bookings and complaints
+whose shapes follow the models: mixed room sizes priced by capacity,
+semester-aligned stays, mostly historical bookings with a confirmed current
+intake that never exceeds room capacity, and complaints skewed towards a
+few managers. Rows are streamed into chunked executemany INSERTs.
+
+    python -m benchmarks.datagen --students 100000
+    python -m benchmarks.datagen --students 1000 --database-url sqlite:///bench.db
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import insert, update, bindparam
+from lib.config import build_engine, load_settings
+from lib.models import Student, Room, Manager, Booking, Complaint
+from lib.commands.core import create_schema
+
+CHUNK_SIZE = 10000
+
+FIRST_NAMES = ["Wanjiku", "Otieno", "Achieng", "Kamau", "Njeri", "Mutua", "Akinyi", "Kiprono",
+               "Wairimu", "Omondi", "Chebet", "Mwangi", "Nyambura", "Kiptoo", "Atieno", "Gitau"]
+LAST_NAMES = ["Mwangi", "Owino", "Kariuki", "Githinji", "Wafula", "Odhiambo", "Kimani", "Cheruiyot",
+              "Njoroge", "Mutiso", "Wekesa", "Ndungu", "Korir", "Onyango", "Macharia", "Rotich"]
+DOMAINS = ["students.ku.ac.ke", "students.uonbi.ac.ke", "jkuat.ac.ke", "gmail.com", "yahoo.com"]
+COMPLAINT_TITLES = ["Leaking tap", "Broken window", "No hot water", "Power outage", "Noisy neighbours",
+                    "Blocked drain", "Faulty lock", "Wi-Fi down", "Pest problem", "Broken bed"]
+
+# (capacity, share of rooms, price range in KES per semester)
+ROOM_TYPES = [(1, 0.10, (30000, 40000)), (2, 0.40, (20000, 28000)), (4, 0.50, (12000, 18000))]
+SEMESTER_STARTS = [(1, 8), (5, 6), (9, 2)]
+HISTORY_YEARS = 4
+
+def scaled_counts(students):
+    """Entity counts derived from the number of students"""
+    return {
+        'students': students,
+        'rooms': max(students // 3, 1),
+        'managers': max(students // 2000, 5),
+        'bookings': students * 3 // 2,
+        'complaints': max(students // 5, 1),
+    }
+
+def semester_starts(today):
+    starts = []
+    for year in range(today.year - HISTORY_YEARS, today.year + 1):
+        for month, day in SEMESTER_STARTS:
+            start = date(year, month, day)
+            if start <= today:
+                starts.append(start)
+    return starts
+
+def chunked_insert(conn, model, rows, chunk_size=CHUNK_SIZE):
+    chunk, count = [], 0
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            conn.execute(insert(model), chunk)
+            count += len(chunk)
+            chunk = []
+    if chunk:
+        conn.execute(insert(model), chunk)
+        count += len(chunk)
+    return count
+
+def generate(engine, students, seed=42, today=None):
+    """Populate an empty schema; returns the number of rows per table"""
+    rng = random.Random(seed)
+    today = today or date.today()
+    counts = scaled_counts(students)
+    # Same schema as `initdb`: tables, search index and Alembic stamp
+    create_schema(engine)
+
+    capacities, weights = [t[0] for t in ROOM_TYPES], [t[1] for t in ROOM_TYPES]
+    prices = {capacity: price_range for capacity, _, price_range in ROOM_TYPES}
+    room_capacity = [rng.choices(capacities, weights)[0] for _ in range(counts['rooms'])]
+    starts = semester_starts(today)
+    current_start = starts[-1]
+
+    def student_rows():
+        for i in range(1, counts['students'] + 1):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            yield {
+                'id': i, 'name': f"{first} {last}",
+                'email': f"{first.lower()}.{last.lower()}{i}@{rng.choice(DOMAINS)}",
+                'phone': f"07{rng.randrange(10 ** 8):08d}",
+                'registration_date': today - timedelta(days=rng.randrange(365 * HISTORY_YEARS)),
+            }
+
+    def room_rows():
+        for i, capacity in enumerate(room_capacity, start=1):
+            low, high = prices[capacity]
+            yield {
+                'id': i, 'room_number': f"{'ABCDEFGH'[i % 8]}{i}", 'capacity': capacity,
+                'current_occupancy': 0, 'price': rng.randrange(low, high + 1, 500), 'is_available': True,
+            }
+
+    def manager_rows():
+        for i in range(1, counts['managers'] + 1):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            yield {'id': i, 'name': f"{first} {last}", 'email': f"{first.lower()}.{last.lower()}{i}@hostels.co.ke",
+                   'phone': f"07{rng.randrange(10 ** 8):08d}"}
+
+    occupancy = [0] * (counts['rooms'] + 1)
+
+    def booking_rows():
+        # Fill current beds first (up to ~85% of capacity), the rest is history
+        current_target = int(sum(room_capacity) * 0.85)
+        free_rooms = [i for i in range(1, counts['rooms'] + 1)]
+        for i in range(1, counts['bookings'] + 1):
+            room_id = None
+            if i <= current_target and free_rooms:
+                pick = rng.randrange(len(free_rooms))
+                room_id = free_rooms[pick]
+                occupancy[room_id] += 1
+                if occupancy[room_id] >= room_capacity[room_id - 1]:
+                    free_rooms[pick] = free_rooms[-1]
+                    free_rooms.pop()
+                check_in, status = current_start, 'confirmed'
+            else:
+                room_id = rng.randint(1, counts['rooms'])
+                check_in = rng.choice(starts[:-1] or starts)
+                status = 'cancelled' if rng.random() < 0.15 else 'completed'
+            check_in += timedelta(days=rng.randrange(7))
+            yield {
+                'id': i, 'student_id': rng.randint(1, counts['students']), 'room_id': room_id,
+                'booking_date': check_in - timedelta(days=rng.randrange(1, 60)),
+                'check_in_date': check_in,
+                'check_out_date': check_in + timedelta(days=rng.choice((105, 112, 120))),
+                'status': status,
+            }
+
+    def complaint_rows():
+        manager_weights = [1 / rank for rank in range(1, counts['managers'] + 1)]
+        manager_ids = range(1, counts['managers'] + 1)
+        for i in range(1, counts['complaints'] + 1):
+            filed = today - timedelta(days=int(rng.expovariate(1 / 90)))
+            age = (today - filed).days
+            status = rng.choices(['open', 'in-progress', 'resolved'],
+                                 [0.6, 0.3, 0.1] if age < 14 else [0.05, 0.1, 0.85])[0]
+            title = rng.choice(COMPLAINT_TITLES)
+            yield {
+                'id': i, 'student_id': rng.randint(1, counts['students']),
+                'manager_id': rng.choices(manager_ids, manager_weights)[0],
+                'title': title, 'description': f"{title} reported in room block {rng.choice('ABCDEFGH')}",
+                'date': filed, 'status': status,
+            }
+
+    written = {}
+    with engine.begin() as conn:
+        written['students'] = chunked_insert(conn, Student, student_rows())
+        written['rooms'] = chunked_insert(conn, Room, room_rows())
+        written['managers'] = chunked_insert(conn, Manager, manager_rows())
+        written['bookings'] = chunked_insert(conn, Booking, booking_rows())
+        written['complaints'] = chunked_insert(conn, Complaint, complaint_rows())
+        occupied = [
+            {'room_id': room_id, 'occupied': occupancy[room_id],
+             'available': occupancy[room_id] < room_capacity[room_id - 1]}
+            for room_id in range(1, counts['rooms'] + 1) if occupancy[room_id]
+        ]
+        if occupied:
+            conn.execute(
+                update(Room.__table__)
+                .where(Room.__table__.c.id == bindparam('room_id'))
+                .values(current_occupancy=bindparam('occupied'), is_available=bindparam('available')),
+                occupied,
+            )
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--students', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--database-url', default=None, help="Defaults to the configured HOSTEL_DATABASE_URL")
+    args = parser.parse_args()
+
+    engine = build_engine(url=args.database_url or load_settings().database_url)
+    started = time.perf_counter()
+    written = generate(engine, args.students, args.seed)
+    elapsed = time.perf_counter() - started
+    print(", ".join(f"{count} {table}" for table, count in written.items()) + f" in {elapsed:.1f}s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Show how the lookup indexes change SQLite query plans.
+
+Builds a throwaway database, fills it with synthetic rows, then runs the hot
+lookup queries before and after creating the indexes declared on the models,
+printing EXPLAIN QUERY PLAN output and timings for each.
+
+    python -m benchmarks.explain_indexes --bookings 50000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+from lib.models import Base
+
+HOT_QUERIES = [
+    ("bookings of a student",
+     "SELECT id, room_id, status FROM bookings WHERE student_id = :student_id"),
+    ("live bookings of a room in a window",
+     "SELECT id FROM bookings WHERE room_id = :room_id AND status = 'confirmed' "
+     "AND check_in_date < :day AND check_out_date > :day"),
+    ("expired confirmed bookings",
+     "SELECT id FROM bookings WHERE status = 'confirmed' AND check_out_date < :day"),
+    ("complaint status counts",
+     "SELECT status, count(*) FROM complaints GROUP BY status"),
+    ("open complaints of a manager",
+     "SELECT id FROM complaints WHERE manager_id = :manager_id AND status = 'open'"),
+    ("available rooms",
+     "SELECT id, room_number, price FROM rooms WHERE is_available = 1"),
+]
+
+def populate(conn, bookings, rng):
+    students = max(bookings // 2, 1)
+    rooms = max(bookings // 20, 1)
+    managers = 20
+    complaints = bookings // 5
+    start = date(2024, 1, 1)
+
+    conn.executemany(
+        "INSERT INTO students (id, name, email, phone) VALUES (?, ?, ?, ?)",
+        ((i, f"Student {i}", f"s{i}@students.ac.ke", f"07{i:08d}") for i in range(1, students + 1)))
+    conn.executemany(
+        "INSERT INTO rooms (id, room_number, capacity, current_occupancy, price, is_available) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        ((i, f"R{i}", 4, 0, 15000, rng.random() < 0.3) for i in range(1, rooms + 1)))
+    conn.executemany(
+        "INSERT INTO managers (id, name, email, phone) VALUES (?, ?, ?, ?)",
+        ((i, f"Manager {i}", f"m{i}@hostels.co.ke", f"07{i:08d}") for i in range(1, managers + 1)))
+
+    def booking_rows():
+        for i in range(1, bookings + 1):
+            check_in = start + timedelta(days=rng.randrange(730))
+            yield (i, rng.randint(1, students), rng.randint(1, rooms), check_in,
+                   check_in + timedelta(days=rng.choice((30, 120, 180))),
+                   rng.choice(('confirmed', 'confirmed', 'completed', 'cancelled')))
+    conn.executemany(
+        "INSERT INTO bookings (id, student_id, room_id, check_in_date, check_out_date, status) "
+        "VALUES (?, ?, ?, ?, ?, ?)", booking_rows())
+    conn.executemany(
+        "INSERT INTO complaints (id, student_id, manager_id, title, status) VALUES (?, ?, ?, ?, ?)",
+        ((i, rng.randint(1, students), rng.randint(1, managers), "Leaking tap",
+          rng.choice(('open', 'in-progress', 'resolved'))) for i in range(1, complaints + 1)))
+    conn.commit()
+
+def measure(conn, params, repeat):
+    results = {}
+    for label, sql in HOT_QUERIES:
+        plan = [row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+        started = time.perf_counter()
+        for _ in range(repeat):
+            conn.execute(sql, params).fetchall()
+        results[label] = (plan, (time.perf_counter() - started) / repeat * 1000)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bookings', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    try:
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(engine)
+        indexes = [index for table in Base.metadata.sorted_tables for index in table.indexes]
+        for index in indexes:
+            index.drop(engine)
+        engine.dispose()
+
+        conn = sqlite3.connect(path)
+        populate(conn, args.bookings, random.Random(args.seed))
+        params = {'student_id': 1, 'room_id': 1, 'manager_id': 1, 'day': '2025-01-01'}
+
+        before = measure(conn, params, args.repeat)
+        conn.close()
+
+        engine = create_engine(f"sqlite:///{path}")
+        for index in indexes:
+            index.create(engine)
+        engine.dispose()
+
+        conn = sqlite3.connect(path)
+        conn.execute("ANALYZE")
+        after = measure(conn, params, args.repeat)
+        conn.close()
+
+        for label, _ in HOT_QUERIES:
+            (plan_before, ms_before), (plan_after, ms_after) = before[label], after[label]
+            print(f"\n{label}")
+            print(f"  without indexes ({ms_before:.3f} ms): {' / '.join(plan_before)}")
+            print(f"  with indexes    ({ms_after:.3f} ms): {' / '.join(plan_after)}")
+    finally:
+        os.remove(path)
+
+if __name__ == '__main__':
+    main()
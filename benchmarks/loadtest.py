@@ -0,0 +1,138 @@
+"""Load test for the `serve` HTTP API.
+
+Opens --connections keep-alive connections against a running server and
+fires a mix of read requests (student lookups, listings, availability) plus
+an optional share of booking writes, then reports requests/sec, latency
+percentiles and status codes. --spawn starts a server on the given
+database first and stops it afterwards.
+
+    python -m lib.cli serve --port 8080 &
+    python -m benchmarks.loadtest --url http://127.0.0.1:8080 --duration 10 --connections 32
+    python -m benchmarks.loadtest --spawn sqlite:///bench.db --duration 10 --write-ratio 0.05
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+async def request(reader, writer, method, path, body=None):
+    """Send one request on a keep-alive connection; returns (status, payload)"""
+    data = json.dumps(body).encode() if body is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: loadtest\r\n"
+                 f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode().partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    payload = await reader.readexactly(length)
+    return status, payload
+
+def pick_request(rng, max_student, max_room, write_ratio):
+    if rng.random() < write_ratio:
+        start = 2027 + rng.randint(0, 5)
+        return 'POST', '/bookings', {
+            'student_id': rng.randint(1, max_student), 'room_id': rng.randint(1, max_room),
+            'check_in': f"{start}-01-10", 'check_out': f"{start}-04-30"}
+    roll = rng.random()
+    if roll < 0.5:
+        return 'GET', f"/students/{rng.randint(1, max_student)}", None
+    if roll < 0.75:
+        return 'GET', f"/rooms/{rng.randint(1, max_room)}", None
+    if roll < 0.98:
+        return 'GET', f"/students?after_id={rng.randint(0, max_student)}&limit=20", None
+    return 'GET', '/rooms/available?check_in=2027-01-10&check_out=2027-04-30', None
+
+async def client(host, port, deadline, seed, args, latencies, statuses):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            method, path, body = pick_request(rng, args.max_student, args.max_room, args.write_ratio)
+            started = time.perf_counter()
+            status, _ = await request(reader, writer, method, path, body)
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[status] += 1
+    finally:
+        writer.close()
+
+async def run(args):
+    url = urlsplit(args.url)
+    latencies, statuses = [], Counter()
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(client(url.hostname, url.port or 80, deadline, seed, args, latencies, statuses)
+                           for seed in range(args.connections)))
+    return latencies, statuses, time.perf_counter() - started
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+async def wait_for_server(url, timeout=15):
+    parts = urlsplit(url)
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection(parts.hostname, parts.port)
+            status, _ = await request(reader, writer, 'GET', '/health')
+            writer.close()
+            if status == 200:
+                return True
+        except OSError:
+            await asyncio.sleep(0.1)
+    return False
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8080')
+    parser.add_argument('--duration', type=float, default=10.0, help="Seconds to run")
+    parser.add_argument('--connections', type=int, default=32, help="Concurrent keep-alive clients")
+    parser.add_argument('--write-ratio', type=float, default=0.0, help="Share of requests that create bookings")
+    parser.add_argument('--max-student', type=int, default=1000, help="Highest student id to request")
+    parser.add_argument('--max-room', type=int, default=300, help="Highest room id to request")
+    parser.add_argument('--spawn', metavar='DATABASE_URL', help="Start `serve` on this database for the run")
+    parser.add_argument('--workers', type=int, help="Database workers for the spawned server")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        command = [sys.executable, '-m', 'lib.cli', 'serve', '--port', str(urlsplit(args.url).port or 8080)]
+        if args.workers:
+            command += ['--workers', str(args.workers)]
+        server = subprocess.Popen(command, env=dict(os.environ, HOSTEL_DATABASE_URL=args.spawn))
+        if not asyncio.run(wait_for_server(args.url)):
+            server.terminate()
+            print("server did not start", file=sys.stderr)
+            return 1
+    try:
+        latencies, statuses, elapsed = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if not latencies:
+        print("no requests completed", file=sys.stderr)
+        return 1
+    print(f"{len(latencies)} requests in {elapsed:.2f}s over {args.connections} connections")
+    print(f"throughput: {len(latencies) / elapsed:.0f} requests/sec")
+    print(f"latency ms: p50={percentile(latencies, 0.50):.2f} p95={percentile(latencies, 0.95):.2f} "
+          f"p99={percentile(latencies, 0.99):.2f} max={max(latencies):.2f} mean={statistics.fmean(latencies):.2f}")
+    print("status: " + ", ".join(f"{status}={count}" for status, count in sorted(statuses.items())))
+    return 0 if all(status < 500 for status in statuses) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
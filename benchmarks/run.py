@@ -0,0 +1,170 @@
+"""Benchmark harness for the core hostel operations.
+
+For each scale (number of students) a fresh SQLite database is generated
+with benchmarks.datagen, then listing, booking creation and cancellation,
+every report behind view_reports and student lookup are timed. Results are
+written as JSON so runs can be compared.
+
+    python -m benchmarks.run --scales 1k 100k --output results.json
+    python -m benchmarks.run --scales 1k --compare results.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import sqlalchemy
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from lib.config import build_engine
+from lib.models import Student, Room
+from lib import queries, reports
+from lib.bookings import BookingError, create_booking, cancel_booking
+from .datagen import generate
+
+SCALES = {'1k': 1000, '10k': 10000, '100k': 100000, '1m': 1000000}
+
+def parse_scale(value):
+    if value.lower() in SCALES:
+        return value.lower(), SCALES[value.lower()]
+    return value, int(value)
+
+def timed(fn, repeat):
+    """Run fn `repeat` times; returns timing stats in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        'runs': repeat,
+        'min_ms': round(min(samples), 3),
+        'median_ms': round(statistics.median(samples), 3),
+        'mean_ms': round(statistics.fmean(samples), 3),
+    }
+
+def operations(session, rng, counts):
+    """Named benchmark callables, in the order they are run"""
+    max_student = counts['students']
+    created = []
+
+    def book():
+        room_id = session.execute(
+            select(Room.id).where(Room.is_available == True).limit(1)
+            .offset(rng.randrange(50))
+        ).scalar() or 1
+        start = datetime(2030, 1, 1).date() + timedelta(days=rng.randrange(365))
+        try:
+            created.append(create_booking(session, rng.randint(1, max_student), room_id,
+                                          start, start + timedelta(days=120)).id)
+        except BookingError:
+            pass
+
+    def cancel():
+        if created:
+            cancel_booking(session, created.pop())
+
+    def lookup():
+        student_id = rng.randint(1, max_student)
+        session.get(Student, student_id)
+        queries.student_bookings(session, student_id)
+        session.expunge_all()
+
+    return [
+        ('list_students_page', lambda: queries.student_rows(session, limit=queries.PAGE_SIZE)),
+        ('list_bookings_page', lambda: queries.booking_rows(session, limit=queries.PAGE_SIZE)),
+        ('list_bookings_deep_page', lambda: queries.booking_rows(
+            session, after_id=counts['bookings'] - queries.PAGE_SIZE, limit=queries.PAGE_SIZE)),
+        ('list_complaints_page', lambda: queries.complaint_rows(session, limit=queries.PAGE_SIZE)),
+        ('list_bookings_all', lambda: queries.booking_rows(session)),
+        ('student_lookup', lookup),
+        ('booking_create', book),
+        ('booking_cancel', cancel),
+        ('report_occupancy', lambda: reports.occupancy_rows(session)),
+        ('report_complaint_status', lambda: reports.complaint_status_counts(session)),
+        ('report_finance_summary', lambda: reports.finance_summary(session)),
+        ('report_revenue_details', lambda: reports.revenue_rows(session)),
+    ]
+
+def run_scale(students, repeat, seed, workdir):
+    path = os.path.join(workdir, f"bench_{students}.db")
+    engine = build_engine(url=f"sqlite:///{path}")
+    started = time.perf_counter()
+    counts = generate(engine, students, seed)
+    generated_s = time.perf_counter() - started
+    session = sessionmaker(bind=engine)()
+    rng = random.Random(seed)
+    results = {}
+    for name, fn in operations(session, rng, counts):
+        # Full listings get fewer runs at large scales
+        runs = max(1, repeat // 10) if name.endswith('_all') else repeat
+        results[name] = timed(fn, runs)
+    session.close()
+    engine.dispose()
+    os.remove(path)
+    return {'rows': counts, 'generate_s': round(generated_s, 2), 'operations': results}
+
+def metadata():
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                  text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': revision,
+        'python': platform.python_version(),
+        'sqlalchemy': sqlalchemy.__version__,
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+    }
+
+def compare(current, previous):
+    for scale, data in current['results'].items():
+        baseline = previous.get('results', {}).get(scale)
+        if not baseline:
+            continue
+        print(f"\n{scale} vs previous run")
+        for name, stats in data['operations'].items():
+            before = baseline['operations'].get(name)
+            if not before or not before['median_ms']:
+                continue
+            change = (stats['median_ms'] - before['median_ms']) / before['median_ms'] * 100
+            flag = "  REGRESSION" if change > 20 else ""
+            print(f"  {name:28} {before['median_ms']:10.3f} -> {stats['median_ms']:10.3f} ms ({change:+.0f}%){flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', nargs='+', default=['1k', '100k'], help="e.g. 1k 100k 1m or a student count")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--compare', help="Previous results JSON to diff against")
+    args = parser.parse_args()
+
+    report = {'meta': metadata(), 'results': {}}
+    with tempfile.TemporaryDirectory() as workdir:
+        for label, students in map(parse_scale, args.scales):
+            print(f"Running {label} ({students} students)...")
+            report['results'][label] = result = run_scale(students, args.repeat, args.seed, workdir)
+            for name, stats in result['operations'].items():
+                print(f"  {name:28} median {stats['median_ms']:10.3f} ms")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(report, json.load(f))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""CLI startup benchmark.
+
+Runs `python -m lib.cli --help` repeatedly in fresh interpreters and reports
+wall-clock timings, then checks that the help path does not import
+SQLAlchemy or the menu. Exits non-zero when the median exceeds the
+budget.
+
+    python -m benchmarks.startup --runs 20 --budget-ms 50
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('sqlalchemy', 'lib.models', 'lib.menu')
+
+def time_command(args, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(args, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+def heavy_imports():
+    probe = (
+        "import contextlib, io, sys\n"
+        "from lib.cli import cli\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    cli.main(['--help'], standalone_mode=False)\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    output = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, capture_output=True,
+                            text=True, check=True).stdout.strip()
+    return [m for m in output.split(',') if m]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--budget-ms', type=float, default=50.0)
+    args = parser.parse_args()
+
+    baseline = time_command([sys.executable, '-c', 'pass'], args.runs)
+    click_floor = time_command([sys.executable, '-c', 'import click'], args.runs)
+    timings = time_command([sys.executable, '-m', 'lib.cli', '--help'], args.runs)
+    median = statistics.median(timings)
+    print(f"bare interpreter: median {statistics.median(baseline):.1f} ms")
+    print(f"import click:     median {statistics.median(click_floor):.1f} ms")
+    print(f"hostel --help:    median {median:.1f} ms, min {min(timings):.1f} ms, max {max(timings):.1f} ms")
+
+    loaded = heavy_imports()
+    if loaded:
+        print(f"FAIL: --help imported {', '.join(loaded)}")
+        return 1
+    if median > args.budget_ms:
+        print(f"FAIL: median above {args.budget_ms:.0f} ms budget")
+        return 1
+    print(f"PASS: within {args.budget_ms:.0f} ms budget, no heavy imports")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Multi-process booking stress test.
+
+Several worker processes race to book beds in the same few rooms of a shared
+SQLite file, over a mix of overlapping and back-to-back date windows.
+Afterwards no room may hold more simultaneous confirmed stays than its
+capacity on any day, and current_occupancy must match the confirmed booking
+count.
+
+    python -m benchmarks.stress_booking --workers 8 --attempts 200
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+from lib.config import build_engine
+from lib.models import Base, Student, Room, Booking
+from lib.availability import peak_occupancy
+from lib.bookings import BookingError, create_booking, cancel_booking
+
+TERM_START = date(2027, 1, 10)
+# (offset, length) in weeks: whole term, halves, a middle slice and short stays
+WINDOWS = [(0, 16), (0, 8), (8, 8), (4, 8), (0, 4), (12, 4)]
+
+def random_window(rng):
+    offset, length = rng.choice(WINDOWS)
+    check_in = TERM_START + timedelta(weeks=offset)
+    return check_in, check_in + timedelta(weeks=length)
+
+def worker(url, seed, attempts, rooms, students, counts):
+    rng = random.Random(seed)
+    session = sessionmaker(bind=build_engine(url=url))()
+    booked = rejected = cancelled = 0
+    mine = []
+    for _ in range(attempts):
+        if mine and rng.random() < 0.2:
+            cancel_booking(session, mine.pop(rng.randrange(len(mine))))
+            cancelled += 1
+            continue
+        try:
+            booking = create_booking(session, rng.randint(1, students), rng.randint(1, rooms),
+                                     *random_window(rng))
+            mine.append(booking.id)
+            booked += 1
+        except BookingError:
+            rejected += 1
+    counts.put((booked, rejected, cancelled))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--attempts', type=int, default=200)
+    parser.add_argument('--rooms', type=int, default=5)
+    parser.add_argument('--capacity', type=int, default=4)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    url = f"sqlite:///{path}"
+    engine = build_engine(url=url)
+    try:
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        students = args.workers * args.attempts
+        session.add_all(
+            [Student(name=f"Student {i}", email=f"s{i}@students.ac.ke", phone="0712345678")
+             for i in range(students)] +
+            [Room(room_number=f"R{i}", capacity=args.capacity, price=15000)
+             for i in range(args.rooms)]
+        )
+        session.commit()
+
+        counts = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=worker,
+                                    args=(url, seed, args.attempts, args.rooms, students, counts))
+            for seed in range(args.workers)
+        ]
+        started = time.perf_counter()
+        for process in processes:
+            process.start()
+        totals = [sum(col) for col in zip(*(counts.get() for _ in processes))]
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - started
+
+        stays = {}
+        for room_id, check_in, check_out in session.execute(
+                select(Booking.room_id, Booking.check_in_date, Booking.check_out_date)
+                .where(Booking.status == 'confirmed')):
+            stays.setdefault(room_id, []).append((check_in, check_out))
+        term_end = TERM_START + timedelta(weeks=max(offset + length for offset, length in WINDOWS))
+        failures = 0
+        for room in session.query(Room).order_by(Room.id):
+            held = stays.get(room.id, [])
+            peak = peak_occupancy(held, TERM_START, term_end)
+            ok = peak <= room.capacity and len(held) == room.current_occupancy
+            failures += not ok
+            print(f"{room.room_number}: capacity={room.capacity} peak={peak} confirmed={len(held)} "
+                  f"occupancy={room.current_occupancy} {'OK' if ok else 'OVERBOOKED/DRIFT'}")
+        booked, rejected, cancelled = totals
+        print(f"\n{args.workers} workers, {booked} booked, {rejected} rejected, "
+              f"{cancelled} cancelled in {elapsed:.2f}s")
+        print("PASS: no overbooking" if not failures else f"FAIL: {failures} rooms inconsistent")
+        return 1 if failures else 0
+    finally:
+        engine.dispose()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+if __name__ == '__main__':
+    sys.exit(main())
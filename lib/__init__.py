@@ -1,4 +1,14 @@
-from .models import session, Student, Room, Manager, Booking, Complaint
-from .cli import cli
+# Attributes are resolved lazily so that importing the package (for example
+# via `python -m lib.cli`) does not load SQLAlchemy or touch the database.
+_MODEL_NAMES = ('Session', 'session', 'session_scope', 'Student', 'Room', 'Manager', 'Booking', 'Complaint')
 
-__all__ = ['session', 'Student', 'Room', 'Manager', 'Booking', 'Complaint', 'cli']
\ No newline at end of file
+__all__ = ['Session', 'session', 'session_scope', 'Student', 'Room', 'Manager', 'Booking', 'Complaint', 'cli']
+
+def __getattr__(name):
+    if name in _MODEL_NAMES:
+        from . import models
+        return getattr(models, name)
+    if name == 'cli':
+        from .cli import cli
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,136 @@
+from collections import deque
+from sqlalchemy import select, insert
+from .models import Student, Booking
+from .availability import overlaps, free_beds_by_room
+from .bookings import with_retry
+from .importer import read_rows
+from .occupancy import refresh_rooms
+
+# Batch bed allocation for semester intake. All requests share one stay
+# window. Free beds are loaded once into an in-memory index bucketed by room
+# type (rooms have no type column, so the type is their capacity) and kept
+# cheapest-first. Requests are served in ascending budget order, which keeps
+# cheap beds for the students who can only afford those. All bookings are
+# then written with one executemany INSERT and one counter refresh inside a
+# single write transaction.
+
+ROOM_TYPES = {'single': 1, 'double': 2, 'triple': 3, 'quad': 4}
+ID_CHUNK = 5000
+
+class AllocationRequest:
+    def __init__(self, line_number, student_id, max_price=None, capacity=None):
+        self.line_number = line_number
+        self.student_id = student_id
+        self.max_price = max_price
+        self.capacity = capacity
+
+def parse_requests(path, fmt=None):
+    """Parse a request file; returns (requests, errors)"""
+    requests, errors = [], []
+    for line_number, row in read_rows(path, fmt):
+        if not isinstance(row, dict):
+            errors.append((line_number, "row is not an object"))
+            continue
+        if '_error' in row:
+            errors.append((line_number, row['_error']))
+            continue
+        try:
+            student_id = int(row.get('student_id'))
+            max_price = row.get('max_price')
+            max_price = int(max_price) if max_price not in (None, '') else None
+            room_type = str(row.get('room_type') or '').strip().lower()
+            capacity = ROOM_TYPES.get(room_type) or (int(room_type) if room_type else None)
+        except (TypeError, ValueError):
+            errors.append((line_number, "invalid student_id, max_price or room_type"))
+            continue
+        requests.append(AllocationRequest(line_number, student_id, max_price, capacity))
+    return requests, errors
+
+class CapacityIndex:
+    """Free beds per room type, cheapest room first"""
+
+    def __init__(self, rooms):
+        # rooms: iterable of (room_id, capacity, price, free_beds)
+        self.buckets = {}
+        for room_id, capacity, price, free in sorted(rooms, key=lambda r: (r[2], r[0])):
+            if free > 0:
+                self.buckets.setdefault(capacity, deque()).append([price, room_id, free])
+
+    def take(self, max_price=None, capacity=None):
+        """Claim one bed in the cheapest matching room; returns (room_id, price) or None"""
+        if capacity is not None:
+            candidates = [self.buckets.get(capacity)]
+        else:
+            candidates = self.buckets.values()
+        best = None
+        for bucket in candidates:
+            if bucket and (max_price is None or bucket[0][0] <= max_price):
+                if best is None or bucket[0][0] < best[0][0]:
+                    best = bucket
+        if best is None:
+            return None
+        entry = best[0]
+        entry[2] -= 1
+        if entry[2] == 0:
+            best.popleft()
+        return entry[1], entry[0]
+
+def _existing_ids(session, column, ids, *conditions):
+    found = set()
+    ids = list(ids)
+    for start in range(0, len(ids), ID_CHUNK):
+        chunk = ids[start:start + ID_CHUNK]
+        found.update(session.execute(select(column).where(column.in_(chunk), *conditions)).scalars())
+    return found
+
+def load_index(session, check_in, check_out):
+    """Capacity index of beds free for the whole window"""
+    # Peak occupancy inside the window decides; the room counter covers every
+    # confirmed booking whatever its dates
+    return CapacityIndex((room_id, capacity, price, free) for room_id, _, price, capacity, free
+                         in free_beds_by_room(session, check_in, check_out))
+
+def allocate(session, requests, check_in, check_out, dry_run=False):
+    """Assign beds to requests; returns (assignments, rejections)
+
+    assignments are (student_id, room_id, price) and rejections are
+    (line_number, student_id, reason).
+    """
+    def run():
+        if session.get_bind().dialect.name == 'sqlite':
+            # Take the write lock before reading capacity so nothing changes underneath
+            session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+        student_ids = {request.student_id for request in requests}
+        known = _existing_ids(session, Student.id, student_ids)
+        booked = _existing_ids(session, Booking.student_id, student_ids, overlaps(check_in, check_out))
+        index = load_index(session, check_in, check_out)
+
+        assignments, rejections, seen = [], [], set()
+        ordered = sorted(requests, key=lambda r: (r.max_price is None, r.max_price or 0, r.line_number))
+        for request in ordered:
+            if request.student_id not in known:
+                rejections.append((request.line_number, request.student_id, "unknown student"))
+            elif request.student_id in booked or request.student_id in seen:
+                rejections.append((request.line_number, request.student_id, "already booked for this window"))
+            else:
+                bed = index.take(request.max_price, request.capacity)
+                if bed is None:
+                    rejections.append((request.line_number, request.student_id, "no matching room with a free bed"))
+                    continue
+                seen.add(request.student_id)
+                assignments.append((request.student_id, bed[0], bed[1]))
+
+        if assignments and not dry_run:
+            session.execute(insert(Booking), [
+                {'student_id': student_id, 'room_id': room_id, 'check_in_date': check_in,
+                 'check_out_date': check_out, 'status': 'confirmed'}
+                for student_id, room_id, _ in assignments
+            ])
+            refresh_rooms(session.connection(), {room_id for _, room_id, _ in assignments})
+        elif dry_run:
+            session.rollback()
+        rejections.sort()
+        return assignments, rejections
+
+    session.rollback()
+    return with_retry(session, run)
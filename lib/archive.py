@@ -0,0 +1,64 @@
+from datetime import date
+from sqlalchemy import select, func, and_, literal, Date
+from .models import Booking, Complaint, ArchivedBooking, ArchivedComplaint
+from . import audit
+
+# Moves finished records out of the live tables. Completed and cancelled
+# bookings that checked out before a date, and resolved complaints filed
+# before it, are copied into the *_archive tables and deleted from the live
+# ones in id-ordered chunks: one INSERT ... SELECT and one DELETE per chunk,
+# committed together, so an interrupted run loses nothing and resumes where
+# it stopped. Listings, availability checks and occupancy counters then
+# only scan live rows; reports opt into the archive with include_archive.
+# Archived bookings never hold beds, so room counters are unaffected. Each
+# moved row gets an 'archive' audit entry, written set-based with the chunk.
+# Live ids are AUTOINCREMENT, so an archived id is never handed out again.
+
+ARCHIVED_BOOKING_STATUSES = ('completed', 'cancelled')
+ARCHIVED_COMPLAINT_STATUSES = ('resolved',)
+CHUNK_SIZE = 5000
+
+bookings_table = Booking.__table__
+complaints_table = Complaint.__table__
+
+def booking_condition(before):
+    return and_(bookings_table.c.status.in_(ARCHIVED_BOOKING_STATUSES),
+                bookings_table.c.check_out_date < before)
+
+def complaint_condition(before):
+    return and_(complaints_table.c.status.in_(ARCHIVED_COMPLAINT_STATUSES),
+                complaints_table.c.date < before)
+
+def _count(session, table, condition):
+    return session.execute(select(func.count()).select_from(table).where(condition)).scalar()
+
+def pending(session, before):
+    """(bookings, complaints) that an archive run would move"""
+    return (_count(session, bookings_table, booking_condition(before)),
+            _count(session, complaints_table, complaint_condition(before)))
+
+def move_rows(session, source, target, condition, chunk_size=CHUNK_SIZE, today=None):
+    """Move rows matching condition from source to target; returns the count moved"""
+    columns = [column.name for column in source.columns]
+    archived = literal(today or date.today(), Date)
+    moved = 0
+    while True:
+        # Upper id of this chunk; None when fewer than chunk_size rows remain
+        boundary = session.execute(
+            select(source.c.id).where(condition).order_by(source.c.id).limit(1).offset(chunk_size - 1)
+        ).scalar()
+        chunk = condition if boundary is None else and_(condition, source.c.id <= boundary)
+        session.execute(target.insert().from_select(
+            columns + ['archived_date'], select(*source.columns, archived).where(chunk)))
+        audit.record_moved(session.connection(), source, chunk, target)
+        moved += session.execute(source.delete().where(chunk)).rowcount
+        session.commit()
+        if boundary is None:
+            return moved
+
+def archive(session, before, chunk_size=CHUNK_SIZE):
+    """Archive finished bookings and complaints older than before; returns (bookings, complaints)"""
+    bookings = move_rows(session, bookings_table, ArchivedBooking.__table__, booking_condition(before), chunk_size)
+    complaints = move_rows(session, complaints_table, ArchivedComplaint.__table__,
+                           complaint_condition(before), chunk_size)
+    return bookings, complaints
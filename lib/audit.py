@@ -0,0 +1,208 @@
+import getpass
+import json
+import sys
+import threading
+from datetime import datetime
+from sqlalchemy import event, select, insert, inspect, func, literal, case, cast, and_, or_, true, DateTime, Text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession, attributes
+from .models import Student, Room, Manager, Booking, Complaint, AuditEntry
+
+# Change history for students, rooms, managers, bookings and complaints.
+# Session listeners turn every ORM insert, update and delete, and every
+# UPDATE/DELETE/INSERT statement run through session.execute, into audit
+# entries; lib.occupancy adds the room counter changes it makes and
+# lib.archive the rows it moves to the archive tables. Set-based UPDATEs
+# and DELETEs write their entries with one INSERT ... SELECT over the rows
+# they match; the rest are buffered on the connection and written in
+# batches of BATCH_SIZE, the last just before the transaction commits, so
+# every entry commits (or rolls back) with the change it describes. Each
+# entry names the actor: the OS user and the command line, the menu
+# screen, or the API request.
+
+AUDITED = {model: model.__name__.lower() for model in (Student, Room, Manager, Booking, Complaint)}
+ENTITIES = tuple(AUDITED.values())
+TABLE_ENTITIES = {model.__tablename__: entity for model, entity in AUDITED.items()}
+BUFFER_KEY = 'audit_entries'
+BATCH_SIZE = 5000   # buffered entries written early in one INSERT
+
+audit_table = AuditEntry.__table__
+_context = threading.local()
+_user = None
+
+def os_user():
+    global _user
+    if _user is None:
+        try:
+            _user = getpass.getuser()
+        except Exception:
+            _user = 'unknown'
+    return _user
+
+def set_actor(source):
+    """Attribute this thread's following changes to source, e.g. 'menu: Bookings' (None restores the default)"""
+    _context.source = source
+
+def current_actor():
+    source = getattr(_context, 'source', None) or ' '.join(sys.argv[1:]) or 'python'
+    return f"{os_user()}: {source}"[:200]
+
+def _json(changes):
+    return json.dumps(changes, default=str, sort_keys=True)
+
+def record(connection, entity, entity_id, action, changes):
+    """Buffer one entry on the connection; written at commit or once BATCH_SIZE are waiting"""
+    entries = connection.info.setdefault(BUFFER_KEY, [])
+    entries.append({
+        'entity': entity, 'entity_id': entity_id, 'action': action, 'changes': _json(changes),
+        'actor': current_actor(), 'changed_at': datetime.now(),
+    })
+    if len(entries) >= BATCH_SIZE:
+        write_pending(connection)
+
+def _columns(obj):
+    return [column.key for column in inspect(obj).mapper.column_attrs]
+
+# ORM unit of work
+@event.listens_for(OrmSession, 'after_flush')
+def record_flush(session, flush_context):
+    # New ids are assigned and attribute history is still intact here
+    connection = None
+    for group, action in ((session.new, 'insert'), (session.dirty, 'update'), (session.deleted, 'delete')):
+        for obj in group:
+            entity = AUDITED.get(type(obj))
+            if entity is None:
+                continue
+            if action == 'update':
+                changes = {}
+                for key in _columns(obj):
+                    history = attributes.get_history(obj, key)
+                    if history.has_changes():
+                        changes[key] = [history.deleted[0] if history.deleted else None,
+                                        history.added[0] if history.added else None]
+                if not changes:
+                    continue
+            else:
+                # Loaded values only; reading an expired attribute would query mid-flush
+                state = attributes.instance_state(obj)
+                changes = {key: state.dict.get(key) for key in _columns(obj)}
+            connection = connection or session.connection()
+            record(connection, entity, obj.id, action, changes)
+
+# Statements run through session.execute (set-based updates, bulk inserts)
+@event.listens_for(OrmSession, 'do_orm_execute')
+def record_statement(state):
+    if not (state.is_update or state.is_delete or state.is_insert) or state.bind_mapper is None:
+        return None
+    entity = AUDITED.get(state.bind_mapper.class_)
+    if entity is None:
+        return None
+    connection = state.session.connection()
+    if state.is_insert:
+        return _record_insert(state, connection, entity)
+    # One INSERT ... SELECT writes the entries before the statement runs, so
+    # old and new values are read in SQL and nothing is held in memory
+    table = state.bind_mapper.local_table
+    statement = state.statement
+    if state.is_delete:
+        changes = _row_object(connection, table)
+        condition = statement.whereclause
+    else:
+        # SET columns with plain values, read through the public compiled
+        # parameters (keyed by column; WHERE parameters get a suffix).
+        # Columns set from SQL expressions such as `counter + 1` are not
+        # diffed; lib.occupancy records the counters it maintains itself
+        params = statement.compile(dialect=connection.dialect).params
+        fields = [(column.key, literal(params[column.key], column.type))
+                  for column in table.columns if column.key in params]
+        if not fields:
+            return None
+        changed = [(name, table.c[name].is_distinct_from(value), table.c[name], value) for name, value in fields]
+        changes = _json_object(connection, [
+            (name, case((differs, _json_array(connection, old, new)))) for name, differs, old, new in changed
+        ], drop_nulls=True)
+        condition = and_(statement.whereclause if statement.whereclause is not None else true(),
+                         or_(*(differs for _, differs, _, _ in changed)))
+    _insert_from(connection, entity, 'delete' if state.is_delete else 'update', table, changes, condition)
+    return state.invoke_statement()
+
+def _record_insert(state, connection, entity):
+    statement = state.statement
+    if statement.exported_columns or not state.parameters:
+        return None
+    params = state.parameters if isinstance(state.parameters, list) else [state.parameters]
+    # RETURNING hands back each new id with the values it was inserted with;
+    # leaving the order free lets SQLite keep multi-row VALUES batches
+    table = state.bind_mapper.local_table
+    names = sorted(set().union(*params) - {'id'})
+    frozen = state.invoke_statement(
+        statement=statement.returning(table.c.id, *(table.c[name] for name in names))).freeze()
+    for row in frozen():
+        record(connection, entity, row[0], 'insert', dict(zip(names, row[1:])))
+    return frozen()
+
+def _row_object(connection, table):
+    return _json_object(connection, [(column.key, column) for column in table.columns if column.key != 'id'])
+
+def _json_object(connection, pairs, drop_nulls=False):
+    """SQL JSON object of (key, expression) pairs; drop_nulls leaves out NULL members"""
+    args = [item for key, value in pairs for item in (literal(key), value)]
+    if connection.dialect.name == 'postgresql':
+        built = func.jsonb_build_object(*args)
+        return cast(func.jsonb_strip_nulls(built) if drop_nulls else built, Text)
+    built = func.json_object(*args)
+    # A merge patch drops members whose value is null
+    return func.json_patch('{}', built) if drop_nulls else built
+
+def _json_array(connection, *values):
+    return (func.jsonb_build_array if connection.dialect.name == 'postgresql' else func.json_array)(*values)
+
+def _insert_from(connection, entity, action, table, changes, condition):
+    # Buffered entries go first so ids keep the order changes were made in
+    write_pending(connection)
+    connection.execute(audit_table.insert().from_select(
+        ['changed_at', 'entity', 'entity_id', 'action', 'changes', 'actor'],
+        select(literal(datetime.now(), DateTime), literal(entity), table.c.id, literal(action),
+               changes, literal(current_actor()))
+        .select_from(table).where(condition)))
+
+# Core statements on the tables (archive moves, bulk loads), recorded set-based
+def record_inserted(connection, table, condition):
+    """One 'insert' entry per row of table matching condition, read from the row itself"""
+    _insert_from(connection, TABLE_ENTITIES[table.name], 'insert', table, _row_object(connection, table), condition)
+
+def record_moved(connection, table, condition, target):
+    """One 'archive' entry per row of table matching condition, moved to target"""
+    _insert_from(connection, TABLE_ENTITIES[table.name], 'archive', table,
+                 literal(_json({'archived_to': target.name})), condition)
+
+# Writing the buffer
+def write_pending(connection):
+    entries = connection.info.pop(BUFFER_KEY, None)
+    if entries:
+        # One cached INSERT run as executemany; a literal multi-row VALUES
+        # statement would be recompiled for every distinct row count
+        connection.execute(insert(audit_table), entries)
+
+@event.listens_for(OrmSession, 'before_commit')
+def flush_audit(session):
+    if not session.in_transaction():
+        return
+    # Flush first so the commit's own flush adds nothing after this point
+    session.flush()
+    write_pending(session.connection())
+
+@event.listens_for(Engine, 'rollback')
+def discard_audit(conn):
+    conn.info.pop(BUFFER_KEY, None)
+
+# Queries
+def history(session, entity, entity_id=None, limit=50):
+    """(id, changed_at, entity, entity_id, action, changes, actor) newest first"""
+    stmt = select(
+        AuditEntry.id, AuditEntry.changed_at, AuditEntry.entity, AuditEntry.entity_id,
+        AuditEntry.action, AuditEntry.changes, AuditEntry.actor,
+    ).where(AuditEntry.entity == entity)
+    if entity_id is not None:
+        stmt = stmt.where(AuditEntry.entity_id == entity_id)
+    return session.execute(stmt.order_by(AuditEntry.id.desc()).limit(limit)).all()
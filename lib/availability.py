@@ -0,0 +1,88 @@
+from collections import defaultdict
+from sqlalchemy import select, func, and_
+from .models import Room, Booking
+
+# Date-range availability. A booking holds a bed from check_in_date up to,
+# but not including, check_out_date, so back-to-back stays do not clash.
+# Overlap lookups go through ix_bookings_room_status_checkin.
+
+ACTIVE_STATUS = 'confirmed'
+
+def overlaps(start, end):
+    """Filter for active bookings that intersect [start, end)"""
+    return and_(
+        Booking.status == ACTIVE_STATUS,
+        Booking.check_in_date < end,
+        Booking.check_out_date > start,
+    )
+
+def peak_occupancy(intervals, start, end):
+    """Maximum number of simultaneous stays among intervals within [start, end)"""
+    events = []
+    for check_in, check_out in intervals:
+        events.append((max(check_in, start), 1))
+        events.append((min(check_out, end), -1))
+    # Departures sort before arrivals on the same day
+    events.sort()
+    peak = current = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+def free_beds(session, room_id, start, end):
+    """Beds free in a room for the whole of [start, end), or None if the room does not exist"""
+    capacity = session.execute(select(Room.capacity).where(Room.id == room_id)).scalar()
+    if capacity is None:
+        return None
+    stmt = select(Booking.check_in_date, Booking.check_out_date).where(
+        Booking.room_id == room_id, overlaps(start, end)
+    )
+    return max(capacity - peak_occupancy(session.execute(stmt).all(), start, end), 0)
+
+def rooms_with_free_beds(session, start, end, beds=1):
+    """(id, room_number, price, free_beds) for rooms with at least `beds` free in [start, end)"""
+    return [(room_id, number, price, free)
+            for room_id, number, price, _, free in free_beds_by_room(session, start, end, beds)]
+
+def free_beds_by_room(session, start, end, beds=1):
+    """(id, room_number, price, capacity, free_beds) for rooms with at least `beds` free in [start, end)
+
+    One aggregate query counts overlapping bookings per room. That count is an
+    upper bound on concurrent occupancy, so only rooms that fail the cheap test
+    have their intervals fetched and swept. This is a linear pass over the
+    rooms and the bookings overlapping the window, not an indexed lookup.
+    """
+    overlap_counts = (
+        select(Booking.room_id, func.count().label('overlapping'))
+        .where(overlaps(start, end))
+        .group_by(Booking.room_id)
+        .subquery()
+    )
+    overlapping = func.coalesce(overlap_counts.c.overlapping, 0)
+    stmt = (
+        select(Room.id, Room.room_number, Room.price, Room.capacity, overlapping)
+        .outerjoin(overlap_counts, overlap_counts.c.room_id == Room.id)
+        .where(Room.capacity >= beds)
+        .order_by(Room.id)
+    )
+    results, borderline = [], {}
+    for room_id, number, price, capacity, count in session.execute(stmt):
+        if capacity - count >= beds:
+            results.append((room_id, number, price, capacity, capacity - count))
+        else:
+            borderline[room_id] = (number, price, capacity)
+
+    if borderline:
+        intervals = defaultdict(list)
+        interval_stmt = select(Booking.room_id, Booking.check_in_date, Booking.check_out_date).where(
+            Booking.room_id.in_(borderline), overlaps(start, end)
+        )
+        for room_id, check_in, check_out in session.execute(interval_stmt):
+            intervals[room_id].append((check_in, check_out))
+        for room_id, (number, price, capacity) in borderline.items():
+            free = capacity - peak_occupancy(intervals[room_id], start, end)
+            if free >= beds:
+                results.append((room_id, number, price, capacity, free))
+        results.sort()
+    return results
@@ -0,0 +1,98 @@
+import random
+import time
+from sqlalchemy import select, update
+from sqlalchemy.exc import OperationalError
+from .models import Student, Room, Booking
+from .availability import free_beds
+from .occupancy import refresh_rooms
+
+# Booking allocation safe to run from several processes against one database.
+# The transaction takes the write lock first (BEGIN IMMEDIATE on SQLite, a
+# row lock on the room elsewhere), so concurrent terminals serialise before
+# the date-overlap check runs and cannot both claim the last bed. Whether a
+# bed is free is decided by free_beds for the requested dates; the room's
+# current_occupancy is a cached counter recomputed by lib.occupancy.
+
+MAX_RETRIES = 8
+BACKOFF_SECONDS = 0.05
+
+class BookingError(Exception):
+    """Raised when a booking cannot be created or cancelled"""
+
+def is_locked_error(error):
+    """True for SQLite busy/locked errors that are worth retrying"""
+    message = str(getattr(error, 'orig', error)).lower()
+    return 'database is locked' in message or 'database is busy' in message
+
+def with_retry(session, operation, retries=MAX_RETRIES, backoff=BACKOFF_SECONDS):
+    """Run operation() in its own transaction, retrying with backoff while the database is locked"""
+    for attempt in range(retries + 1):
+        try:
+            result = operation()
+            session.commit()
+            return result
+        except OperationalError as e:
+            session.rollback()
+            if attempt == retries or not is_locked_error(e):
+                raise
+            time.sleep(backoff * (2 ** attempt) * (1 + random.random()))
+        except Exception:
+            session.rollback()
+            raise
+
+def lock_room(session, room_id):
+    """Take the write lock for a booking on room_id; False if the room does not exist"""
+    stmt = select(Room.id).where(Room.id == room_id)
+    if session.get_bind().dialect.name == 'sqlite':
+        session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+    else:
+        stmt = stmt.with_for_update()
+    return session.execute(stmt).scalar() is not None
+
+def create_booking(session, student_id, room_id, check_in, check_out):
+    """Allocate a bed for a student and return the new Booking"""
+    if check_out <= check_in:
+        raise BookingError("Check-out date must be after check-in date!")
+
+    def allocate():
+        if not lock_room(session, room_id):
+            raise BookingError(f"Room with ID {room_id} not found!")
+        if session.execute(select(Student.id).where(Student.id == student_id)).scalar() is None:
+            raise BookingError(f"Student with ID {student_id} not found!")
+        if free_beds(session, room_id, check_in, check_out) < 1:
+            raise BookingError("Room is fully booked for those dates!")
+
+        booking = Booking(
+            student_id=student_id,
+            room_id=room_id,
+            check_in_date=check_in,
+            check_out_date=check_out,
+            status='confirmed'
+        )
+        session.add(booking)
+        session.flush()
+        return booking
+
+    # Start from a clean transaction so the lock is its first statement
+    session.rollback()
+    return with_retry(session, allocate)
+
+def cancel_booking(session, booking_id):
+    """Cancel a confirmed booking and release its bed"""
+    def release():
+        cancelled = session.execute(
+            update(Booking)
+            .where(Booking.id == booking_id, Booking.status == 'confirmed')
+            .values(status='cancelled')
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not cancelled:
+            status = session.execute(select(Booking.status).where(Booking.id == booking_id)).scalar()
+            if status is None:
+                raise BookingError(f"Booking with ID {booking_id} not found!")
+            raise BookingError(f"This booking is already {status}!")
+        room_id = session.execute(select(Booking.room_id).where(Booking.id == booking_id)).scalar()
+        refresh_rooms(session.connection(), [room_id])
+
+    session.rollback()
+    with_retry(session, release)
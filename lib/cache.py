@@ -0,0 +1,173 @@
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+from .config import load_settings
+from .models import Student, Room, Manager
+from . import availability, queries
+
+# Read-through cache for the lookups the interactive menu repeats on every
+# screen: id -> name/room-number labels, the student and manager pick-lists
+# and the available-room lists. Every SQL write records the table it touched
+# on its connection; when a session commits, the caches built from those
+# tables are dropped. Writes from other processes are only picked up once an
+# entry is older than the configured TTL.
+
+WRITTEN_KEY = 'cache_written_tables'
+WRITE_SQL = re.compile(r"\s*(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+ALL_TABLES = '*'
+
+_pending = threading.local()   # tables committed on this thread, not yet invalidated
+
+class LRUCache:
+    """Bounded mapping with least-recently-used eviction and hit/miss counters"""
+
+    def __init__(self, name, tables, maxsize=1024, ttl=30):
+        self.name = name
+        self.tables = set(tables)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()   # key -> (stored_at, value)
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()   # the API server shares caches across worker threads
+
+    def get(self, key):
+        """(True, value) for a fresh entry, else (False, None)"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and (not self.ttl or time.monotonic() - entry[0] < self.ttl):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'cache': self.name,
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+_settings = load_settings()
+CACHES = {
+    'student': LRUCache('student names', ['students'], _settings.cache_size, _settings.cache_ttl),
+    'room': LRUCache('room numbers', ['rooms'], _settings.cache_size, _settings.cache_ttl),
+    'manager': LRUCache('manager names', ['managers'], _settings.cache_size, _settings.cache_ttl),
+    # Booking writes change free beds, so the room lists depend on both tables
+    'lists': LRUCache('pick-lists', ['students', 'rooms', 'managers', 'bookings'], 32, _settings.cache_ttl),
+}
+LABELS = {
+    'student': (Student.id, Student.name),
+    'room': (Room.id, Room.room_number),
+    'manager': (Manager.id, Manager.name),
+}
+
+def cached(cache, key, load):
+    """Return the cached value for key, calling load() on a miss"""
+    found, value = cache.get(key)
+    if not found:
+        value = load()
+        cache.put(key, value)
+    return value
+
+def labels(session, kind, ids):
+    """{id: label} for students, rooms or managers; misses load in one query"""
+    cache = CACHES[kind]
+    result, missing = {}, []
+    for id in ids:
+        found, value = cache.get(id)
+        if found:
+            result[id] = value
+        else:
+            missing.append(id)
+    if missing:
+        id_column, label_column = LABELS[kind]
+        rows = session.execute(select(id_column, label_column).where(id_column.in_(missing))).all()
+        for id, label in rows:
+            cache.put(id, label)
+            result[id] = label
+    return result
+
+def label(session, kind, id):
+    """Name or room number for one id, or None if it does not exist"""
+    return labels(session, kind, [id]).get(id)
+
+def student_choices(session):
+    return cached(CACHES['lists'], 'students', lambda: queries.student_choices(session))
+
+def manager_choices(session):
+    return cached(CACHES['lists'], 'managers', lambda: queries.manager_choices(session))
+
+def available_room_choices(session):
+    return cached(CACHES['lists'], 'available', lambda: queries.available_room_choices(session))
+
+def rooms_with_free_beds(session, start, end, beds=1):
+    return cached(CACHES['lists'], ('free', start, end, beds),
+                  lambda: availability.rooms_with_free_beds(session, start, end, beds))
+
+def invalidate(tables=None):
+    """Drop caches built from any of tables (every cache when None)"""
+    for cache in CACHES.values():
+        if tables is None or ALL_TABLES in tables or cache.tables & tables:
+            cache.clear()
+
+def stats():
+    return [cache.stats() for cache in CACHES.values()]
+
+def report(stream=None):
+    """Print hit/miss counters for every cache"""
+    stream = stream or sys.stderr
+    for row in stats():
+        stream.write(f"[cache] {row['cache']}: {row['hits']} hits, {row['misses']} misses "
+                     f"({row['hit_rate']:.0%} hit rate), {row['entries']} entries\n")
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def record_write(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and (context.isinsert or context.isupdate or context.isdelete):
+        table = getattr(context.compiled.statement, 'table', None)
+        name = getattr(table, 'name', ALL_TABLES)
+    elif WRITE_SQL.match(statement):
+        name = ALL_TABLES
+    else:
+        return
+    conn.info.setdefault(WRITTEN_KEY, set()).add(name)
+
+@event.listens_for(Engine, 'rollback')
+def forget_writes(conn):
+    conn.info.pop(WRITTEN_KEY, None)
+
+@event.listens_for(Engine, 'commit')
+def collect_writes(conn):
+    # Fires just before the DBAPI commit; the caches are dropped by the
+    # session's after_commit, once the new rows are visible to other readers
+    written = conn.info.pop(WRITTEN_KEY, None)
+    if written:
+        _pending.__dict__.setdefault('tables', set()).update(written)
+
+@event.listens_for(OrmSession, 'after_commit')
+def invalidate_committed(session):
+    written = _pending.__dict__.pop('tables', None)
+    if written:
+        invalidate(written)
@@ -0,0 +1,35 @@
+import json
+import click
+from ..helpers import display_table
+from .output import json_option, echo_json
+
+ENTITIES = ('student', 'room', 'manager', 'booking', 'complaint')
+
+def describe(action, changes):
+    """One-line summary of an entry's changes"""
+    if action == 'update':
+        return ', '.join(f"{key}: {old} -> {new}" for key, (old, new) in changes.items())
+    return ', '.join(f"{key}={value}" for key, value in changes.items() if value is not None)
+
+@click.command()
+@click.option('--entity', required=True, type=click.Choice(ENTITIES), help="Record type")
+@click.option('--id', 'entity_id', type=int, help="Record ID (default: latest changes of any record)")
+@click.option('--limit', default=50, show_default=True, type=click.IntRange(1), help="Maximum entries")
+@json_option
+def audit(entity, entity_id, limit, as_json):
+    """Show the change history of a record, newest first"""
+    from ..models import session
+    from .. import audit as audit_log
+    rows = audit_log.history(session, entity, entity_id, limit)
+    if as_json:
+        keys = ('id', 'changed_at', 'entity', 'entity_id', 'action', 'changes', 'actor')
+        echo_json([dict(zip(keys, row[:5] + (json.loads(row[5]), row[6]))) for row in rows])
+        return
+    if not rows:
+        click.echo("No audit entries found!")
+        return
+    title = f"AUDIT LOG: {entity.upper()} {entity_id}" if entity_id is not None else f"AUDIT LOG: {entity.upper()}"
+    display_table(title, ["Entry", "When", "ID", "Action", "Changes", "By"],
+                  [(entry_id, changed_at.strftime('%Y-%m-%d %H:%M:%S'), ref_id, action,
+                    describe(action, json.loads(changes)), actor)
+                   for entry_id, changed_at, _, ref_id, action, changes, actor in rows])
@@ -0,0 +1,110 @@
+import csv
+import time
+import click
+from ..models import session
+from .. import services, queries
+from .output import json_option, echo_json, show_record, show_listing, handles_errors
+
+DATE = click.DateTime(["%Y-%m-%d"])
+
+# Booking commands
+@click.group()
+def booking():
+    """Manage bookings"""
+    pass
+
+@booking.command()
+@click.option('--student-id', required=True, type=int, help="Student to book")
+@click.option('--room-id', required=True, type=int, help="Room to book")
+@click.option('--check-in', required=True, type=DATE, help="Check-in date (YYYY-MM-DD)")
+@click.option('--check-out', required=True, type=DATE, help="Check-out date (YYYY-MM-DD)")
+@json_option
+@handles_errors
+def create(student_id, room_id, check_in, check_out, as_json):
+    """Create a booking"""
+    booking = services.create_booking(session, student_id, room_id, check_in.date(), check_out.date())
+    show_record(booking, as_json, message=f"Booking {booking['id']} created successfully!")
+
+@booking.command()
+@click.argument('booking_id', type=int)
+@json_option
+@handles_errors
+def cancel(booking_id, as_json):
+    """Cancel a confirmed booking"""
+    booking = services.cancel_booking(session, booking_id)
+    show_record(booking, as_json, message="Booking cancelled successfully!")
+
+@booking.command(name='list')
+@click.option('--page-size', type=click.IntRange(1), help="Show one page of this many bookings")
+@click.option('--after-id', type=int, help="Start after this booking ID")
+@json_option
+def list_bookings(page_size, after_id, as_json):
+    """List all bookings"""
+    show_listing(session, services.list_bookings, queries.booking_rows, page_size, after_id, as_json,
+                 "Bookings", ["ID", "Student", "Room", "Check-in", "Check-out", "Status"],
+                 "No bookings found!")
+
+@booking.command()
+@click.argument('booking_id', type=int)
+@json_option
+@handles_errors
+def view(booking_id, as_json):
+    """View booking details"""
+    booking = services.get_booking(session, booking_id)
+    show_record(booking, as_json, title=f"Booking Details (ID: {booking_id})")
+
+@click.command()
+@click.option('--check-in', required=True, type=DATE, help="Check-in date (YYYY-MM-DD)")
+@click.option('--check-out', required=True, type=DATE, help="Check-out date (YYYY-MM-DD)")
+@click.option('--beds', default=1, type=click.IntRange(1), help="Free beds needed")
+@json_option
+@handles_errors
+def available(check_in, check_out, beds, as_json):
+    """Find rooms with free beds between two dates"""
+    if as_json:
+        echo_json(services.available_rooms(session, check_in.date(), check_out.date(), beds))
+        return
+    from ..menu import print_available_rooms
+    print_available_rooms(check_in.date(), check_out.date(), beds)
+
+@click.command()
+@click.option('--requests', 'path', required=True, type=click.Path(exists=True, dir_okay=False),
+              help="CSV or JSONL file of student_id, max_price, room_type")
+@click.option('--check-in', required=True, type=DATE, help="Check-in date (YYYY-MM-DD)")
+@click.option('--check-out', required=True, type=DATE, help="Check-out date (YYYY-MM-DD)")
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'jsonl']), help="File format (default: from extension)")
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), help="Write assignments to this CSV file")
+@click.option('--dry-run', is_flag=True, help="Plan the allocation without writing bookings")
+@json_option
+def allocate(path, check_in, check_out, fmt, output, dry_run, as_json):
+    """Allocate beds for a file of booking requests"""
+    from .. import allocation
+    if check_out <= check_in:
+        raise click.BadParameter("must be after --check-in", param_hint="--check-out")
+        
+    started = time.perf_counter()
+    requests, errors = allocation.parse_requests(path, fmt)
+    assignments, rejections = allocation.allocate(session, requests, check_in.date(), check_out.date(), dry_run)
+    elapsed = time.perf_counter() - started
+    
+    if output:
+        with open(output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['student_id', 'room_id', 'price'])
+            writer.writerows(assignments)
+    if as_json:
+        echo_json({
+            'allocated': len(assignments),
+            'dry_run': dry_run,
+            'seconds': round(elapsed, 3),
+            'assignments': [{'student_id': s, 'room_id': r, 'price': p} for s, r, p in assignments],
+            'rejected': [{'line': line, 'error': message} for line, message in errors] +
+                        [{'line': line, 'student_id': s, 'error': reason} for line, s, reason in rejections],
+        })
+        return
+    for line_number, message in errors:
+        click.echo(f"Line {line_number}: {message}")
+    for line_number, student_id, reason in rejections:
+        click.echo(f"Line {line_number}: student {student_id} not placed ({reason})")
+    verb = "Would allocate" if dry_run else "Allocated"
+    click.echo(f"{verb} {len(assignments)} beds, {len(rejections) + len(errors)} requests not placed ({elapsed:.2f}s)")
@@ -0,0 +1,80 @@
+import click
+from ..models import session
+from .. import services, queries
+from ..reports import COMPLAINT_STATUSES
+from .output import json_option, show_record, show_rows, show_listing, handles_errors
+
+# Complaint commands
+@click.group()
+def complaint():
+    """Manage complaints"""
+    pass
+
+@complaint.command(name='file')
+@click.option('--student-id', required=True, type=int, help="Student filing the complaint")
+@click.option('--manager-id', type=int, help="Manager handling it (default: least-loaded manager)")
+@click.option('--title', required=True, help="Complaint title")
+@click.option('--description', default='', help="Complaint description")
+@json_option
+@handles_errors
+def file_complaint(student_id, manager_id, title, description, as_json):
+    """File a new complaint"""
+    complaint = services.file_complaint(session, student_id, manager_id, title, description)
+    show_record(complaint, as_json,
+                message=f"Complaint {complaint['id']} filed and assigned to manager {complaint['manager_id']}!")
+
+@complaint.command(name='list')
+@click.option('--page-size', type=click.IntRange(1), help="Show one page of this many complaints")
+@click.option('--after-id', type=int, help="Start after this complaint ID")
+@json_option
+def list_complaints(page_size, after_id, as_json):
+    """List all complaints"""
+    show_listing(session, services.list_complaints, queries.complaint_rows, page_size, after_id, as_json,
+                 "Complaints", ["ID", "Student", "Manager", "Title", "Status", "Date"],
+                 "No complaints found!")
+
+@complaint.command()
+@click.argument('complaint_id', type=int)
+@json_option
+@handles_errors
+def view(complaint_id, as_json):
+    """View complaint details"""
+    complaint = services.get_complaint(session, complaint_id)
+    show_record(complaint, as_json, title=f"Complaint Details (ID: {complaint_id})")
+
+@complaint.command()
+@click.argument('complaint_id', type=int)
+@click.argument('status', type=click.Choice(COMPLAINT_STATUSES))
+@json_option
+@handles_errors
+def status(complaint_id, status, as_json):
+    """Set a complaint's status"""
+    complaint = services.set_complaint_status(session, complaint_id, status)
+    show_record(complaint, as_json, message="Complaint status updated successfully!")
+
+@complaint.command(name='next')
+@click.option('--manager', 'manager_id', required=True, type=int, help="Manager whose queue to read")
+@click.option('--limit', default=1, type=click.IntRange(1), help="How many complaints to show")
+@click.option('--status', default='open', type=click.Choice(['open', 'in-progress']), help="Queue to read")
+@click.option('--claim', is_flag=True, help="Mark the oldest open complaint in-progress")
+@json_option
+@handles_errors
+def next_complaint(manager_id, limit, status, claim, as_json):
+    """Show a manager's oldest unresolved complaints"""
+    if claim:
+        claimed = services.claim_next_complaint(session, manager_id)
+        rows = [claimed] if claimed else []
+    else:
+        rows = services.next_complaints(session, manager_id, limit, status)
+    title = f"Claimed for manager {manager_id}" if claim else f"Manager {manager_id} queue ({status}, oldest first)"
+    show_rows(rows, as_json, title, ["ID", "Student ID", "Title", "Status", "Date"], "Queue is empty!")
+
+@complaint.command()
+@click.option('--manager', 'manager_id', type=int, help="Only this manager")
+@json_option
+@handles_errors
+def backlog(manager_id, as_json):
+    """Unresolved complaint counts per manager"""
+    rows = services.complaint_backlogs(session, manager_id)
+    show_rows(rows, as_json, "Complaint Backlogs", ["Manager ID", "Name", "Open", "In Progress"],
+              "No managers found!")
@@ -0,0 +1,80 @@
+import click
+import os
+from sqlalchemy import inspect
+from ..models import Base, get_engine, session, Student, Room, Manager
+from .. import search
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'alembic.ini')
+
+def run_alembic(action, connection=None):
+    """Run `alembic <action> head`, e.g. 'stamp' or 'upgrade', on connection's database"""
+    from alembic import command
+    from alembic.config import Config
+    config = Config(ALEMBIC_INI)
+    # Work on this connection's database instead of the configured one
+    config.attributes['connection'] = connection
+    getattr(command, action)(config, 'head')
+
+def create_schema(engine):
+    """Create tables, the search index and the Alembic stamp, as `initdb` does"""
+    tables = inspect(engine).get_table_names()
+    if 'alembic_version' in tables:
+        # Migrations bring an Alembic-managed database to head; create_all
+        # would add newer tables without their indexes, triggers or stamp
+        with engine.begin() as connection:
+            run_alembic('upgrade', connection)
+        return
+    if tables:
+        raise click.ClickException(
+            "Database has tables but no Alembic revision; stamp its revision with "
+            "`alembic stamp <revision>`, then run `alembic upgrade head`!")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        search.install(connection)
+        run_alembic('stamp', connection)
+
+@click.command()
+def menu():
+    """Start interactive menu"""
+    from ..menu import show_menu
+    show_menu()
+
+@click.command()
+@click.option('--host', help="Interface to bind (default: HOSTEL_SERVE_HOST or 127.0.0.1)")
+@click.option('--port', type=int, help="Port to listen on (default: HOSTEL_SERVE_PORT or 8080)")
+@click.option('--workers', type=click.IntRange(1), help="Concurrent database calls (default: the pool size)")
+def serve(host, port, workers):
+    """Run the local HTTP/JSON API server"""
+    from ..config import load_settings
+    from ..server import serve as run_server
+    settings = load_settings()
+    workers = workers or settings.serve_workers or settings.pool_size + settings.max_overflow
+    run_server(host or settings.serve_host, port or settings.serve_port, workers)
+
+# Initialize database command
+@click.command()
+def initdb():
+    """Initialize the database"""
+    create_schema(get_engine())
+    
+    # Add Kenyan sample data
+    if not session.query(Student).first():
+        kenyan_students = [
+            Student(name="Wanjiku Mwangi", email="wanjiku@student.ku.ac.ke", phone="0712345678"),
+            Student(name="Otieno Owino", email="owino@student.uonbi.ac.ke", phone="0723456789")
+        ]
+        
+        kenyan_rooms = [
+            Room(room_number="G12", capacity=4, price=15000),
+            Room(room_number="T7", capacity=2, price=25000)
+        ]
+        
+        kenyan_managers = [
+            Manager(name="Kamau Githinji", email="k.githinji@uonhostels.com", phone="0701234567"),
+            Manager(name="Nyambura Wairimu", email="n.wairimu@kuhostels.co.ke", phone="0712345678")
+        ]
+        
+        session.add_all(kenyan_students + kenyan_rooms + kenyan_managers)
+        session.commit()
+    
+    click.echo("Database initialized with Kenyan sample data!")
@@ -0,0 +1,14 @@
+import click
+from ..models import session
+from .. import exporter
+
+@click.command()
+@click.argument('entity', type=click.Choice(['students', 'rooms', 'bookings', 'complaints']))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'jsonl']), default='csv', help="Output format")
+@click.option('--output', '-o', type=click.File('w', encoding='utf-8', lazy=True), default='-', help="Output file (default: stdout)")
+@click.option('--batch-size', default=1000, type=click.IntRange(1), help="Rows fetched per database round-trip")
+def export(entity, fmt, output, batch_size):
+    """Export an entity to CSV or JSONL"""
+    count = exporter.export(session, entity, output, fmt, batch_size)
+    if output.name != '<stdout>':
+        click.echo(f"Exported {count} {entity} to {output.name}")
@@ -0,0 +1,101 @@
+import click
+from ..config import load_settings
+from ..helpers import display_table
+from .. import federation, reports
+from .output import json_option, echo_json
+
+# Federated commands: each query runs on every hostel database in parallel
+# and the per-hostel answers are merged into one table with a total row.
+
+def only_option(command):
+    return click.option('--only', 'names', multiple=True, metavar='NAME',
+                        help="Query only this hostel (repeatable)")(command)
+
+def run(fn, names):
+    """Fan fn out to the hostels; warn about shards that failed"""
+    results = federation.fan_out(fn, list(names) or None)
+    if not results:
+        raise click.ClickException("No hostels configured. Set HOSTEL_HOSTELS=name=url,...")
+    for result in results:
+        if result.error is not None:
+            click.echo(f"[{result.hostel}] unavailable: {result.error}", err=True)
+    return results
+
+def answered(results):
+    return [result for result in results if result.error is None]
+
+@click.group()
+def hostels():
+    """Queries across every hostel database"""
+    pass
+
+@hostels.command(name='list')
+@only_option
+@json_option
+def list_hostels(names, as_json):
+    """Configured hostels with their size and query time"""
+    results = run(federation.student_count, names)
+    settings = load_settings()
+    rows = [(result.hostel, federation.display_url(federation.hostel_url(settings, result.hostel)),
+             result.value if result.error is None else None, round(result.elapsed * 1000, 1))
+            for result in results]
+    if as_json:
+        echo_json([dict(zip(('hostel', 'database_url', 'students', 'ms'), row)) for row in rows])
+        return
+    display_table("HOSTELS", ["Hostel", "Database", "Students", "Query ms"], rows)
+
+@hostels.command()
+@only_option
+@json_option
+def occupancy(names, as_json):
+    """Occupancy of every hostel and overall"""
+    results = answered(run(federation.occupancy_summary, names))
+    rows = [(result.hostel, *result.value) for result in results]
+    overall = federation.total([result.value for result in results])
+    keys = ('hostel', 'rooms', 'capacity', 'occupied', 'full_rooms', 'available_rooms', 'occupancy_rate')
+    rows = [(*row, round(reports.occupancy_rate(row[2], row[3]), 1)) for row in rows]
+    if overall:
+        rows.append(('TOTAL', *overall, round(reports.occupancy_rate(overall[1], overall[2]), 1)))
+    if as_json:
+        echo_json([dict(zip(keys, row)) for row in rows])
+        return
+    display_table("OCCUPANCY BY HOSTEL",
+                  ["Hostel", "Rooms", "Capacity", "Occupied", "Full Rooms", "Available Rooms", "Occupancy %"],
+                  rows)
+
+@hostels.command()
+@only_option
+@json_option
+def finance(names, as_json):
+    """Financial summary of every hostel and overall"""
+    results = answered(run(federation.finance_summary, names))
+    rows = [(result.hostel, *result.value) for result in results]
+    overall = federation.total([result.value for result in results])
+    if overall:
+        rows.append(('TOTAL', *overall))
+    rows = [(*row, round(reports.occupancy_rate(row[2], row[3]), 1)) for row in rows]
+    if as_json:
+        keys = ('hostel', 'rooms', 'capacity', 'occupied', 'estimated_revenue', 'occupancy_rate')
+        echo_json([dict(zip(keys, row)) for row in rows])
+        return
+    display_table("FINANCES BY HOSTEL",
+                  ["Hostel", "Rooms", "Capacity", "Occupied", "Revenue (KES)", "Occupancy %"],
+                  rows)
+
+@hostels.command()
+@click.argument('query', nargs=-1, required=True)
+@click.option('--limit', default=20, type=click.IntRange(1), help="Maximum results per hostel")
+@only_option
+@json_option
+def students(query, limit, names, as_json):
+    """Find students by name or email in every hostel"""
+    results = run(federation.student_search(' '.join(query), limit), names)
+    rows = [(hostel, ref_id, title, snippet)
+            for hostel, kind, ref_id, title, snippet in federation.merged_rows(results)]
+    if as_json:
+        echo_json([dict(zip(('hostel', 'id', 'name', 'match'), row)) for row in rows])
+        return
+    if not rows:
+        click.echo("No matching students found!")
+        return
+    display_table(f"STUDENTS MATCHING '{' '.join(query)}'", ["Hostel", "ID", "Name", "Match"], rows)
@@ -0,0 +1,18 @@
+import click
+from ..menu import print_search_results
+from .output import json_option, echo_json
+
+@click.command()
+@click.argument('query', nargs=-1, required=True)
+@click.option('--kind', 'kinds', multiple=True, type=click.Choice(['student', 'room', 'complaint']), help="Restrict to a record type (repeatable)")
+@click.option('--limit', default=20, type=click.IntRange(1), help="Maximum results")
+@json_option
+def search(query, kinds, limit, as_json):
+    """Search students, rooms and complaints"""
+    if as_json:
+        from ..models import session
+        from .. import search as fts
+        rows = fts.search(session, ' '.join(query), kinds or None, limit)
+        echo_json([dict(zip(('kind', 'id', 'title', 'snippet'), row)) for row in rows])
+        return
+    print_search_results(' '.join(query), kinds or None, limit)
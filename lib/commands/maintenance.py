@@ -0,0 +1,105 @@
+import time
+from datetime import date
+import click
+from ..helpers import display_table
+from ..models import session
+from .. import occupancy, snapshots, lifecycle as booking_lifecycle, archive as archiver
+from .output import json_option, echo_json
+
+DRIFT_KEYS = ('id', 'room_number', 'stored_occupancy', 'actual_occupancy', 'stored_available', 'actual_available')
+
+@click.command()
+@click.option('--dry-run', is_flag=True, help="Report drift without fixing it")
+@json_option
+def reconcile(dry_run, as_json):
+    """Rebuild room occupancy counters from bookings"""
+    drift = occupancy.reconcile(session.connection(), dry_run)
+    session.commit()
+    if as_json:
+        echo_json({'dry_run': dry_run, 'drifted': [dict(zip(DRIFT_KEYS, row)) for row in drift]})
+        return
+    if not drift:
+        click.echo("All room counters are consistent!")
+        return
+        
+    data = [(room_id, number, stored, actual,
+             "Yes" if stored_available else "No", "Yes" if actual_available else "No")
+            for room_id, number, stored, actual, stored_available, actual_available in drift]
+    display_table("ROOM COUNTER DRIFT",
+                  ["ID", "Room No", "Stored Occupancy", "Actual", "Stored Available", "Actual Available"],
+                  data)
+    if dry_run:
+        click.echo(f"\n{len(drift)} rooms drifted (dry run, nothing changed)")
+    else:
+        click.echo(f"\nFixed {len(drift)} rooms")
+
+@click.command()
+@click.option('--until', type=click.DateTime(["%Y-%m-%d"]), help="Last day to capture (default: yesterday)")
+@click.option('--since', type=click.DateTime(["%Y-%m-%d"]), help="First day when nothing has been captured yet")
+@json_option
+def snapshot(until, since, as_json):
+    """Append daily occupancy and revenue snapshots for uncaptured days"""
+    started = time.perf_counter()
+    days, rows = snapshots.capture(session, until and until.date(), since and since.date())
+    elapsed = time.perf_counter() - started
+    if as_json:
+        echo_json({'days': days, 'room_rows': rows, 'last_captured_day': snapshots.last_captured_day(session),
+                   'seconds': round(elapsed, 3)})
+        return
+    if not days:
+        click.echo(f"Snapshots are up to date (last captured day {snapshots.last_captured_day(session)})!")
+        return
+    click.echo(f"Captured {days} days ({rows} room rows) in {elapsed:.2f}s")
+
+@click.command()
+@click.option('--before', required=True, type=click.DateTime(["%Y-%m-%d"]), help="Archive records older than this day")
+@click.option('--chunk-size', default=archiver.CHUNK_SIZE, show_default=True, type=click.IntRange(1), help="Rows moved per transaction")
+@click.option('--dry-run', is_flag=True, help="Count what would be archived without moving it")
+@json_option
+def archive(before, chunk_size, dry_run, as_json):
+    """Move old finished bookings and resolved complaints to the archive tables"""
+    before = before.date()
+    if dry_run:
+        bookings, complaints = archiver.pending(session, before)
+        if as_json:
+            echo_json({'before': before, 'dry_run': True, 'bookings': bookings, 'complaints': complaints})
+            return
+        click.echo(f"Would archive {bookings} bookings and {complaints} complaints (dry run, nothing changed)")
+        return
+    started = time.perf_counter()
+    bookings, complaints = archiver.archive(session, before, chunk_size)
+    elapsed = time.perf_counter() - started
+    if as_json:
+        echo_json({'before': before, 'dry_run': False, 'bookings': bookings, 'complaints': complaints,
+                   'seconds': round(elapsed, 3)})
+        return
+    if not bookings and not complaints:
+        click.echo(f"Nothing to archive before {before}!")
+        return
+    click.echo(f"Archived {bookings} bookings and {complaints} complaints in {elapsed:.2f}s")
+
+@click.group()
+def lifecycle():
+    """Booking lifecycle jobs"""
+    pass
+
+@lifecycle.command()
+@click.option('--as-of', type=click.DateTime(["%Y-%m-%d"]), help="Treat this day as today (default: today)")
+@click.option('--dry-run', is_flag=True, help="Count expired bookings without changing them")
+@json_option
+def run(as_of, dry_run, as_json):
+    """Complete bookings past their check-out day and free their beds"""
+    as_of = as_of.date() if as_of else None
+    started = time.perf_counter()
+    bookings, rooms = booking_lifecycle.expire_bookings(session, as_of, dry_run)
+    elapsed = time.perf_counter() - started
+    if as_json:
+        echo_json({'as_of': as_of or date.today(), 'dry_run': dry_run, 'bookings': bookings, 'rooms': rooms,
+                   'seconds': round(elapsed, 3)})
+        return
+    if not bookings:
+        click.echo("No expired bookings!")
+    elif dry_run:
+        click.echo(f"Would complete {bookings} bookings in {rooms} rooms (dry run, nothing changed)")
+    else:
+        click.echo(f"Completed {bookings} bookings and refreshed {rooms} rooms in {elapsed:.2f}s")
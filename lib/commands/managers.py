@@ -0,0 +1,60 @@
+import click
+from ..models import session
+from .. import services, queries
+from .output import json_option, show_record, show_listing, handles_errors
+
+# Manager commands
+@click.group()
+def manager():
+    """Manage hostel managers"""
+    pass
+
+@manager.command()
+@click.option('--name', required=True, help="Manager's full name")
+@click.option('--email', required=True, help="Manager's email")
+@click.option('--phone', required=True, help="Manager's phone number (07XXXXXXXX)")
+@json_option
+@handles_errors
+def add(name, email, phone, as_json):
+    """Add a new manager"""
+    manager = services.add_manager(session, name, email, phone)
+    show_record(manager, as_json, message=f"Manager {name} added successfully!")
+
+@manager.command(name='list')
+@click.option('--page-size', type=click.IntRange(1), help="Show one page of this many managers")
+@click.option('--after-id', type=int, help="Start after this manager ID")
+@json_option
+def list_managers(page_size, after_id, as_json):
+    """List all managers"""
+    show_listing(session, services.list_managers, queries.manager_rows, page_size, after_id, as_json,
+                 "Managers", ["ID", "Name", "Email", "Phone"], "No managers found!")
+
+@manager.command()
+@click.argument('manager_id', type=int)
+@json_option
+@handles_errors
+def view(manager_id, as_json):
+    """View manager details"""
+    manager = services.get_manager(session, manager_id)
+    show_record(manager, as_json, title=f"Manager Details (ID: {manager_id})")
+
+@manager.command()
+@click.argument('manager_id', type=int)
+@click.option('--name', help="New full name")
+@click.option('--email', help="New email")
+@click.option('--phone', help="New phone number")
+@json_option
+@handles_errors
+def update(manager_id, name, email, phone, as_json):
+    """Update a manager's details"""
+    manager = services.update_manager(session, manager_id, name, email, phone)
+    show_record(manager, as_json, message=f"Manager {manager['name']} updated successfully!")
+
+@manager.command()
+@click.argument('manager_id', type=int)
+@json_option
+@handles_errors
+def delete(manager_id, as_json):
+    """Delete a manager"""
+    manager = services.delete_manager(session, manager_id)
+    show_record(manager, as_json, message=f"Manager {manager['name']} deleted successfully!")
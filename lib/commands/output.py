@@ -0,0 +1,77 @@
+import functools
+import json
+from itertools import chain
+import click
+from ..helpers import display_table
+
+# Shared output for the non-interactive commands: a table or field list for
+# people, --json for scripts. ServiceError becomes a message (or a JSON
+# {"error": ...} object) and exit status 1. A listing without --page-size
+# streams to the terminal in keyset batches instead of loading every row.
+
+json_option = click.option('--json', 'as_json', is_flag=True, help="Print the result as JSON")
+
+def echo_json(data):
+    click.echo(json.dumps(data, default=str, indent=2))
+
+def show_record(record, as_json, title=None, message=None):
+    """Print one record as JSON, a success message, or its fields"""
+    if as_json:
+        echo_json(record)
+        return
+    if message:
+        click.echo(message)
+        return
+    if title:
+        click.echo(f"\n{title}")
+    for key, value in record.items():
+        if title and key == 'id':
+            continue
+        if isinstance(value, list):
+            if value:
+                click.echo(f"\n{key.replace('_', ' ').title()}:")
+                for item in value:
+                    click.echo("- " + ", ".join(str(v if v is not None else 'N/A') for v in item.values()))
+        else:
+            click.echo(f"{key.replace('_', ' ').title()}: {value}")
+
+def show_rows(rows, as_json, title, headers, empty, page_size=None):
+    """Print a listing as JSON or a table, with a hint for the next keyset page"""
+    if as_json:
+        echo_json(rows)
+        return
+    if not rows:
+        click.echo(empty)
+        return
+    display_table(title, headers, [tuple(row.values()) for row in rows])
+    if page_size and len(rows) == page_size:
+        click.echo(f"\nNext page: --after-id {rows[-1]['id']}")
+
+def show_listing(session, list_fn, rows_fn, page_size, after_id, as_json, title, headers, empty):
+    """Print one page via list_fn, or stream every row from rows_fn as a table"""
+    if page_size or as_json:
+        rows = list_fn(session, after_id=after_id, limit=page_size)
+        show_rows(rows, as_json, title, headers, empty, page_size)
+        return
+    from ..queries import iter_rows
+    rows = iter_rows(session, rows_fn, after_id)
+    first = next(rows, None)
+    if first is None:
+        click.echo(empty)
+        return
+    display_table(title, headers, chain([first], rows))
+
+def handles_errors(command):
+    """Turn ServiceError into a message and exit status 1"""
+    @functools.wraps(command)
+    def wrapper(*args, **kwargs):
+        from ..services import ServiceError
+        try:
+            return command(*args, **kwargs)
+        except ServiceError as e:
+            if kwargs.get('as_json'):
+                echo_json({'error': str(e)})
+            else:
+                click.echo(str(e))
+            raise click.exceptions.Exit(1)
+    return wrapper
@@ -0,0 +1,99 @@
+import click
+from ..menu import (print_occupancy_report, print_complaint_summary, print_booking_summary,
+                    print_finance_report, print_trend_report, print_room_trend)
+from .output import json_option, echo_json
+
+archive_option = click.option('--include-archive', is_flag=True, help="Count archived records too")
+
+# Report commands
+@click.group()
+def report():
+    """Occupancy, complaint and finance reports"""
+    pass
+
+@report.command()
+@json_option
+def occupancy(as_json):
+    """Room occupancy report"""
+    if as_json:
+        from ..models import session
+        from .. import reports
+        keys = ('room_number', 'capacity', 'occupied', 'occupancy_percent', 'price')
+        echo_json([dict(zip(keys, row)) for row in reports.occupancy_rows(session)])
+        return
+    print_occupancy_report()
+
+@report.command()
+@archive_option
+@json_option
+def complaints(include_archive, as_json):
+    """Complaint status summary"""
+    if as_json:
+        from ..models import session
+        from .. import reports
+        echo_json(reports.complaint_status_counts(session, include_archive))
+        return
+    print_complaint_summary(include_archive)
+
+@report.command()
+@archive_option
+@json_option
+def bookings(include_archive, as_json):
+    """Booking status summary"""
+    if as_json:
+        from ..models import session
+        from .. import reports
+        echo_json(reports.booking_status_counts(session, include_archive))
+        return
+    print_booking_summary(include_archive)
+
+@report.command()
+@json_option
+def finance(as_json):
+    """Financial summary"""
+    if as_json:
+        from ..models import session
+        from .. import reports
+        total_rooms, total_capacity, total_occupied, total_revenue = reports.finance_summary(session)
+        keys = ('room_number', 'capacity', 'occupied', 'price', 'revenue')
+        echo_json({
+            'total_rooms': total_rooms,
+            'total_capacity': total_capacity,
+            'total_occupied': total_occupied,
+            'occupancy_rate': round(reports.occupancy_rate(total_capacity, total_occupied), 1),
+            'estimated_revenue': total_revenue,
+            'rooms': [dict(zip(keys, row)) for row in reports.revenue_rows(session)],
+        })
+        return
+    print_finance_report()
+
+@report.command()
+@click.option('--from', 'start', type=click.DateTime(["%Y-%m-%d"]), help="First day (YYYY-MM-DD)")
+@click.option('--to', 'end', type=click.DateTime(["%Y-%m-%d"]), help="Last day (YYYY-MM-DD)")
+@json_option
+def trend(start, end, as_json):
+    """Month-over-month occupancy and revenue from snapshots"""
+    start, end = start and start.date(), end and end.date()
+    if as_json:
+        from ..models import session
+        from .. import snapshots
+        keys = ('month', 'days', 'avg_occupied', 'avg_capacity', 'avg_daily_revenue')
+        echo_json([dict(zip(keys, row)) for row in snapshots.monthly_trend(session, start, end)])
+        return
+    print_trend_report(start, end)
+
+@report.command(name='room-trend')
+@click.argument('room_id', type=int)
+@click.option('--from', 'start', type=click.DateTime(["%Y-%m-%d"]), help="First day (YYYY-MM-DD)")
+@click.option('--to', 'end', type=click.DateTime(["%Y-%m-%d"]), help="Last day (YYYY-MM-DD)")
+@json_option
+def room_trend(room_id, start, end, as_json):
+    """Monthly history of one room from snapshots"""
+    start, end = start and start.date(), end and end.date()
+    if as_json:
+        from ..models import session
+        from .. import snapshots
+        keys = ('month', 'occupied_days', 'bed_nights', 'peak_occupied', 'revenue_total')
+        echo_json([dict(zip(keys, row)) for row in snapshots.room_trend(session, room_id, start, end)])
+        return
+    print_room_trend(room_id, start, end)
@@ -0,0 +1,75 @@
+import click
+from ..models import session
+from .. import services, queries
+from .output import json_option, echo_json, show_record, show_listing, handles_errors
+
+# Room commands
+@click.group()
+def room():
+    """Manage rooms"""
+    pass
+
+@room.command()
+@click.option('--number', required=True, help="Room number")
+@click.option('--capacity', required=True, type=int, help="Number of beds")
+@click.option('--price', required=True, type=int, help="Price per semester (KES)")
+@json_option
+@handles_errors
+def add(number, capacity, price, as_json):
+    """Add a new room"""
+    room = services.add_room(session, number, capacity, price)
+    show_record(room, as_json, message=f"Room {number} added successfully!")
+
+@room.command(name='list')
+@click.option('--page-size', type=click.IntRange(1), help="Show one page of this many rooms")
+@click.option('--after-id', type=int, help="Start after this room ID")
+@json_option
+def list_rooms(page_size, after_id, as_json):
+    """List all rooms"""
+    show_listing(session, services.list_rooms, queries.room_rows, page_size, after_id, as_json,
+                 "Rooms", ["ID", "Room No", "Capacity", "Occupancy", "Price", "Available"],
+                 "No rooms found!")
+
+@room.command()
+@click.argument('room_id', type=int)
+@json_option
+@handles_errors
+def view(room_id, as_json):
+    """View room details"""
+    room = services.get_room(session, room_id)
+    if as_json:
+        echo_json(room)
+        return
+
+    click.echo(f"\nRoom Details (ID: {room['id']})")
+    click.echo(f"Room Number: {room['room_number']}")
+    click.echo(f"Capacity: {room['capacity']}")
+    click.echo(f"Current Occupancy: {room['current_occupancy']}")
+    click.echo(f"Price: KES {room['price']}")
+    click.echo(f"Available: {'Yes' if room['is_available'] else 'No'}")
+
+    if room['bookings']:
+        click.echo("\nBookings:")
+        for booking in room['bookings']:
+            click.echo(f"- Student: {booking['student_name'] or 'N/A'} ({booking['status']})")
+
+@room.command()
+@click.argument('room_id', type=int)
+@click.option('--number', help="New room number")
+@click.option('--capacity', type=int, help="New capacity")
+@click.option('--price', type=int, help="New price (KES)")
+@json_option
+@handles_errors
+def update(room_id, number, capacity, price, as_json):
+    """Update a room"""
+    room = services.update_room(session, room_id, number, capacity, price)
+    show_record(room, as_json, message=f"Room {room['room_number']} updated successfully!")
+
+@room.command()
+@click.argument('room_id', type=int)
+@json_option
+@handles_errors
+def delete(room_id, as_json):
+    """Delete a room"""
+    room = services.delete_room(session, room_id)
+    show_record(room, as_json, message=f"Room {room['room_number']} deleted successfully!")
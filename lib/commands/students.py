@@ -0,0 +1,94 @@
+import click
+import time
+from ..models import session
+from .. import importer, services, queries
+from .output import json_option, echo_json, show_record, show_listing, handles_errors
+
+# Student commands
+@click.group()
+def student():
+    """Manage students"""
+    pass
+
+@student.command()
+@click.option('--name', prompt=True, help="Student's full name")
+@click.option('--email', prompt=True, help="Student's email")
+@click.option('--phone', prompt=True, help="Student's phone number")
+@json_option
+@handles_errors
+def add(name, email, phone, as_json):
+    """Add a new student"""
+    student = services.add_student(session, name, email, phone)
+    show_record(student, as_json, message=f"Student {name} added successfully!")
+
+@student.command(name='import')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'jsonl']), help="File format (default: from extension)")
+@click.option('--chunk-size', default=5000, type=click.IntRange(1), help="Rows per INSERT batch")
+@json_option
+def import_students(path, fmt, chunk_size, as_json):
+    """Import students from a CSV or JSONL file"""
+    started = time.perf_counter()
+    imported, errors = importer.import_students(session, path, fmt, chunk_size)
+    elapsed = time.perf_counter() - started
+
+    if as_json:
+        echo_json({'imported': imported, 'seconds': round(elapsed, 3),
+                   'errors': [{'line': line_number, 'error': message} for line_number, message in errors]})
+        return
+    for line_number, message in errors:
+        click.echo(f"Line {line_number}: {message}")
+    rate = imported / elapsed if elapsed else imported
+    click.echo(f"Imported {imported} students, {len(errors)} rows rejected ({elapsed:.2f}s, {rate:.0f} rows/sec)")
+
+@student.command()
+@click.option('--page-size', type=click.IntRange(1), help="Show one page of this many students")
+@click.option('--after-id', type=int, help="Start after this student ID")
+@json_option
+def list(page_size, after_id, as_json):
+    """List all students"""
+    show_listing(session, services.list_students, queries.student_rows, page_size, after_id, as_json,
+                 "Students", ["ID", "Name", "Email", "Phone"], "No students found!")
+
+@student.command()
+@click.argument('student_id', type=int)
+@json_option
+@handles_errors
+def view(student_id, as_json):
+    """View student details"""
+    student = services.get_student(session, student_id)
+    if as_json:
+        echo_json(student)
+        return
+
+    click.echo(f"\nStudent Details (ID: {student['id']})")
+    click.echo(f"Name: {student['name']}")
+    click.echo(f"Email: {student['email']}")
+    click.echo(f"Phone: {student['phone']}")
+    click.echo(f"Registration Date: {student['registration_date']}")
+
+    if student['bookings']:
+        click.echo("\nBookings:")
+        for booking in student['bookings']:
+            click.echo(f"- Room {booking['room_number'] or 'N/A'} ({booking['status']})")
+
+@student.command()
+@click.argument('student_id', type=int)
+@click.option('--name', help="New full name")
+@click.option('--email', help="New email")
+@click.option('--phone', help="New phone number")
+@json_option
+@handles_errors
+def update(student_id, name, email, phone, as_json):
+    """Update a student's details"""
+    student = services.update_student(session, student_id, name, email, phone)
+    show_record(student, as_json, message=f"Student {student['name']} updated successfully!")
+
+@student.command()
+@click.argument('student_id', type=int)
+@json_option
+@handles_errors
+def delete(student_id, as_json):
+    """Delete a student"""
+    student = services.delete_student(session, student_id)
+    show_record(student, as_json, message=f"Student {student['name']} deleted successfully!")
@@ -0,0 +1,75 @@
+from sqlalchemy import select, update, func, case
+from .models import Manager, Complaint
+
+# Complaint work queues. Every lookup here is a LIMIT or grouped count that
+# ix_complaints_manager_status_date (manager_id, status, date) answers
+# directly: a manager's oldest open complaints are the first entries of
+# their (manager_id, 'open') index range, and backlogs count index entries.
+
+OPEN_STATUSES = ('open', 'in-progress')
+
+def next_complaints(session, manager_id, limit=1, status='open'):
+    """(id, student_id, title, status, date) for a manager's oldest complaints in a status"""
+    stmt = (
+        select(Complaint.id, Complaint.student_id, Complaint.title, Complaint.status, Complaint.date)
+        .where(Complaint.manager_id == manager_id, Complaint.status == status)
+        .order_by(Complaint.date, Complaint.id)
+        .limit(limit)
+    )
+    return session.execute(stmt).all()
+
+def claim_next(session, manager_id):
+    """Move a manager's oldest open complaint to in-progress; returns its queue row or None"""
+    for _ in range(3):
+        row = next(iter(next_complaints(session, manager_id)), None)
+        if row is None:
+            return None
+        # Conditional so two terminals never claim the same complaint
+        claimed = session.execute(
+            update(Complaint)
+            .where(Complaint.id == row.id, Complaint.status == 'open')
+            .values(status='in-progress')
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        session.commit()
+        if claimed:
+            return (row.id, row.student_id, row.title, 'in-progress', row.date)
+    return None
+
+def open_load():
+    """Subquery of (manager_id, open, in_progress) counts for unresolved complaints"""
+    return (
+        select(
+            Complaint.manager_id,
+            func.sum(case((Complaint.status == 'open', 1), else_=0)).label('open'),
+            func.sum(case((Complaint.status == 'in-progress', 1), else_=0)).label('in_progress'),
+        )
+        .where(Complaint.status.in_(OPEN_STATUSES))
+        .group_by(Complaint.manager_id)
+        .subquery()
+    )
+
+def backlog_counts(session, manager_id=None):
+    """(manager_id, name, open, in_progress) per manager, busiest first"""
+    load = open_load()
+    open_count = func.coalesce(load.c.open, 0)
+    in_progress = func.coalesce(load.c.in_progress, 0)
+    stmt = (
+        select(Manager.id, Manager.name, open_count, in_progress)
+        .outerjoin(load, load.c.manager_id == Manager.id)
+        .order_by((open_count + in_progress).desc(), Manager.id)
+    )
+    if manager_id is not None:
+        stmt = stmt.where(Manager.id == manager_id)
+    return session.execute(stmt).all()
+
+def least_loaded_manager(session):
+    """Id of the manager with the fewest unresolved complaints, or None without managers"""
+    load = open_load()
+    stmt = (
+        select(Manager.id)
+        .outerjoin(load, load.c.manager_id == Manager.id)
+        .order_by(func.coalesce(load.c.open, 0) + func.coalesce(load.c.in_progress, 0), Manager.id)
+        .limit(1)
+    )
+    return session.execute(stmt).scalar()
@@ -0,0 +1,151 @@
+import os
+from dataclasses import dataclass
+
+# Runtime configuration. Values come from HOSTEL_* environment variables,
+# falling back to a .env file in the working directory (or the file named
+# by HOSTEL_ENV_FILE), then to the defaults below.
+#
+# Each hostel block can have its own database. HOSTEL_HOSTELS lists them as
+# name=url pairs; selecting one (HOSTEL_HOSTEL or `--hostel NAME`) replaces
+# database_url, so every command and Alembic run targets that shard.
+
+ENV_FILE = '.env'
+
+@dataclass
+class Settings:
+    database_url: str = 'sqlite:///hostel.db'
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    echo: bool = False
+    sqlite_journal_mode: str = 'WAL'
+    sqlite_synchronous: str = 'NORMAL'
+    sqlite_cache_size: int = -64000        # negative means KiB, so 64 MB
+    sqlite_mmap_size: int = 268435456      # 256 MB
+    sqlite_busy_timeout: int = 5000        # milliseconds
+    profile: bool = False
+    profile_output: str = ''
+    profile_threshold: int = 10            # repeats of one statement flagged as N+1
+    cache_size: int = 1024                 # entries per lookup cache
+    cache_ttl: int = 30                    # seconds; bounds staleness from other processes
+    cache_stats: bool = False
+    serve_host: str = '127.0.0.1'
+    serve_port: int = 8080
+    serve_workers: int = 0                 # 0 means pool_size + max_overflow
+    table_format: str = 'grid'             # grid, plain or tsv
+    table_sample: int = 200                # rows sampled to size table columns
+    hostel: str = ''                       # selected hostel; empty means database_url
+    hostels: str = ''                      # name=url pairs, comma separated
+    federation_workers: int = 0            # 0 means one thread per hostel
+
+_selected_hostel = None
+
+def select_hostel(name):
+    """Point every later load_settings() call at one hostel's database"""
+    global _selected_hostel
+    _selected_hostel = name
+
+def hostel_urls(settings):
+    """{name: database_url} for the hostels listed in settings.hostels"""
+    urls = {}
+    for pair in settings.hostels.split(','):
+        name, _, url = pair.partition('=')
+        if name.strip() and url.strip():
+            urls[name.strip()] = url.strip()
+    return urls
+
+def hostel_url(settings, name):
+    """Database URL of one configured hostel"""
+    urls = hostel_urls(settings)
+    if name not in urls:
+        known = ', '.join(sorted(urls)) or 'none configured in HOSTEL_HOSTELS'
+        raise ValueError(f"Unknown hostel {name!r} (known: {known})")
+    return urls[name]
+
+def read_env_file(path):
+    """Parse KEY=VALUE lines from a dotenv-style file"""
+    values = {}
+    if not os.path.exists(path):
+        return values
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            key = key.strip()
+            if key.startswith('export '):
+                key = key[len('export '):].strip()
+            values[key] = value.strip().strip('"').strip("'")
+    return values
+
+def load_settings(environ=None):
+    """Build Settings from the environment and the .env file"""
+    environ = os.environ if environ is None else environ
+    values = read_env_file(environ.get('HOSTEL_ENV_FILE', ENV_FILE))
+    values.update((key, value) for key, value in environ.items() if key.startswith('HOSTEL_'))
+
+    settings = Settings()
+    for name, default in vars(Settings()).items():
+        raw = values.get(f"HOSTEL_{name.upper()}")
+        if raw is None:
+            continue
+        if isinstance(default, bool):
+            value = raw.lower() in ('1', 'true', 'yes', 'on')
+        elif isinstance(default, int):
+            value = int(raw)
+        else:
+            value = raw
+        setattr(settings, name, value)
+    if _selected_hostel:
+        settings.hostel = _selected_hostel
+    if settings.hostel:
+        settings.database_url = hostel_url(settings, settings.hostel)
+    return settings
+
+# SQLAlchemy is imported inside the helpers below so that reading settings
+# stays cheap for commands that never touch the database.
+
+def is_sqlite(url):
+    from sqlalchemy.engine import make_url
+    return make_url(url).get_backend_name() == 'sqlite'
+
+def is_file_database(url):
+    from sqlalchemy.engine import make_url
+    return make_url(url).database not in (None, '', ':memory:')
+
+def apply_sqlite_pragmas(engine, settings):
+    """Set performance and foreign-key pragmas on every new SQLite connection"""
+    from sqlalchemy import event
+    use_wal = is_file_database(str(engine.url))
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA busy_timeout = {int(settings.sqlite_busy_timeout)}")
+        if use_wal:
+            cursor.execute(f"PRAGMA journal_mode = {settings.sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA synchronous = {settings.sqlite_synchronous}")
+        cursor.execute(f"PRAGMA cache_size = {int(settings.sqlite_cache_size)}")
+        cursor.execute(f"PRAGMA mmap_size = {int(settings.sqlite_mmap_size)}")
+        # SQLite leaves foreign keys unenforced per connection; ON DELETE CASCADE needs them
+        cursor.execute("PRAGMA foreign_keys = ON")
+        cursor.close()
+
+def build_engine(settings=None, url=None):
+    """Create an engine for the configured database (SQLite or PostgreSQL)"""
+    from sqlalchemy import create_engine
+    settings = settings or load_settings()
+    url = url or settings.database_url
+    kwargs = {'echo': settings.echo}
+    if is_sqlite(url):
+        kwargs['connect_args'] = {'timeout': settings.sqlite_busy_timeout / 1000}
+        if is_file_database(url):
+            kwargs.update(pool_size=settings.pool_size, max_overflow=settings.max_overflow,
+                          pool_timeout=settings.pool_timeout)
+        engine = create_engine(url, **kwargs)
+        apply_sqlite_pragmas(engine, settings)
+    else:
+        engine = create_engine(url, pool_size=settings.pool_size, max_overflow=settings.max_overflow,
+                               pool_timeout=settings.pool_timeout, pool_pre_ping=True, **kwargs)
+    return engine
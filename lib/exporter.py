@@ -0,0 +1,86 @@
+import csv
+import json
+from datetime import date
+from sqlalchemy import select
+from .models import Student, Room, Manager, Booking, Complaint
+
+# Streaming export. Rows are pulled from the database in batches with
+# yield_per and written as they arrive, so memory use does not grow with
+# the size of the table.
+
+BATCH_SIZE = 1000
+
+def _student_export():
+    return select(
+        Student.id, Student.name, Student.email, Student.phone, Student.registration_date
+    ).order_by(Student.id)
+
+def _room_export():
+    return select(
+        Room.id, Room.room_number, Room.capacity, Room.current_occupancy, Room.price, Room.is_available
+    ).order_by(Room.id)
+
+def _booking_export():
+    return (
+        select(
+            Booking.id, Booking.student_id, Student.name.label('student_name'),
+            Booking.room_id, Room.room_number, Booking.booking_date,
+            Booking.check_in_date, Booking.check_out_date, Booking.status
+        )
+        .outerjoin(Student, Booking.student_id == Student.id)
+        .outerjoin(Room, Booking.room_id == Room.id)
+        .order_by(Booking.id)
+    )
+
+def _complaint_export():
+    return (
+        select(
+            Complaint.id, Complaint.student_id, Student.name.label('student_name'),
+            Complaint.manager_id, Manager.name.label('manager_name'),
+            Complaint.title, Complaint.description, Complaint.date, Complaint.status
+        )
+        .outerjoin(Student, Complaint.student_id == Student.id)
+        .outerjoin(Manager, Complaint.manager_id == Manager.id)
+        .order_by(Complaint.id)
+    )
+
+EXPORTS = {
+    'students': _student_export,
+    'rooms': _room_export,
+    'bookings': _booking_export,
+    'complaints': _complaint_export,
+}
+
+def stream_rows(session, entity, batch_size=BATCH_SIZE):
+    """Return (column_names, row_iterator) for an entity, fetched in batches"""
+    result = session.execute(EXPORTS[entity]().execution_options(yield_per=batch_size))
+    return list(result.keys()), iter(result)
+
+def _json_default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialise {type(value).__name__}")
+
+def write_csv(out, columns, rows):
+    writer = csv.writer(out)
+    writer.writerow(columns)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+def write_jsonl(out, columns, rows):
+    count = 0
+    for row in rows:
+        out.write(json.dumps(dict(zip(columns, row)), default=_json_default))
+        out.write('\n')
+        count += 1
+    return count
+
+WRITERS = {'csv': write_csv, 'jsonl': write_jsonl}
+
+def export(session, entity, out, fmt='csv', batch_size=BATCH_SIZE):
+    """Stream every row of an entity to a text file object; returns the row count"""
+    columns, rows = stream_rows(session, entity, batch_size)
+    return WRITERS[fmt](out, columns, rows)
@@ -0,0 +1,100 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import select, func, case
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+from .config import load_settings, build_engine, hostel_urls, hostel_url
+from .models import Room, Student
+from . import reports, search
+
+# Cross-hostel queries. Each hostel block has its own database (see
+# lib.config); `fan_out` runs one read-only function against every shard on
+# a thread pool and returns the per-hostel results in name order. SQLite and
+# the PostgreSQL driver release the GIL while a query runs, so threads
+# overlap the shards and a federated report takes about as long as the
+# slowest one. A shard that fails is reported with its error instead of
+# failing the whole report.
+
+_engines = {}
+_lock = threading.Lock()
+
+class ShardResult:
+    def __init__(self, hostel, value=None, error=None, elapsed=0.0):
+        self.hostel = hostel
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+def hostel_names(settings=None):
+    """Configured hostels, in name order"""
+    return sorted(hostel_urls(settings or load_settings()))
+
+def display_url(url):
+    """Database URL safe to print: any password is masked"""
+    return make_url(url).render_as_string(hide_password=True)
+
+def shard_engine(name, settings=None):
+    """Engine for one hostel, built once per process"""
+    with _lock:
+        engine = _engines.get(name)
+        if engine is None:
+            settings = settings or load_settings()
+            engine = _engines[name] = build_engine(settings, hostel_url(settings, name))
+        return engine
+
+def _run(name, fn, settings):
+    started = time.perf_counter()
+    session = None
+    try:
+        session = sessionmaker(bind=shard_engine(name, settings))()
+        return ShardResult(name, fn(session), elapsed=time.perf_counter() - started)
+    except Exception as e:
+        # First line of the message, or the exception type when it has none
+        error = next(iter(str(e).splitlines()), None) or type(e).__name__
+        return ShardResult(name, error=error, elapsed=time.perf_counter() - started)
+    finally:
+        if session is not None:
+            session.close()
+
+def fan_out(fn, names=None, workers=None):
+    """[ShardResult] of fn(session) on every hostel, run in parallel"""
+    settings = load_settings()
+    names = names or hostel_names(settings)
+    if not names:
+        return []
+    workers = workers or settings.federation_workers or len(names)
+    with ThreadPoolExecutor(max_workers=min(workers, len(names)), thread_name_prefix='hostel-shard') as pool:
+        return list(pool.map(lambda name: _run(name, fn, settings), names))
+
+# Per-shard queries
+def student_count(session):
+    return session.execute(select(func.count(Student.id))).scalar()
+
+def occupancy_summary(session):
+    """(rooms, capacity, occupied, full_rooms, available_rooms) in one aggregate"""
+    stmt = select(
+        func.count(Room.id),
+        func.coalesce(func.sum(Room.capacity), 0),
+        func.coalesce(func.sum(Room.current_occupancy), 0),
+        func.coalesce(func.sum(case((Room.current_occupancy >= Room.capacity, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Room.is_available == True, 1), else_=0)), 0),
+    )
+    return tuple(session.execute(stmt).one())
+
+def finance_summary(session):
+    return tuple(reports.finance_summary(session))
+
+def student_search(text, limit):
+    def query(session):
+        return [tuple(row) for row in search.search(session, text, ['student'], limit)]
+    return query
+
+# Merging
+def total(rows):
+    """Column-wise sum of equal-length numeric rows"""
+    return tuple(sum(column) for column in zip(*rows)) if rows else ()
+
+def merged_rows(results):
+    """(hostel, *row) for every row of every shard that answered"""
+    return [(result.hostel, *row) for result in results if result.error is None for row in result.value]
@@ -1,10 +1,91 @@
-from tabulate import tabulate
 import re
+import sys
+from itertools import chain, islice
 
-def display_table(title, headers, data):
-    """Display tabular data"""
-    print(f"\n{title}")
-    print(tabulate(data, headers=headers, tablefmt="grid"))
+# Streaming table output. Column widths come from the headers, optional
+# width hints and a sample of the first rows; the remaining rows are written
+# one line at a time as the iterable yields them, so a listing starts
+# printing at once and memory stays flat. Text wider than its column is cut
+# with an ellipsis; numbers are never cut. The 'tsv' format skips sizing.
+
+SAMPLE_ROWS = 200
+MAX_WIDTH = 60
+FORMATS = ('grid', 'plain', 'tsv')
+
+def _cell(value):
+    if value is None:
+        return ''
+    return str(value).replace('\n', ' ').replace('\t', ' ')
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _fit(text, width, right):
+    if len(text) > width and not right:
+        text = text[:width - 1] + '…'
+    return text.rjust(width) if right else text.ljust(width)
+
+def _table_settings():
+    from .config import load_settings
+    settings = load_settings()
+    return settings.table_format, settings.table_sample
+
+def stream_table(title, headers, rows, widths=None, fmt=None, sample_size=None, out=None):
+    """Write rows (any iterable) as a table while they are produced; returns the row count"""
+    if fmt is None or sample_size is None:
+        default_fmt, default_sample = _table_settings()
+        fmt, sample_size = fmt or default_fmt, sample_size or default_sample
+    out = out or sys.stdout
+    rows = iter(rows)
+    out.write(f"\n{title}\n")
+    if fmt == 'tsv':
+        out.write('\t'.join(headers) + '\n')
+        count = 0
+        for row in rows:
+            out.write('\t'.join(_cell(value) for value in row) + '\n')
+            count += 1
+        return count
+
+    sample = list(islice(rows, sample_size))
+    sizes = [len(header) for header in headers]
+    numeric = [True] * len(headers)
+    for row in sample:
+        for i, value in enumerate(row):
+            sizes[i] = max(sizes[i], len(_cell(value)))
+            if value is not None and not _is_number(value):
+                numeric[i] = False
+    if len(sample) == sample_size:
+        # More rows follow: leave numeric columns a digit to grow into
+        sizes = [size + 1 if number and sample else size for size, number in zip(sizes, numeric)]
+    if widths:
+        sizes = [max(size, hint or 0) for size, hint in zip(sizes, widths)]
+    sizes = [min(size, MAX_WIDTH) for size in sizes]
+
+    if fmt == 'grid':
+        rule = '+' + '+'.join('-' * (size + 2) for size in sizes) + '+\n'
+        header_rule = rule.replace('-', '=')
+        def line(cells, right):
+            return '| ' + ' | '.join(_fit(cell, size, r) for cell, size, r in zip(cells, sizes, right)) + ' |\n'
+        out.write(rule)
+        out.write(line(headers, [False] * len(headers)))
+        out.write(header_rule)
+    else:
+        rule = ''
+        def line(cells, right):
+            return '  '.join(_fit(cell, size, r) for cell, size, r in zip(cells, sizes, right)).rstrip() + '\n'
+        out.write(line(headers, [False] * len(headers)))
+        out.write('  '.join('-' * size for size in sizes) + '\n')
+
+    count = 0
+    for row in chain(sample, rows):
+        out.write(line([_cell(value) for value in row], numeric))
+        out.write(rule)
+        count += 1
+    return count
+
+def display_table(title, headers, data, widths=None):
+    """Display tabular data; data may be a list or a generator of rows"""
+    return stream_table(title, headers, data, widths)
 
 def validate_email(email):
     """Validate email including Kenyan domains"""
@@ -14,4 +95,4 @@ def validate_email(email):
 def validate_phone(phone):
     """Validate Kenyan phone numbers (07XXXXXXXX)"""
     pattern = r'^(07\d{8})$'
-    return re.match(pattern, phone) is not None
\ No newline at end of file
+    return re.match(pattern, phone) is not None
@@ -0,0 +1,106 @@
+import csv
+import json
+from datetime import datetime
+from sqlalchemy import select, insert, func
+from .models import Student
+from .helpers import validate_email, validate_phone
+from . import search, audit
+
+# Bulk student import. Rows are streamed from the file, validated in chunks
+# and written with one executemany INSERT per chunk. Duplicate emails are
+# detected against a single pre-fetched set instead of a query per row. On
+# SQLite each chunk's search index and audit entries are then written with
+# one INSERT ... SELECT each instead of a trigger and an entry per row.
+
+CHUNK_SIZE = 5000
+students_table = Student.__table__
+FIELDS = ('name', 'email', 'phone')
+
+def read_rows(path, fmt=None):
+    """Yield (line_number, dict) pairs from a CSV or JSONL file"""
+    fmt = fmt or ('jsonl' if path.endswith(('.jsonl', '.json')) else 'csv')
+    with open(path, newline='', encoding='utf-8') as f:
+        if fmt == 'jsonl':
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except ValueError as e:
+                    yield line_number, {'_error': f"invalid JSON: {e}"}
+        else:
+            # Header is line 1, so data starts at line 2
+            for line_number, row in enumerate(csv.DictReader(f), start=2):
+                yield line_number, row
+
+def validate_chunk(chunk, known_emails):
+    """Split a chunk into insertable mappings and (line_number, error) pairs"""
+    valid, errors = [], []
+    for line_number, row in chunk:
+        if not isinstance(row, dict):
+            errors.append((line_number, "row is not an object"))
+            continue
+        if '_error' in row:
+            errors.append((line_number, row['_error']))
+            continue
+        values = [row.get(field) or '' for field in FIELDS]
+        # JSONL can carry numbers or objects; only text is a valid field
+        wrong = next((field for field, value in zip(FIELDS, values) if not isinstance(value, str)), None)
+        if wrong:
+            errors.append((line_number, f"{wrong} is not text"))
+            continue
+        name, email, phone = (value.strip() for value in values)
+        if not name:
+            errors.append((line_number, "missing name"))
+        elif not validate_email(email):
+            errors.append((line_number, f"invalid email '{email}'"))
+        elif not validate_phone(phone):
+            errors.append((line_number, f"invalid phone '{phone}'"))
+        elif email.lower() in known_emails:
+            errors.append((line_number, f"duplicate email '{email}'"))
+        else:
+            known_emails.add(email.lower())
+            valid.append({'name': name, 'email': email, 'phone': phone})
+    return valid, errors
+
+def insert_locked(session, rows):
+    """SQLite: one executemany, then the search and audit entries set-based"""
+    connection = session.connection()
+    # Under the write lock every row above the current highest id is ours
+    connection.exec_driver_sql("BEGIN IMMEDIATE")
+    last_id = connection.execute(select(func.coalesce(func.max(Student.id), 0))).scalar()
+    with search.bulk_insert(connection, 'student', last_id):
+        connection.execute(insert(students_table), rows)
+    audit.record_inserted(connection, students_table, students_table.c.id > last_id)
+
+def import_students(session, path, fmt=None, chunk_size=CHUNK_SIZE):
+    """Import students from a file; returns (imported_count, errors)"""
+    known_emails = {email.lower() for email in session.execute(select(Student.email)).scalars() if email}
+    registered = datetime.now().date()
+    imported, errors, chunk = 0, [], []
+
+    def flush(chunk):
+        valid, chunk_errors = validate_chunk(chunk, known_emails)
+        errors.extend(chunk_errors)
+        if valid:
+            for mapping in valid:
+                mapping['registration_date'] = registered
+            if session.get_bind().dialect.name == 'sqlite':
+                insert_locked(session, valid)
+            else:
+                session.execute(insert(Student), valid)
+            session.commit()
+        return len(valid)
+
+    try:
+        for item in read_rows(path, fmt):
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                imported += flush(chunk)
+                chunk = []
+        if chunk:
+            imported += flush(chunk)
+    except Exception:
+        session.rollback()
+        raise
+    return imported, errors
@@ -0,0 +1,41 @@
+from datetime import date
+from sqlalchemy import select, update, func
+from .models import Booking
+from .bookings import with_retry
+from .occupancy import ACTIVE_STATUS, refresh_rooms
+
+# Booking lifecycle. A confirmed booking whose check-out day has come is
+# over: `expire_bookings` marks every such booking completed with one
+# set-based UPDATE and recomputes the counters of just the rooms it
+# touched, all in one transaction, so a run either lands completely or not
+# at all. Running it again finds nothing to do, which makes it safe to
+# schedule from cron; lock contention is retried like any other write.
+
+COMPLETED_STATUS = 'completed'
+
+def expired(as_of):
+    """Condition matching confirmed bookings whose check-out day is on or before as_of"""
+    return (Booking.status == ACTIVE_STATUS) & (Booking.check_out_date <= as_of)
+
+def expire_bookings(session, as_of=None, dry_run=False):
+    """Complete expired bookings and refresh their rooms; returns (bookings, rooms)"""
+    as_of = as_of or date.today()
+    if dry_run:
+        return session.execute(
+            select(func.count(), func.count(Booking.room_id.distinct())).where(expired(as_of))).one()
+
+    def run():
+        if session.get_bind().dialect.name == 'sqlite':
+            # Take the write lock first so no booking changes between the two statements
+            session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+        room_ids = set(session.execute(select(Booking.room_id.distinct()).where(expired(as_of))).scalars())
+        completed = session.execute(
+            update(Booking).where(expired(as_of)).values(status=COMPLETED_STATUS)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        room_ids.discard(None)
+        refresh_rooms(session.connection(), room_ids)
+        return completed, len(room_ids)
+
+    session.rollback()
+    return with_retry(session, run)
@@ -1,13 +1,68 @@
 import click
 from datetime import datetime
-from .models import session, Student, Room, Manager, Booking, Complaint
+from functools import partial
+from itertools import chain
+from .models import Session, session, Student, Room, Manager, Booking, Complaint
 from .helpers import display_table, validate_email, validate_phone
+from . import queries, reports, profiling, search, cache, snapshots, complaints, audit
+from .bookings import BookingError, create_booking, cancel_booking
 
 def clear_screen():
     click.clear()
 
+def next_action(screen):
+    """Start a new menu action: fresh session and a new profiling window"""
+    Session.remove()
+    profiling.checkpoint(screen)
+    audit.set_actor(f"menu: {screen}")
+
+def format_room_row(row):
+    r_id, number, capacity, occupancy, price, is_available = row
+    return (r_id, number, capacity, occupancy, f"KES {price}", "Yes" if is_available else "No")
+
+def format_booking_row(row):
+    b_id, student_name, room_number, check_in, check_out, status = row
+    return (b_id, student_name or "N/A", room_number or "N/A", check_in, check_out, status)
+
+def format_complaint_row(row):
+    c_id, student_name, manager_name, title, status, date = row
+    return (c_id, student_name or "N/A", manager_name or "N/A", title, status, date)
+
+def browse(title, headers, fetch, format_row=tuple, page_size=queries.PAGE_SIZE):
+    """Page through a listing one keyset page at a time; returns False if it is empty
+
+    fetch is called with after_id/before_id/limit and must return rows whose
+    first column is the id.
+    """
+    rows = fetch(limit=page_size)
+    if not rows:
+        return False
+    while True:
+        Session.remove()
+        clear_screen()
+        display_table(title, headers, [format_row(row) for row in rows])
+        click.echo(f"\nShowing IDs {rows[0][0]} to {rows[-1][0]}")
+        action = click.prompt("[n]ext, [p]revious, [j]ump to ID, [q]uit",
+                              type=click.Choice(['n', 'p', 'j', 'q']), show_choices=False,
+                              default='n' if len(rows) == page_size else 'q')
+        if action == 'q':
+            return True
+        if action == 'n':
+            page = fetch(after_id=rows[-1][0], limit=page_size)
+        elif action == 'p':
+            page = fetch(before_id=rows[0][0], limit=page_size)
+        else:
+            target = click.prompt("Jump to ID", type=int)
+            page = fetch(after_id=target - 1, limit=page_size)
+        if page:
+            rows = page
+        else:
+            click.echo("No more records in that direction!")
+            click.pause()
+
 def show_menu():
     while True:
+        next_action("main")
         clear_screen()
         click.echo("╔══════════════════════════════╗")
         click.echo("║  TACHBEL HOSTEL MANAGEMENT    ║")
@@ -18,10 +73,12 @@ def show_menu():
         click.echo("║ 4. Complaint Management      ║")
         click.echo("║ 5. Manager Management        ║")
         click.echo("║ 6. View Reports              ║")
+        click.echo("║ 7. Search                    ║")
         click.echo("║ 0. Exit                      ║")
         click.echo("╚══════════════════════════════╝")
         
-        choice = click.prompt("Enter your choice", type=click.IntRange(0, 6))
+        choice = click.prompt("Enter your choice", type=click.IntRange(0, 7))
+        profiling.label(f"main #{choice}")
         
         if choice == 0:
             break
@@ -37,9 +94,23 @@ def show_menu():
             manage_managers()
         elif choice == 6:
             view_reports()
+        elif choice == 7:
+            clear_screen()
+            query = click.prompt("Search students, rooms and complaints")
+            print_search_results(query)
+            click.pause()
+
+def print_search_results(query, kinds=None, limit=20):
+    """Print full-text search matches for a query"""
+    results = search.search(session, query, kinds, limit)
+    if results:
+        display_table(f"SEARCH RESULTS FOR '{query}'", ["Type", "ID", "Name/Title", "Match"], results)
+    else:
+        click.echo(f"No matches for '{query}'!")
 
 def manage_students():
     while True:
+        next_action("students")
         clear_screen()
         click.echo("╔══════════════════════════════╗")
         click.echo("║      STUDENT MANAGEMENT      ║")
@@ -53,6 +124,7 @@ def manage_students():
         click.echo("╚══════════════════════════════╝")
         
         choice = click.prompt("Enter your choice", type=click.IntRange(0, 5))
+        profiling.label(f"students #{choice}")
         
         if choice == 0:
             break
@@ -83,13 +155,10 @@ def manage_students():
             
         elif choice == 2:
             clear_screen()
-            students = session.query(Student).all()
-            if students:
-                data = [(s.id, s.name, s.email, s.phone) for s in students]
-                display_table("ALL STUDENTS", ["ID", "Name", "Email", "Phone"], data)
-            else:
+            if not browse("ALL STUDENTS", ["ID", "Name", "Email", "Phone"],
+                          partial(queries.student_rows, session)):
                 click.echo("No students found!")
-            click.pause()
+                click.pause()
             
         elif choice == 3:
             clear_screen()
@@ -102,11 +171,11 @@ def manage_students():
                 click.echo(f"Phone: {student.phone}")
                 click.echo(f"Registration Date: {student.registration_date}")
                 
-                if student.bookings:
+                bookings = queries.student_bookings(session, student.id)
+                if bookings:
                     click.echo("\nCurrent Bookings:")
-                    for booking in student.bookings:
-                        room = session.query(Room).get(booking.room_id)
-                        click.echo(f"- Room {room.room_number if room else 'N/A'} ({booking.status})")
+                    for room_number, status in bookings:
+                        click.echo(f"- Room {room_number or 'N/A'} ({status})")
             else:
                 click.echo(f"Student with ID {student_id} not found!")
             click.pause()
@@ -158,6 +227,7 @@ def manage_students():
 
 def manage_rooms():
     while True:
+        next_action("rooms")
         clear_screen()
         click.echo("╔══════════════════════════════╗")
         click.echo("║       ROOM MANAGEMENT        ║")
@@ -171,6 +241,7 @@ def manage_rooms():
         click.echo("╚══════════════════════════════╝")
         
         choice = click.prompt("Enter your choice", type=click.IntRange(0, 5))
+        profiling.label(f"rooms #{choice}")
         
         if choice == 0:
             break
@@ -196,15 +267,10 @@ def manage_rooms():
             
         elif choice == 2:
             clear_screen()
-            rooms = session.query(Room).all()
-            if rooms:
-                data = [(r.id, r.room_number, r.capacity, r.current_occupancy, 
-                        f"KES {r.price}", "Yes" if r.is_available else "No") 
-                       for r in rooms]
-                display_table("ALL ROOMS", ["ID", "Room No", "Capacity", "Occupancy", "Price", "Available"], data)
-            else:
+            if not browse("ALL ROOMS", ["ID", "Room No", "Capacity", "Occupancy", "Price", "Available"],
+                          partial(queries.room_rows, session), format_room_row):
                 click.echo("No rooms found!")
-            click.pause()
+                click.pause()
             
         elif choice == 3:
             clear_screen()
@@ -218,11 +284,11 @@ def manage_rooms():
                 click.echo(f"Price: KES {room.price}")
                 click.echo(f"Available: {'Yes' if room.is_available else 'No'}")
                 
-                if room.bookings:
+                bookings = queries.room_bookings(session, room.id)
+                if bookings:
                     click.echo("\nCurrent Bookings:")
-                    for booking in room.bookings:
-                        student = session.query(Student).get(booking.student_id)
-                        click.echo(f"- Student: {student.name if student else 'N/A'} ({booking.status})")
+                    for student_name, status in bookings:
+                        click.echo(f"- Student: {student_name or 'N/A'} ({status})")
             else:
                 click.echo(f"Room with ID {room_id} not found!")
             click.pause()
@@ -270,6 +336,7 @@ def manage_rooms():
 
 def manage_bookings():
     while True:
+        next_action("bookings")
         clear_screen()
         click.echo("╔══════════════════════════════╗")
         click.echo("║      BOOKING MANAGEMENT      ║")
@@ -277,10 +344,12 @@ def manage_bookings():
         click.echo("║ 1. Create New Booking       ║")
         click.echo("║ 2. View All Bookings        ║")
         click.echo("║ 3. Cancel Booking           ║")
+        click.echo("║ 4. Find Available Rooms     ║")
         click.echo("║ 0. Back to Main Menu        ║")
         click.echo("╚══════════════════════════════╝")
         
-        choice = click.prompt("Enter your choice", type=click.IntRange(0, 3))
+        choice = click.prompt("Enter your choice", type=click.IntRange(0, 4))
+        profiling.label(f"bookings #{choice}")
         
         if choice == 0:
             break
@@ -291,23 +360,22 @@ def manage_bookings():
             click.echo("╚══════════════════════════════╝")
             
             # List students
-            students = session.query(Student).all()
+            students = cache.student_choices(session)
             if not students:
                 click.echo("No students available!")
                 click.pause()
                 continue
                 
-            display_table("STUDENTS", ["ID", "Name"], [(s.id, s.name) for s in students])
+            display_table("STUDENTS", ["ID", "Name"], students)
             
             # List available rooms
-            rooms = session.query(Room).filter(Room.is_available == True).all()
+            rooms = cache.available_room_choices(session)
             if not rooms:
                 click.echo("No available rooms!")
                 click.pause()
                 continue
                 
-            display_table("AVAILABLE ROOMS", ["ID", "Room No", "Price (KES)"], 
-                         [(r.id, r.room_number, r.price) for r in rooms])
+            display_table("AVAILABLE ROOMS", ["ID", "Room No", "Price (KES)"], rooms)
             
             student_id = click.prompt("Enter Student ID", type=int)
             room_id = click.prompt("Enter Room ID", type=int)
@@ -315,22 +383,13 @@ def manage_bookings():
             check_out = click.prompt("Check-out date (YYYY-MM-DD)")
             
             try:
-                booking = Booking(
-                    student_id=student_id,
-                    room_id=room_id,
-                    check_in_date=datetime.strptime(check_in, "%Y-%m-%d").date(),
-                    check_out_date=datetime.strptime(check_out, "%Y-%m-%d").date(),
-                    status='confirmed'
-                )
-                
-                room = session.query(Room).get(room_id)
-                room.current_occupancy += 1
-                if room.current_occupancy >= room.capacity:
-                    room.is_available = False
-                
-                session.add(booking)
-                session.commit()
-                click.echo("Booking created successfully!")
+                check_in_date = datetime.strptime(check_in, "%Y-%m-%d").date()
+                check_out_date = datetime.strptime(check_out, "%Y-%m-%d").date()
+                create_booking(session, student_id, room_id, check_in_date, check_out_date)
+                click.echo(f"Booking created for {cache.label(session, 'student', student_id)} "
+                           f"in room {cache.label(session, 'room', room_id)}!")
+            except BookingError as e:
+                click.echo(str(e))
             except Exception as e:
                 session.rollback()
                 click.echo(f"Error creating booking: {str(e)}")
@@ -339,26 +398,10 @@ def manage_bookings():
             
         elif choice == 2:
             clear_screen()
-            bookings = session.query(Booking).all()
-            if bookings:
-                data = []
-                for booking in bookings:
-                    student = session.query(Student).get(booking.student_id)
-                    room = session.query(Room).get(booking.room_id)
-                    data.append((
-                        booking.id,
-                        student.name if student else "N/A",
-                        room.room_number if room else "N/A",
-                        booking.check_in_date,
-                        booking.check_out_date,
-                        booking.status
-                    ))
-                display_table("ALL BOOKINGS", 
-                             ["ID", "Student", "Room", "Check-in", "Check-out", "Status"], 
-                             data)
-            else:
+            if not browse("ALL BOOKINGS", ["ID", "Student", "Room", "Check-in", "Check-out", "Status"],
+                          partial(queries.booking_rows, session), format_booking_row):
                 click.echo("No bookings found!")
-            click.pause()
+                click.pause()
             
         elif choice == 3:
             clear_screen()
@@ -369,20 +412,38 @@ def manage_bookings():
                     click.echo("This booking is already cancelled!")
                 else:
                     if click.confirm("Are you sure you want to cancel this booking?"):
-                        booking.status = 'cancelled'
-                        room = session.query(Room).get(booking.room_id)
-                        if room:
-                            room.current_occupancy -= 1
-                            if not room.is_available:
-                                room.is_available = True
-                        session.commit()
-                        click.echo("Booking cancelled successfully!")
+                        try:
+                            cancel_booking(session, booking_id)
+                            click.echo("Booking cancelled successfully!")
+                        except BookingError as e:
+                            click.echo(str(e))
             else:
                 click.echo(f"Booking with ID {booking_id} not found!")
             click.pause()
+            
+        elif choice == 4:
+            clear_screen()
+            check_in = click.prompt("Check-in date (YYYY-MM-DD)", type=click.DateTime(["%Y-%m-%d"]))
+            check_out = click.prompt("Check-out date (YYYY-MM-DD)", type=click.DateTime(["%Y-%m-%d"]))
+            beds = click.prompt("Beds needed", type=click.IntRange(1), default=1)
+            print_available_rooms(check_in.date(), check_out.date(), beds)
+            click.pause()
+
+def print_available_rooms(check_in, check_out, beds=1):
+    """Print rooms with enough free beds for a stay"""
+    if check_out <= check_in:
+        click.echo("Check-out date must be after check-in date!")
+        return
+    rooms = cache.rooms_with_free_beds(session, check_in, check_out, beds)
+    if rooms:
+        display_table(f"ROOMS FREE {check_in} TO {check_out}",
+                     ["ID", "Room No", "Price (KES)", "Free Beds"], rooms)
+    else:
+        click.echo("No rooms available for those dates!")
 
 def manage_complaints():
     while True:
+        next_action("complaints")
         clear_screen()
         click.echo("╔══════════════════════════════╗")
         click.echo("║     COMPLAINT MANAGEMENT     ║")
@@ -390,10 +451,13 @@ def manage_complaints():
         click.echo("║ 1. File New Complaint       ║")
         click.echo("║ 2. View All Complaints      ║")
         click.echo("║ 3. Update Complaint Status  ║")
+        click.echo("║ 4. Manager Queue            ║")
+        click.echo("║ 5. Manager Backlogs         ║")
         click.echo("║ 0. Back to Main Menu        ║")
         click.echo("╚══════════════════════════════╝")
         
-        choice = click.prompt("Enter your choice", type=click.IntRange(0, 3))
+        choice = click.prompt("Enter your choice", type=click.IntRange(0, 5))
+        profiling.label(f"complaints #{choice}")
         
         if choice == 0:
             break
@@ -404,25 +468,35 @@ def manage_complaints():
             click.echo("╚══════════════════════════════╝")
             
             # List students
-            students = session.query(Student).all()
+            students = cache.student_choices(session)
             if not students:
                 click.echo("No students available!")
                 click.pause()
                 continue
                 
-            display_table("STUDENTS", ["ID", "Name"], [(s.id, s.name) for s in students])
+            display_table("STUDENTS", ["ID", "Name"], students)
             
             # List managers
-            managers = session.query(Manager).all()
+            managers = cache.manager_choices(session)
             if not managers:
                 click.echo("No managers available!")
                 click.pause()
                 continue
                 
-            display_table("MANAGERS", ["ID", "Name"], [(m.id, m.name) for m in managers])
+            display_table("MANAGERS", ["ID", "Name"], managers)
             
             student_id = click.prompt("Enter Student ID", type=int)
-            manager_id = click.prompt("Enter Manager ID", type=int)
+            manager_id = click.prompt("Enter Manager ID (0 to assign the least-loaded)", type=int, default=0)
+            if cache.label(session, 'student', student_id) is None:
+                click.echo(f"Student with ID {student_id} not found!")
+                click.pause()
+                continue
+            if manager_id == 0:
+                manager_id = complaints.least_loaded_manager(session)
+            if cache.label(session, 'manager', manager_id) is None:
+                click.echo(f"Manager with ID {manager_id} not found!")
+                click.pause()
+                continue
             title = click.prompt("Complaint Title")
             description = click.prompt("Complaint Description")
             
@@ -437,7 +511,7 @@ def manage_complaints():
                 
                 session.add(complaint)
                 session.commit()
-                click.echo("Complaint filed successfully!")
+                click.echo(f"Complaint filed and assigned to {cache.label(session, 'manager', manager_id)}!")
             except Exception as e:
                 session.rollback()
                 click.echo(f"Error filing complaint: {str(e)}")
@@ -446,26 +520,10 @@ def manage_complaints():
             
         elif choice == 2:
             clear_screen()
-            complaints = session.query(Complaint).all()
-            if complaints:
-                data = []
-                for complaint in complaints:
-                    student = session.query(Student).get(complaint.student_id)
-                    manager = session.query(Manager).get(complaint.manager_id)
-                    data.append((
-                        complaint.id,
-                        student.name if student else "N/A",
-                        manager.name if manager else "N/A",
-                        complaint.title,
-                        complaint.status,
-                        complaint.date
-                    ))
-                display_table("ALL COMPLAINTS",
-                            ["ID", "Student", "Manager", "Title", "Status", "Date"],
-                            data)
-            else:
+            if not browse("ALL COMPLAINTS", ["ID", "Student", "Manager", "Title", "Status", "Date"],
+                          partial(queries.complaint_rows, session), format_complaint_row):
                 click.echo("No complaints found!")
-            click.pause()
+                click.pause()
             
         elif choice == 3:
             clear_screen()
@@ -482,9 +540,33 @@ def manage_complaints():
             else:
                 click.echo(f"Complaint with ID {complaint_id} not found!")
             click.pause()
+            
+        elif choice == 4:
+            clear_screen()
+            manager_id = click.prompt("Enter Manager ID", type=int)
+            queue = complaints.next_complaints(session, manager_id, limit=queries.PAGE_SIZE)
+            if queue:
+                display_table(f"OPEN COMPLAINTS FOR MANAGER {manager_id} (OLDEST FIRST)",
+                              ["ID", "Student ID", "Title", "Status", "Date"], queue)
+                if click.confirm(f"\nStart work on complaint {queue[0].id}?"):
+                    claimed = complaints.claim_next(session, manager_id)
+                    click.echo(f"Complaint {claimed[0]} is now in progress!" if claimed else "Queue is empty!")
+            else:
+                click.echo("No open complaints for this manager!")
+            click.pause()
+            
+        elif choice == 5:
+            clear_screen()
+            backlogs = complaints.backlog_counts(session)
+            if backlogs:
+                display_table("COMPLAINT BACKLOGS", ["Manager ID", "Name", "Open", "In Progress"], backlogs)
+            else:
+                click.echo("No managers found!")
+            click.pause()
 
 def manage_managers():
     while True:
+        next_action("managers")
         clear_screen()
         click.echo("╔══════════════════════════════╗")
         click.echo("║      MANAGER MANAGEMENT      ║")
@@ -497,6 +579,7 @@ def manage_managers():
         click.echo("╚══════════════════════════════╝")
         
         choice = click.prompt("Enter your choice", type=click.IntRange(0, 4))
+        profiling.label(f"managers #{choice}")
         
         if choice == 0:
             break
@@ -527,13 +610,10 @@ def manage_managers():
             
         elif choice == 2:
             clear_screen()
-            managers = session.query(Manager).all()
-            if managers:
-                data = [(m.id, m.name, m.email, m.phone) for m in managers]
-                display_table("ALL MANAGERS", ["ID", "Name", "Email", "Phone"], data)
-            else:
+            if not browse("ALL MANAGERS", ["ID", "Name", "Email", "Phone"],
+                          partial(queries.manager_rows, session)):
                 click.echo("No managers found!")
-            click.pause()
+                click.pause()
             
         elif choice == 3:
             clear_screen()
@@ -582,6 +662,7 @@ def manage_managers():
 
 def view_reports():
     while True:
+        next_action("reports")
         clear_screen()
         click.echo("╔══════════════════════════════╗")
         click.echo("║          REPORTS             ║")
@@ -589,91 +670,129 @@ def view_reports():
         click.echo("║ 1. Room Occupancy           ║")
         click.echo("║ 2. Complaint Status         ║")
         click.echo("║ 3. Financial Summary        ║")
+        click.echo("║ 4. Monthly Trends           ║")
         click.echo("║ 0. Back to Main Menu        ║")
         click.echo("╚══════════════════════════════╝")
         
-        choice = click.prompt("Enter your choice", type=click.IntRange(0, 3))
+        choice = click.prompt("Enter your choice", type=click.IntRange(0, 4))
+        profiling.label(f"reports #{choice}")
         
         if choice == 0:
             break
         elif choice == 1:
             clear_screen()
-            rooms = session.query(Room).all()
-            if rooms:
-                data = []
-                for room in rooms:
-                    occupancy_percent = (room.current_occupancy / room.capacity) * 100
-                    data.append((
-                        room.room_number,
-                        room.capacity,
-                        room.current_occupancy,
-                        f"{occupancy_percent:.1f}%",
-                        f"KES {room.price}"
-                    ))
-                display_table("ROOM OCCUPANCY REPORT", 
-                            ["Room No", "Capacity", "Occupied", "Occupancy %", "Price"], 
-                            data)
-            else:
-                click.echo("No rooms found!")
+            print_occupancy_report()
             click.pause()
             
         elif choice == 2:
             clear_screen()
-            complaints = session.query(Complaint).all()
-            if complaints:
-                status_counts = {'open': 0, 'in-progress': 0, 'resolved': 0}
-                for complaint in complaints:
-                    status_counts[complaint.status] += 1
-                
-                click.echo("\nCOMPLAINT STATUS SUMMARY:")
-                click.echo(f"Open: {status_counts['open']}")
-                click.echo(f"In Progress: {status_counts['in-progress']}")
-                click.echo(f"Resolved: {status_counts['resolved']}")
-                click.echo(f"Total: {sum(status_counts.values())}")
-                
+            if print_complaint_summary():
                 # Detailed view
                 if click.confirm("\nShow detailed complaint list?"):
-                    data = []
-                    for complaint in complaints:
-                        student = session.query(Student).get(complaint.student_id)
-                        manager = session.query(Manager).get(complaint.manager_id)
-                        data.append((
-                            complaint.id,
-                            student.name if student else "N/A",
-                            manager.name if manager else "N/A",
-                            complaint.title,
-                            complaint.status,
-                            complaint.date
-                        ))
-                    display_table("ALL COMPLAINTS",
-                                ["ID", "Student", "Manager", "Title", "Status", "Date"],
-                                data)
-            else:
-                click.echo("No complaints found!")
+                    browse("ALL COMPLAINTS", ["ID", "Student", "Manager", "Title", "Status", "Date"],
+                           partial(queries.complaint_rows, session), format_complaint_row)
+                    continue
             click.pause()
             
         elif choice == 3:
             clear_screen()
-            rooms = session.query(Room).all()
-            total_revenue = sum(room.price * room.current_occupancy for room in rooms)
-            total_capacity = sum(room.capacity for room in rooms)
-            total_occupied = sum(room.current_occupancy for room in rooms)
-            
-            click.echo("\nFINANCIAL SUMMARY")
-            click.echo(f"Total Rooms: {len(rooms)}")
-            click.echo(f"Total Capacity: {total_capacity}")
-            click.echo(f"Total Occupied: {total_occupied}")
-            click.echo(f"Occupancy Rate: {(total_occupied/total_capacity)*100:.1f}%")
-            click.echo(f"Estimated Revenue: KES {total_revenue}")
-            
-            if rooms:
-                data = [(r.room_number, r.capacity, r.current_occupancy, 
-                        f"KES {r.price}", f"KES {r.price * r.current_occupancy}") 
-                       for r in rooms]
-                display_table("ROOM REVENUE DETAILS",
-                            ["Room No", "Capacity", "Occupied", "Price", "Revenue"],
-                            data)
+            print_finance_report()
+            click.pause()
+            
+        elif choice == 4:
+            clear_screen()
+            print_trend_report()
             click.pause()
 
+def print_occupancy_report():
+    """Print per-room occupancy; returns False when there are no rooms"""
+    rows = reports.occupancy_rows(session, stream=True)
+    first = next(rows, None)
+    if first is None:
+        click.echo("No rooms found!")
+        return False
+    data = ((number, capacity, occupied, f"{percent:.1f}%", f"KES {price}")
+            for number, capacity, occupied, percent, price in chain([first], rows))
+    display_table("ROOM OCCUPANCY REPORT", 
+                ["Room No", "Capacity", "Occupied", "Occupancy %", "Price"], 
+                data)
+    return True
+
+def print_complaint_summary(include_archive=False):
+    """Print complaint counts by status; returns False when there are no complaints"""
+    status_counts = reports.complaint_status_counts(session, include_archive)
+    total = sum(status_counts.values())
+    if not total:
+        click.echo("No complaints found!")
+        return False
+    click.echo(f"\nCOMPLAINT STATUS SUMMARY{' (INCLUDING ARCHIVE)' if include_archive else ''}:")
+    click.echo(f"Open: {status_counts['open']}")
+    click.echo(f"In Progress: {status_counts['in-progress']}")
+    click.echo(f"Resolved: {status_counts['resolved']}")
+    click.echo(f"Total: {total}")
+    return True
+
+def print_booking_summary(include_archive=False):
+    """Print booking counts by status; returns False when there are no bookings"""
+    status_counts = reports.booking_status_counts(session, include_archive)
+    total = sum(status_counts.values())
+    if not total:
+        click.echo("No bookings found!")
+        return False
+    click.echo(f"\nBOOKING STATUS SUMMARY{' (INCLUDING ARCHIVE)' if include_archive else ''}:")
+    click.echo(f"Confirmed: {status_counts['confirmed']}")
+    click.echo(f"Completed: {status_counts['completed']}")
+    click.echo(f"Cancelled: {status_counts['cancelled']}")
+    click.echo(f"Total: {total}")
+    return True
+
+def print_finance_report():
+    """Print the financial summary and per-room revenue"""
+    total_rooms, total_capacity, total_occupied, total_revenue = reports.finance_summary(session)
+    
+    click.echo("\nFINANCIAL SUMMARY")
+    click.echo(f"Total Rooms: {total_rooms}")
+    click.echo(f"Total Capacity: {total_capacity}")
+    click.echo(f"Total Occupied: {total_occupied}")
+    click.echo(f"Occupancy Rate: {reports.occupancy_rate(total_capacity, total_occupied):.1f}%")
+    click.echo(f"Estimated Revenue: KES {total_revenue}")
+    
+    if total_rooms:
+        data = ((number, capacity, occupied, f"KES {price}", f"KES {revenue}")
+                for number, capacity, occupied, price, revenue in reports.revenue_rows(session, stream=True))
+        display_table("ROOM REVENUE DETAILS",
+                    ["Room No", "Capacity", "Occupied", "Price", "Revenue"],
+                    data)
+
+def print_trend_report(start=None, end=None):
+    """Print month-over-month occupancy and revenue from the daily snapshots"""
+    rows = snapshots.monthly_trend(session, start, end)
+    if not rows:
+        click.echo("No snapshots captured yet! Run `snapshot` first.")
+        return
+    data, previous = [], None
+    for month, days, occupied, capacity, revenue in rows:
+        change = snapshots.change_percent(revenue, previous)
+        data.append((month, days, f"{occupied:.1f}", f"{reports.occupancy_rate(capacity, occupied):.1f}%",
+                     f"KES {revenue:,.0f}", f"{change:+.1f}%" if change is not None else "-"))
+        previous = revenue
+    display_table("MONTHLY OCCUPANCY AND REVENUE",
+                  ["Month", "Days", "Avg Occupied", "Occupancy %", "Avg Daily Revenue", "Change"],
+                  data)
+
+def print_room_trend(room_id, start=None, end=None):
+    """Print one room's monthly history from the daily snapshots"""
+    captured = {month: days for month, days, *_ in snapshots.monthly_trend(session, start, end)}
+    rows = snapshots.room_trend(session, room_id, start, end)
+    if not rows:
+        click.echo(f"No snapshot history for room {room_id}!")
+        return
+    data = [(month, occupied_days, bed_nights, peak, f"{bed_nights / captured.get(month, occupied_days):.2f}",
+             f"KES {revenue / captured.get(month, occupied_days):,.0f}")
+            for month, occupied_days, bed_nights, peak, revenue in rows]
+    display_table(f"ROOM {room_id} MONTHLY HISTORY",
+                  ["Month", "Occupied Days", "Bed-Nights", "Peak", "Avg Occupied", "Avg Daily Revenue"],
+                  data)
+
 if __name__ == '__main__':
     show_menu()
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""add lookup indexes
+
+Revision ID: 3b1f6c2a9d40
+Revises: ec96fdd51d07
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b1f6c2a9d40'
+down_revision: Union[str, None] = 'ec96fdd51d07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Student detail screens: bookings of one student, optionally by status
+    op.create_index('ix_bookings_student_status', 'bookings', ['student_id', 'status'])
+    # Room detail and availability: live bookings of one room in date order
+    op.create_index('ix_bookings_room_status_checkin', 'bookings', ['room_id', 'status', 'check_in_date'])
+    # Check-out sweeps: confirmed bookings whose stay has ended
+    op.create_index('ix_bookings_status_checkout', 'bookings', ['status', 'check_out_date'])
+    # Complaint status summary and per-manager backlogs
+    op.create_index('ix_complaints_status', 'complaints', ['status'])
+    op.create_index('ix_complaints_manager_status', 'complaints', ['manager_id', 'status'])
+    # Available-room pick-lists
+    op.create_index('ix_rooms_is_available', 'rooms', ['is_available'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_rooms_is_available', table_name='rooms')
+    op.drop_index('ix_complaints_manager_status', table_name='complaints')
+    op.drop_index('ix_complaints_status', table_name='complaints')
+    op.drop_index('ix_bookings_status_checkout', table_name='bookings')
+    op.drop_index('ix_bookings_room_status_checkin', table_name='bookings')
+    op.drop_index('ix_bookings_student_status', table_name='bookings')
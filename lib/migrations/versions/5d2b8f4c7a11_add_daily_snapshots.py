@@ -0,0 +1,46 @@
+"""add daily snapshot tables
+
+Revision ID: 5d2b8f4c7a11
+Revises: a7c3e91f5b20
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2b8f4c7a11'
+down_revision: Union[str, None] = 'a7c3e91f5b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Per-room history, keyed for one room's day range
+    op.create_table('room_snapshots',
+    sa.Column('room_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('occupied', sa.Integer(), nullable=True),
+    sa.Column('capacity', sa.Integer(), nullable=True),
+    sa.Column('price', sa.Integer(), nullable=True),
+    sa.Column('revenue', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('room_id', 'day')
+    )
+    # Hostel-wide totals, one row per captured day
+    op.create_table('daily_snapshots',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('rooms', sa.Integer(), nullable=True),
+    sa.Column('capacity', sa.Integer(), nullable=True),
+    sa.Column('occupied', sa.Integer(), nullable=True),
+    sa.Column('revenue', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('day')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_snapshots')
+    op.drop_table('room_snapshots')
@@ -0,0 +1,29 @@
+"""index complaint queues by date
+
+Revision ID: 8e4a1d6b3c72
+Revises: 5d2b8f4c7a11
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4a1d6b3c72'
+down_revision: Union[str, None] = '5d2b8f4c7a11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Oldest-first manager queues; the old (manager_id, status) index is a prefix of this one
+    op.create_index('ix_complaints_manager_status_date', 'complaints', ['manager_id', 'status', 'date'])
+    op.drop_index('ix_complaints_manager_status', table_name='complaints')
+
+
+def downgrade() -> None:
+    op.create_index('ix_complaints_manager_status', 'complaints', ['manager_id', 'status'])
+    op.drop_index('ix_complaints_manager_status_date', table_name='complaints')
@@ -0,0 +1,58 @@
+"""add full-text search index
+
+Revision ID: a7c3e91f5b20
+Revises: 3b1f6c2a9d40
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e91f5b20'
+down_revision: Union[str, None] = '3b1f6c2a9d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (kind, code, table, title expression, body expression)
+SOURCES = [
+    ('student', 1, 'students', "{row}.name", "coalesce({row}.email, '') || ' ' || coalesce({row}.phone, '')"),
+    ('room', 2, 'rooms', "{row}.room_number", "''"),
+    ('complaint', 3, 'complaints', "{row}.title", "coalesce({row}.description, '')"),
+]
+
+
+def upgrade() -> None:
+    # FTS5 is SQLite-only; other databases fall back to LIKE searches
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.execute(
+        "CREATE VIRTUAL TABLE search_index USING fts5("
+        "kind UNINDEXED, ref_id UNINDEXED, title, body, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+    op.execute("CREATE VIRTUAL TABLE search_vocab USING fts5vocab(search_index, 'row')")
+    for kind, code, table, title, body in SOURCES:
+        insert = (f"INSERT INTO search_index (rowid, kind, ref_id, title, body) VALUES "
+                  f"(new.id * 4 + {code}, '{kind}', new.id, {title.format(row='new')}, {body.format(row='new')});")
+        delete = f"DELETE FROM search_index WHERE rowid = old.id * 4 + {code};"
+        op.execute(f"CREATE TRIGGER {table}_search_insert AFTER INSERT ON {table} BEGIN {insert} END")
+        op.execute(f"CREATE TRIGGER {table}_search_update AFTER UPDATE ON {table} BEGIN {delete} {insert} END")
+        op.execute(f"CREATE TRIGGER {table}_search_delete AFTER DELETE ON {table} BEGIN {delete} END")
+        op.execute(
+            f"INSERT INTO search_index (rowid, kind, ref_id, title, body) "
+            f"SELECT id * 4 + {code}, '{kind}', id, {title.format(row=table)}, {body.format(row=table)} FROM {table}"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for _, _, table, _, _ in SOURCES:
+        for action in ('insert', 'update', 'delete'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_search_{action}")
+    op.execute("DROP TABLE IF EXISTS search_vocab")
+    op.execute("DROP TABLE IF EXISTS search_index")
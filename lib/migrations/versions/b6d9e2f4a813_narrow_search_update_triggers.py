@@ -0,0 +1,51 @@
+"""narrow search update triggers to indexed columns
+
+Revision ID: b6d9e2f4a813
+Revises: f1a8c6d2b594
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d9e2f4a813'
+down_revision: Union[str, None] = 'f1a8c6d2b594'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Indexed columns per table; updates to any other column leave the index alone
+INDEXED_COLUMNS = {
+    'students': 'name, email, phone',
+    'rooms': 'room_number',
+    'complaints': 'title, description',
+}
+
+
+def recreate_update_triggers(narrow):
+    # Triggers created by a7c3e91f5b20 fire on every counter and status
+    # update; rewrite the event of the update trigger each database has
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+    for table, columns in INDEXED_COLUMNS.items():
+        name = f"{table}_search_update"
+        sql = bind.execute(sa.text("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = :name"),
+                           {'name': name}).scalar()
+        every, indexed = f"AFTER UPDATE ON {table}", f"AFTER UPDATE OF {columns} ON {table}"
+        old, new = (every, indexed) if narrow else (indexed, every)
+        if sql is None or old not in sql:
+            continue
+        op.execute(f"DROP TRIGGER {name}")
+        op.execute(sql.replace(old, new))
+
+
+def upgrade() -> None:
+    recreate_update_triggers(narrow=True)
+
+
+def downgrade() -> None:
+    recreate_update_triggers(narrow=False)
@@ -0,0 +1,52 @@
+"""add booking and complaint archive tables
+
+Revision ID: c4f2a9e7d315
+Revises: 8e4a1d6b3c72
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f2a9e7d315'
+down_revision: Union[str, None] = '8e4a1d6b3c72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('bookings_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=True),
+    sa.Column('room_id', sa.Integer(), nullable=True),
+    sa.Column('booking_date', sa.Date(), nullable=True),
+    sa.Column('check_in_date', sa.Date(), nullable=True),
+    sa.Column('check_out_date', sa.Date(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('archived_date', sa.Date(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_bookings_archive_status_checkout', 'bookings_archive', ['status', 'check_out_date'])
+    op.create_table('complaints_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=True),
+    sa.Column('manager_id', sa.Integer(), nullable=True),
+    sa.Column('title', sa.String(), nullable=True),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('date', sa.Date(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('archived_date', sa.Date(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_complaints_archive_status', 'complaints_archive', ['status'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_complaints_archive_status', table_name='complaints_archive')
+    op.drop_table('complaints_archive')
+    op.drop_index('ix_bookings_archive_status_checkout', table_name='bookings_archive')
+    op.drop_table('bookings_archive')
@@ -0,0 +1,52 @@
+"""delete room snapshots with their room
+
+Revision ID: d3e7a5c91b28
+Revises: b6d9e2f4a813
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3e7a5c91b28'
+down_revision: Union[str, None] = 'b6d9e2f4a813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# PostgreSQL's default name for the constraint created by 5d2b8f4c7a11
+FK_NAME = 'room_snapshots_room_id_fkey'
+
+
+def room_snapshots(ondelete):
+    return sa.Table('room_snapshots', sa.MetaData(),
+        sa.Column('room_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('occupied', sa.Integer(), nullable=True),
+        sa.Column('capacity', sa.Integer(), nullable=True),
+        sa.Column('price', sa.Integer(), nullable=True),
+        sa.Column('revenue', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], name=FK_NAME, ondelete=ondelete),
+        sa.PrimaryKeyConstraint('room_id', 'day'),
+    )
+
+
+def set_ondelete(ondelete):
+    if op.get_bind().dialect.name == 'sqlite':
+        # SQLite cannot alter a constraint; rebuild the table with the new one
+        with op.batch_alter_table('room_snapshots', copy_from=room_snapshots(ondelete), recreate='always'):
+            pass
+        return
+    op.drop_constraint(FK_NAME, 'room_snapshots', type_='foreignkey')
+    op.create_foreign_key(FK_NAME, 'room_snapshots', 'rooms', ['room_id'], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    set_ondelete('CASCADE')
+
+
+def downgrade() -> None:
+    set_ondelete(None)
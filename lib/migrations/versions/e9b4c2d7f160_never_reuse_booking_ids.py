@@ -0,0 +1,57 @@
+"""never reuse booking and complaint ids
+
+Revision ID: e9b4c2d7f160
+Revises: d3e7a5c91b28
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9b4c2d7f160'
+down_revision: Union[str, None] = 'd3e7a5c91b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQLite hands out max(rowid) + 1, so once `archive` moved the newest row its
+# id came back and collided in the archive table and the audit log.
+# AUTOINCREMENT keeps a high-water mark instead. PostgreSQL sequences never
+# go backwards, so only SQLite needs the rebuild.
+TABLES = ('bookings', 'complaints')
+
+
+def rebuild(autoincrement):
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+    # Rebuilding a table drops its triggers (the search index ones); keep
+    # their definitions to put back afterwards
+    triggers = bind.execute(sa.text(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name IN ('bookings', 'complaints')"
+    )).scalars().all()
+    for table in TABLES:
+        with op.batch_alter_table(table, recreate='always', table_kwargs={'sqlite_autoincrement': autoincrement}):
+            pass
+    if autoincrement:
+        for table in TABLES:
+            # Start past every id already used, archived rows included
+            op.execute(f"DELETE FROM sqlite_sequence WHERE name = '{table}'")
+            op.execute(
+                f"INSERT INTO sqlite_sequence (name, seq) VALUES ('{table}', max("
+                f"(SELECT coalesce(max(id), 0) FROM {table}), "
+                f"(SELECT coalesce(max(id), 0) FROM {table}_archive)))"
+            )
+    for sql in triggers:
+        op.execute(sql)
+
+
+def upgrade() -> None:
+    rebuild(autoincrement=True)
+
+
+def downgrade() -> None:
+    rebuild(autoincrement=False)
@@ -0,0 +1,38 @@
+"""add audit log
+
+Revision ID: f1a8c6d2b594
+Revises: c4f2a9e7d315
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a8c6d2b594'
+down_revision: Union[str, None] = 'c4f2a9e7d315'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('audit_log',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), nullable=True),
+    sa.Column('entity', sa.String(), nullable=True),
+    sa.Column('entity_id', sa.Integer(), nullable=True),
+    sa.Column('action', sa.String(), nullable=True),
+    sa.Column('changes', sa.Text(), nullable=True),
+    sa.Column('actor', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # `audit --entity booking --id N` seeks on this and reads newest first
+    op.create_index('ix_audit_log_entity_id', 'audit_log', ['entity', 'entity_id', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_log_entity_id', table_name='audit_log')
+    op.drop_table('audit_log')
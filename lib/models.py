@@ -1,6 +1,8 @@
-from sqlalchemy import create_engine, Column, Integer, String, ForeignKey, Date, Boolean
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Date, DateTime, Boolean, Index
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker, scoped_session
+from contextlib import contextmanager
 from datetime import datetime
+from .config import load_settings, build_engine
 
 Base = declarative_base()
 
@@ -31,6 +33,10 @@ class Room(Base):
     
     bookings = relationship("Booking", back_populates="room")
     
+    __table_args__ = (
+        Index('ix_rooms_is_available', 'is_available'),
+    )
+    
     def __repr__(self):
         return f"<Room(id={self.id}, number='{self.room_number}', available={self.is_available})>"
 
@@ -61,6 +67,15 @@ class Booking(Base):
     student = relationship("Student", back_populates="bookings")
     room = relationship("Room", back_populates="bookings")
     
+    # AUTOINCREMENT: SQLite would otherwise hand the highest id out again once
+    # `archive` moves that row, and the archive and audit log key on ids
+    __table_args__ = (
+        Index('ix_bookings_student_status', 'student_id', 'status'),
+        Index('ix_bookings_room_status_checkin', 'room_id', 'status', 'check_in_date'),
+        Index('ix_bookings_status_checkout', 'status', 'check_out_date'),
+        {'sqlite_autoincrement': True},
+    )
+    
     def __repr__(self):
         return f"<Booking(id={self.id}, student={self.student_id}, room={self.room_id})>"
 
@@ -78,11 +93,144 @@ class Complaint(Base):
     student = relationship("Student", back_populates="complaints")
     manager = relationship("Manager", back_populates="complaints")
     
+    # Never reuses ids either; see Booking
+    __table_args__ = (
+        Index('ix_complaints_status', 'status'),
+        Index('ix_complaints_manager_status_date', 'manager_id', 'status', 'date'),
+        {'sqlite_autoincrement': True},
+    )
+    
     def __repr__(self):
         return f"<Complaint(id={self.id}, title='{self.title}', status='{self.status}')>"
 
-# Database connection
-engine = create_engine('sqlite:///hostel.db')
-Base.metadata.create_all(engine)
-Session = sessionmaker(bind=engine)
-session = Session()
\ No newline at end of file
+class RoomSnapshot(Base):
+    __tablename__ = 'room_snapshots'
+    
+    # One row per room per captured day it had guests; missing rows mean empty.
+    # History goes with its room, so deleting a room is never blocked by it
+    room_id = Column(Integer, ForeignKey('rooms.id', ondelete='CASCADE'), primary_key=True)
+    day = Column(Date, primary_key=True)
+    occupied = Column(Integer)
+    capacity = Column(Integer)
+    price = Column(Integer)
+    revenue = Column(Integer)
+    
+    def __repr__(self):
+        return f"<RoomSnapshot(room={self.room_id}, day={self.day}, occupied={self.occupied})>"
+
+class DailySnapshot(Base):
+    __tablename__ = 'daily_snapshots'
+    
+    # Hostel-wide totals per captured day; the trend reports read only this
+    day = Column(Date, primary_key=True)
+    rooms = Column(Integer)
+    capacity = Column(Integer)
+    occupied = Column(Integer)
+    revenue = Column(Integer)
+    
+    def __repr__(self):
+        return f"<DailySnapshot(day={self.day}, occupied={self.occupied})>"
+
+class ArchivedBooking(Base):
+    __tablename__ = 'bookings_archive'
+    
+    # Completed and cancelled bookings moved out of `bookings` by `archive`;
+    # same columns and ids, no foreign keys so students and rooms can go
+    id = Column(Integer, primary_key=True)
+    student_id = Column(Integer)
+    room_id = Column(Integer)
+    booking_date = Column(Date)
+    check_in_date = Column(Date)
+    check_out_date = Column(Date)
+    status = Column(String)
+    archived_date = Column(Date, default=datetime.now)
+    
+    __table_args__ = (
+        Index('ix_bookings_archive_status_checkout', 'status', 'check_out_date'),
+    )
+    
+    def __repr__(self):
+        return f"<ArchivedBooking(id={self.id}, student={self.student_id}, room={self.room_id})>"
+
+class ArchivedComplaint(Base):
+    __tablename__ = 'complaints_archive'
+    
+    # Resolved complaints moved out of `complaints` by `archive`
+    id = Column(Integer, primary_key=True)
+    student_id = Column(Integer)
+    manager_id = Column(Integer)
+    title = Column(String)
+    description = Column(String)
+    date = Column(Date)
+    status = Column(String)
+    archived_date = Column(Date, default=datetime.now)
+    
+    __table_args__ = (
+        Index('ix_complaints_archive_status', 'status'),
+    )
+    
+    def __repr__(self):
+        return f"<ArchivedComplaint(id={self.id}, title='{self.title}', status='{self.status}')>"
+
+class AuditEntry(Base):
+    __tablename__ = 'audit_log'
+    
+    # One change to a student, room, manager, booking or complaint; written
+    # by lib.audit in the same transaction as the change
+    id = Column(Integer, primary_key=True)
+    changed_at = Column(DateTime)
+    entity = Column(String)            # student, room, manager, booking, complaint
+    entity_id = Column(Integer)
+    action = Column(String)            # insert, update, delete, archive
+    changes = Column(Text)             # JSON: values, or [old, new] per changed field
+    actor = Column(String)
+    
+    __table_args__ = (
+        Index('ix_audit_log_entity_id', 'entity', 'entity_id', 'id'),
+    )
+    
+    def __repr__(self):
+        return f"<AuditEntry(id={self.id}, {self.entity}={self.entity_id}, action='{self.action}')>"
+
+# Database connection. The engine is built on first use and the schema is
+# only created by `initdb` or Alembic migrations, never at import time.
+_engine = None
+
+def get_engine():
+    """Return the shared engine, creating it from the settings on first call"""
+    global _engine
+    if _engine is None:
+        _engine = build_engine(load_settings())
+    return _engine
+
+def __getattr__(name):
+    # Keep `from lib.models import engine` working without eager creation
+    if name == 'engine':
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+_session_factory = sessionmaker()
+
+def _new_session():
+    return _session_factory(bind=get_engine())
+
+# Thread-local session registry. `session` proxies the current session;
+# call Session.remove() at the end of each command or menu action.
+Session = scoped_session(_new_session)
+session = Session
+
+@contextmanager
+def session_scope():
+    """Provide a session for one unit of work, committing on success"""
+    db = Session()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        Session.remove()
+
+# Room occupancy counters are kept in sync, and changes audited, by session listeners
+from . import occupancy, audit  # noqa: E402,F401
\ No newline at end of file
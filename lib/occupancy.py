@@ -0,0 +1,167 @@
+from sqlalchemy import event, select, update, func, or_
+from sqlalchemy.orm import Session as OrmSession, attributes
+from .models import Student, Room, Booking
+from . import audit
+
+# Room.current_occupancy and Room.is_available are derived from confirmed
+# bookings. They are maintained here and nowhere else: session listeners
+# note which rooms a flush touches (booking inserts, deletes, status or room
+# changes, capacity edits, student and room deletion) and recompute just
+# those rooms with one set-based UPDATE. `reconcile` rebuilds every room.
+# Counter changes on named rooms, and every reconcile fix, go to the audit log.
+
+ACTIVE_STATUS = 'confirmed'
+PENDING_KEY = 'occupancy_rooms'
+ID_BATCH = 5000   # room ids per statement, under SQLite's bound-parameter limit
+
+rooms_table = Room.__table__
+bookings_table = Booking.__table__
+
+def confirmed_count():
+    """Correlated count of confirmed bookings for the room being updated"""
+    return (
+        select(func.count())
+        .where(bookings_table.c.room_id == rooms_table.c.id, bookings_table.c.status == ACTIVE_STATUS)
+        .scalar_subquery()
+    )
+
+def refresh_rooms(connection, room_ids=None):
+    """Recompute counters for the given rooms (all rooms when None)"""
+    if room_ids is not None and not room_ids:
+        return
+    confirmed = confirmed_count()
+    stmt = update(rooms_table).values(
+        current_occupancy=confirmed,
+        is_available=confirmed < rooms_table.c.capacity,
+    )
+    if room_ids is None:
+        connection.execute(stmt)
+        return
+    ids = sorted(room_ids)
+    for start in range(0, len(ids), ID_BATCH):
+        _refresh_batch(connection, stmt, ids[start:start + ID_BATCH])
+
+def _refresh_batch(connection, stmt, ids):
+    # Old counters are a primary-key read; the new ones come back from the UPDATE
+    old = {room_id: (occupied, available) for room_id, occupied, available in connection.execute(
+        select(rooms_table.c.id, rooms_table.c.current_occupancy, rooms_table.c.is_available)
+        .where(rooms_table.c.id.in_(ids)))}
+    stmt = stmt.where(rooms_table.c.id.in_(ids))
+    if connection.dialect.update_returning:
+        new = connection.execute(
+            stmt.returning(rooms_table.c.id, rooms_table.c.current_occupancy, rooms_table.c.is_available)).all()
+    else:
+        connection.execute(stmt)
+        new = connection.execute(
+            select(rooms_table.c.id, rooms_table.c.current_occupancy, rooms_table.c.is_available)
+            .where(rooms_table.c.id.in_(ids))).all()
+    for room_id, occupied, available in new:
+        audit_counters(connection, room_id, *old.get(room_id, (None, None)), occupied, available)
+
+def audit_counters(connection, room_id, occupied, available, new_occupied, new_available):
+    """Record a room's counter change, if there was one"""
+    changes = {}
+    if occupied != new_occupied:
+        changes['current_occupancy'] = [occupied, new_occupied]
+    if available is None or bool(available) != bool(new_available):
+        changes['is_available'] = [available, bool(new_available)]
+    if changes:
+        audit.record(connection, 'room', room_id, 'update', changes)
+
+def drifted_rooms(connection):
+    """(id, room_number, stored_occupancy, actual_occupancy, stored_available, actual_available) for stale rooms"""
+    counts = (
+        select(bookings_table.c.room_id, func.count().label('confirmed'))
+        .where(bookings_table.c.status == ACTIVE_STATUS)
+        .group_by(bookings_table.c.room_id)
+        .subquery()
+    )
+    actual = func.coalesce(counts.c.confirmed, 0)
+    actual_available = actual < rooms_table.c.capacity
+    stmt = (
+        select(rooms_table.c.id, rooms_table.c.room_number, rooms_table.c.current_occupancy, actual,
+               rooms_table.c.is_available, actual_available)
+        .outerjoin(counts, counts.c.room_id == rooms_table.c.id)
+        .where(or_(
+            func.coalesce(rooms_table.c.current_occupancy, -1) != actual,
+            rooms_table.c.is_available.is_(None),
+            rooms_table.c.is_available != actual_available,
+        ))
+        .order_by(rooms_table.c.id)
+    )
+    return [tuple(row[:4]) + (bool(row[4]) if row[4] is not None else None, bool(row[5]))
+            for row in connection.execute(stmt)]
+
+def reconcile(connection, dry_run=False):
+    """Fix every drifted room in one UPDATE; returns the drift that was found"""
+    drift = drifted_rooms(connection)
+    if drift and not dry_run:
+        for room_id, _, stored, actual, stored_available, actual_available in drift:
+            audit_counters(connection, room_id, stored, stored_available, actual, actual_available)
+        confirmed = confirmed_count()
+        connection.execute(
+            update(rooms_table)
+            .where(or_(
+                func.coalesce(rooms_table.c.current_occupancy, -1) != confirmed,
+                rooms_table.c.is_available.is_(None),
+                rooms_table.c.is_available != (confirmed < rooms_table.c.capacity),
+            ))
+            .values(current_occupancy=confirmed, is_available=confirmed < rooms_table.c.capacity)
+        )
+    return drift
+
+def _history_values(instance, key):
+    history = attributes.get_history(instance, key)
+    return [value for value in (*history.deleted, *history.added, *history.unchanged) if value is not None]
+
+def _cancel_active(bookings, touched):
+    for booking in bookings:
+        if booking.status == ACTIVE_STATUS:
+            booking.status = 'cancelled'
+            touched.add(booking.room_id)
+
+@event.listens_for(OrmSession, 'before_flush')
+def collect_touched_rooms(session, flush_context, instances):
+    touched = session.info.setdefault(PENDING_KEY, set())
+    for obj in session.new:
+        if isinstance(obj, Booking) and obj.room_id is not None:
+            touched.add(obj.room_id)
+    for obj in session.dirty:
+        if isinstance(obj, Booking):
+            state = attributes.instance_state(obj)
+            moved = state.attrs.room_id.history
+            if not (state.attrs.status.history.has_changes() or moved.has_changes()):
+                continue
+            touched.update(_history_values(obj, 'room_id'))
+            if moved.has_changes() and not moved.deleted:
+                # room_id was set without being loaded; the row still holds the old room
+                touched.add(session.connection().execute(
+                    select(bookings_table.c.room_id).where(bookings_table.c.id == obj.id)).scalar())
+        elif isinstance(obj, Room) and attributes.instance_state(obj).attrs.capacity.history.has_changes():
+            touched.add(obj.id)
+    for obj in session.deleted:
+        if isinstance(obj, Booking):
+            touched.update(_history_values(obj, 'room_id'))
+        elif isinstance(obj, Student):
+            # A deleted student's stays end with them
+            _cancel_active(obj.bookings, touched)
+        elif isinstance(obj, Room):
+            _cancel_active(obj.bookings, touched)
+            touched.discard(obj.id)
+
+@event.listens_for(OrmSession, 'after_flush')
+def refresh_touched_rooms(session, flush_context):
+    touched = session.info.pop(PENDING_KEY, None)
+    if touched:
+        touched.discard(None)
+        refresh_rooms(session.connection(), touched)
+        session.info['occupancy_expire'] = touched
+
+@event.listens_for(OrmSession, 'after_flush_postexec')
+def expire_refreshed_rooms(session, flush_context):
+    touched = session.info.pop('occupancy_expire', None)
+    if not touched:
+        return
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, Room) and obj.id in touched:
+            session.expire(obj, ['current_occupancy', 'is_available'])
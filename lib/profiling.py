@@ -0,0 +1,131 @@
+import json
+import sys
+import time
+from collections import Counter
+
+# Opt-in SQL profiler. When enabled it listens to cursor execution on every
+# engine, groups statements into actions (one CLI command or one menu
+# screen choice) and reports query counts, SQL time, the slowest statements
+# and statements repeated often enough to look like N+1 lookups.
+
+SLOWEST = 5
+N_PLUS_ONE_THRESHOLD = 10
+
+class ActionProfile:
+    """Statements recorded for one command or menu action"""
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.wall_ms = 0.0
+        self.statements = []   # (sql, duration_ms)
+
+    def record(self, statement, duration_ms):
+        self.statements.append((' '.join(statement.split()), duration_ms))
+
+    def close(self):
+        self.wall_ms = (time.perf_counter() - self.started) * 1000
+
+    def summary(self, slowest=SLOWEST, threshold=N_PLUS_ONE_THRESHOLD):
+        repeats = Counter(sql for sql, _ in self.statements)
+        return {
+            'action': self.name,
+            'queries': len(self.statements),
+            'sql_ms': round(sum(ms for _, ms in self.statements), 3),
+            'wall_ms': round(self.wall_ms, 3),
+            'slowest': [
+                {'sql': sql, 'ms': round(ms, 3)}
+                for sql, ms in sorted(self.statements, key=lambda s: s[1], reverse=True)[:slowest]
+            ],
+            'n_plus_one': [
+                {'sql': sql, 'count': count}
+                for sql, count in repeats.most_common() if count > threshold
+            ],
+        }
+
+class Profiler:
+    def __init__(self, output=None, threshold=N_PLUS_ONE_THRESHOLD, stream=None):
+        self.output = output
+        self.threshold = threshold
+        self.stream = stream or sys.stderr
+        self.actions = []
+        self.current = None
+
+    def checkpoint(self, name):
+        """Close the current action and start a new one called name"""
+        self._close_current()
+        self.current = ActionProfile(name)
+
+    def label(self, name):
+        if self.current is not None:
+            self.current.name = name
+
+    def _close_current(self):
+        if self.current is not None:
+            self.current.close()
+            if self.current.statements:
+                self.actions.append(self.current)
+            self.current = None
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('profile_started', []).append(time.perf_counter())
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info['profile_started'].pop()
+        if self.current is None:
+            self.current = ActionProfile('(startup)')
+        self.current.record(statement, (time.perf_counter() - started) * 1000)
+
+    def finish(self):
+        """Print the summary and write the JSON trace, if configured"""
+        self._close_current()
+        summaries = [action.summary(threshold=self.threshold) for action in self.actions]
+        for summary in summaries:
+            self.stream.write(
+                f"[profile] {summary['action']}: {summary['queries']} queries, "
+                f"{summary['sql_ms']:.1f} ms SQL, {summary['wall_ms']:.1f} ms total\n")
+            for slow in summary['slowest'][:3]:
+                self.stream.write(f"[profile]   {slow['ms']:8.2f} ms  {slow['sql'][:120]}\n")
+            for repeated in summary['n_plus_one']:
+                self.stream.write(
+                    f"[profile]   possible N+1: {repeated['count']}x  {repeated['sql'][:120]}\n")
+        if self.output:
+            with open(self.output, 'w', encoding='utf-8') as f:
+                json.dump({'actions': summaries}, f, indent=2)
+            self.stream.write(f"[profile] trace written to {self.output}\n")
+        return summaries
+
+_profiler = None
+
+def enable(output=None, threshold=N_PLUS_ONE_THRESHOLD):
+    """Start profiling every engine in this process"""
+    global _profiler
+    if _profiler is None:
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+        _profiler = Profiler(output, threshold)
+        event.listen(Engine, 'before_cursor_execute', _profiler.before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _profiler.after_cursor_execute)
+    return _profiler
+
+def disable():
+    """Stop profiling and return the recorded action summaries"""
+    global _profiler
+    if _profiler is None:
+        return []
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    event.remove(Engine, 'before_cursor_execute', _profiler.before_cursor_execute)
+    event.remove(Engine, 'after_cursor_execute', _profiler.after_cursor_execute)
+    profiler, _profiler = _profiler, None
+    return profiler.finish()
+
+def checkpoint(name):
+    """Mark the start of a new action; no-op unless profiling is enabled"""
+    if _profiler is not None:
+        _profiler.checkpoint(name)
+
+def label(name):
+    """Rename the current action once its purpose is known"""
+    if _profiler is not None:
+        _profiler.label(name)
@@ -0,0 +1,116 @@
+from sqlalchemy import select
+from .models import Student, Room, Manager, Booking, Complaint
+
+# Listing queries used by the menu and CLI. Each function issues a fixed
+# number of statements regardless of row count and returns flat row tuples
+# instead of ORM instances, so screens never fall into per-row lookups.
+#
+# Listings accept keyset paging arguments: `after_id` returns the rows that
+# follow an id, `before_id` the rows that precede it, and `limit` caps the
+# page. Paging seeks on the primary key, so every page costs the same no
+# matter how deep into the table it is.
+
+PAGE_SIZE = 20
+STREAM_BATCH = 1000
+
+def keyset_page(session, stmt, key, after_id=None, before_id=None, limit=None):
+    """Execute stmt ordered by key, restricted to one keyset page"""
+    if before_id is not None:
+        stmt = stmt.where(key < before_id).order_by(key.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return session.execute(stmt).all()[::-1]
+    if after_id is not None:
+        stmt = stmt.where(key > after_id)
+    stmt = stmt.order_by(key)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return session.execute(stmt).all()
+
+def iter_rows(session, rows_fn, after_id=None, batch=STREAM_BATCH):
+    """Yield every row of a listing, fetching one keyset batch at a time"""
+    while True:
+        rows = rows_fn(session, after_id=after_id, limit=batch)
+        yield from rows
+        if len(rows) < batch:
+            return
+        after_id = rows[-1][0]
+
+def student_rows(session, after_id=None, before_id=None, limit=None):
+    """(id, name, email, phone) for students"""
+    stmt = select(Student.id, Student.name, Student.email, Student.phone)
+    return keyset_page(session, stmt, Student.id, after_id, before_id, limit)
+
+def student_choices(session):
+    """(id, name) pick-list of students"""
+    stmt = select(Student.id, Student.name).order_by(Student.id)
+    return session.execute(stmt).all()
+
+def room_rows(session, after_id=None, before_id=None, limit=None):
+    """(id, room_number, capacity, current_occupancy, price, is_available) for rooms"""
+    stmt = select(
+        Room.id, Room.room_number, Room.capacity,
+        Room.current_occupancy, Room.price, Room.is_available
+    )
+    return keyset_page(session, stmt, Room.id, after_id, before_id, limit)
+
+def available_room_choices(session):
+    """(id, room_number, price) pick-list of rooms with free beds"""
+    stmt = select(Room.id, Room.room_number, Room.price).where(Room.is_available == True).order_by(Room.id)
+    return session.execute(stmt).all()
+
+def manager_rows(session, after_id=None, before_id=None, limit=None):
+    """(id, name, email, phone) for managers"""
+    stmt = select(Manager.id, Manager.name, Manager.email, Manager.phone)
+    return keyset_page(session, stmt, Manager.id, after_id, before_id, limit)
+
+def manager_choices(session):
+    """(id, name) pick-list of managers"""
+    stmt = select(Manager.id, Manager.name).order_by(Manager.id)
+    return session.execute(stmt).all()
+
+def booking_rows(session, after_id=None, before_id=None, limit=None):
+    """(id, student_name, room_number, check_in, check_out, status) in one JOIN"""
+    stmt = (
+        select(
+            Booking.id, Student.name, Room.room_number,
+            Booking.check_in_date, Booking.check_out_date, Booking.status
+        )
+        .outerjoin(Student, Booking.student_id == Student.id)
+        .outerjoin(Room, Booking.room_id == Room.id)
+    )
+    return keyset_page(session, stmt, Booking.id, after_id, before_id, limit)
+
+def complaint_rows(session, after_id=None, before_id=None, limit=None):
+    """(id, student_name, manager_name, title, status, date) in one JOIN"""
+    stmt = (
+        select(
+            Complaint.id, Student.name, Manager.name,
+            Complaint.title, Complaint.status, Complaint.date
+        )
+        .outerjoin(Student, Complaint.student_id == Student.id)
+        .outerjoin(Manager, Complaint.manager_id == Manager.id)
+    )
+    return keyset_page(session, stmt, Complaint.id, after_id, before_id, limit)
+
+def student_bookings(session, student_id):
+    """(room_number, status) for each booking of a student"""
+    stmt = (
+        select(Room.room_number, Booking.status)
+        .select_from(Booking)
+        .outerjoin(Room, Booking.room_id == Room.id)
+        .where(Booking.student_id == student_id)
+        .order_by(Booking.id)
+    )
+    return session.execute(stmt).all()
+
+def room_bookings(session, room_id):
+    """(student_name, status) for each booking of a room"""
+    stmt = (
+        select(Student.name, Booking.status)
+        .select_from(Booking)
+        .outerjoin(Student, Booking.student_id == Student.id)
+        .where(Booking.room_id == room_id)
+        .order_by(Booking.id)
+    )
+    return session.execute(stmt).all()
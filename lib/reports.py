@@ -0,0 +1,65 @@
+from sqlalchemy import select, func
+from .models import Room, Booking, Complaint, ArchivedBooking, ArchivedComplaint
+
+# Reporting engine shared by the menu and `report` CLI commands. All
+# aggregation happens in SQL; callers get plain row tuples back. Per-room
+# listings take stream=True to get an iterator that fetches rows in batches,
+# for printing large hostels without holding every row. Status counts read
+# live rows only unless include_archive adds the archived ones.
+
+COMPLAINT_STATUSES = ('open', 'in-progress', 'resolved')
+BOOKING_STATUSES = ('confirmed', 'completed', 'cancelled')
+STREAM_BATCH = 1000
+
+def _fetch(session, stmt, stream):
+    if stream:
+        return iter(session.execute(stmt.execution_options(yield_per=STREAM_BATCH)))
+    return session.execute(stmt).all()
+
+def occupancy_rows(session, stream=False):
+    """(room_number, capacity, occupied, occupancy_percent, price) per room"""
+    percent = 100.0 * Room.current_occupancy / func.nullif(Room.capacity, 0)
+    stmt = select(
+        Room.room_number, Room.capacity, Room.current_occupancy,
+        func.coalesce(percent, 0.0), Room.price
+    ).order_by(Room.id)
+    return _fetch(session, stmt, stream)
+
+def _status_counts(session, statuses, models):
+    counts = dict.fromkeys(statuses, 0)
+    for model in models:
+        for status, count in session.execute(select(model.status, func.count()).group_by(model.status)):
+            counts[status] = counts.get(status, 0) + count
+    return counts
+
+def complaint_status_counts(session, include_archive=False):
+    """Complaint counts keyed by status, with every known status present"""
+    models = (Complaint, ArchivedComplaint) if include_archive else (Complaint,)
+    return _status_counts(session, COMPLAINT_STATUSES, models)
+
+def booking_status_counts(session, include_archive=False):
+    """Booking counts keyed by status, with every known status present"""
+    models = (Booking, ArchivedBooking) if include_archive else (Booking,)
+    return _status_counts(session, BOOKING_STATUSES, models)
+
+def finance_summary(session):
+    """(total_rooms, total_capacity, total_occupied, total_revenue) in one aggregate"""
+    stmt = select(
+        func.count(Room.id),
+        func.coalesce(func.sum(Room.capacity), 0),
+        func.coalesce(func.sum(Room.current_occupancy), 0),
+        func.coalesce(func.sum(Room.price * Room.current_occupancy), 0),
+    )
+    return session.execute(stmt).one()
+
+def revenue_rows(session, stream=False):
+    """(room_number, capacity, occupied, price, revenue) per room"""
+    stmt = select(
+        Room.room_number, Room.capacity, Room.current_occupancy,
+        Room.price, Room.price * Room.current_occupancy
+    ).order_by(Room.id)
+    return _fetch(session, stmt, stream)
+
+def occupancy_rate(total_capacity, total_occupied):
+    """Overall occupancy percentage, 0 when there is no capacity"""
+    return (total_occupied / total_capacity) * 100 if total_capacity else 0.0
@@ -0,0 +1,165 @@
+import difflib
+import re
+from contextlib import contextmanager
+from sqlalchemy import text, select, or_, literal
+from .models import Student, Room, Complaint
+
+# Full-text search over students, rooms and complaints backed by an SQLite
+# FTS5 table. Triggers keep the index in step with the source tables; the
+# update triggers fire only when an indexed column changes, so occupancy
+# counters, statuses and the like never rewrite index rows. Each
+# entry's rowid encodes the source row (id * 4 + kind code), so updates and
+# deletes touch a single index row. Bulk loads pause the insert trigger and
+# index their rows with one INSERT ... SELECT instead. Queries match token
+# prefixes and, when a word matches nothing, retry with the closest
+# indexed terms.
+
+KINDS = {'student': 1, 'room': 2, 'complaint': 3}
+MIN_FUZZY_RATIO = 0.75
+
+# Source tables: (kind, table, indexed columns, title expression, body expression)
+SOURCES = [
+    ('student', 'students', 'name, email, phone',
+     "{row}.name", "coalesce({row}.email, '') || ' ' || coalesce({row}.phone, '')"),
+    ('room', 'rooms', 'room_number', "{row}.room_number", "''"),
+    ('complaint', 'complaints', 'title, description', "{row}.title", "coalesce({row}.description, '')"),
+]
+
+def schema_statements():
+    """DDL creating the FTS5 index, its vocabulary view and sync triggers"""
+    statements = [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        "kind UNINDEXED, ref_id UNINDEXED, title, body, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_vocab USING fts5vocab(search_index, 'row')",
+    ]
+    for kind, table, columns, title, body in SOURCES:
+        code = KINDS[kind]
+        insert = (f"INSERT INTO search_index (rowid, kind, ref_id, title, body) VALUES "
+                  f"(new.id * 4 + {code}, '{kind}', new.id, {title.format(row='new')}, {body.format(row='new')});")
+        delete = f"DELETE FROM search_index WHERE rowid = old.id * 4 + {code};"
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} BEGIN {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE OF {columns} ON {table} "
+            f"BEGIN {delete} {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} BEGIN {delete} END",
+        ]
+    return statements
+
+def _index_select(kind, table, title, body):
+    return (f"INSERT INTO search_index (rowid, kind, ref_id, title, body) "
+            f"SELECT id * 4 + {KINDS[kind]}, '{kind}', id, {title.format(row=table)}, {body.format(row=table)} "
+            f"FROM {table}")
+
+def rebuild_statements():
+    """Statements that repopulate the index from the source tables"""
+    return ["DELETE FROM search_index"] + [
+        _index_select(kind, table, title, body) for kind, table, _, title, body in SOURCES]
+
+@contextmanager
+def bulk_insert(connection, kind, after_id):
+    """Pause kind's insert trigger for the block, then index its rows with ids above after_id
+
+    The trigger is dropped and recreated inside the caller's transaction,
+    so a rollback restores it too. The caller must hold the write lock
+    from before reading after_id and insert without explicit ids, so the
+    new rows are exactly those above it.
+    """
+    kind, table, _, title, body = next(source for source in SOURCES if source[0] == kind)
+    trigger = f"{table}_search_insert"
+    sql = None
+    if connection.dialect.name == 'sqlite':
+        sql = connection.execute(text("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = :name"),
+                                 {'name': trigger}).scalar()
+    if sql is None:
+        yield
+        return
+    connection.execute(text(f"DROP TRIGGER {trigger}"))
+    try:
+        yield
+        connection.execute(text(_index_select(kind, table, title, body) + " WHERE id > :after_id"),
+                           {'after_id': after_id})
+    finally:
+        connection.execute(text(sql))
+
+def install(connection, rebuild=True):
+    """Create the search index on an SQLite connection and optionally backfill it"""
+    if connection.dialect.name != 'sqlite':
+        return False
+    for statement in schema_statements():
+        connection.execute(text(statement))
+    if rebuild:
+        for statement in rebuild_statements():
+            connection.execute(text(statement))
+    return True
+
+def tokenize(query):
+    """Lower-cased word tokens of a free-text query"""
+    return re.findall(r"\w+", query.lower())
+
+def match_expression(tokens):
+    """FTS5 MATCH string requiring every token as a prefix"""
+    return ' AND '.join(f'"{token}"*' for token in tokens)
+
+def closest_terms(session, token, limit=3):
+    """Indexed terms that look like a misspelling of token"""
+    # Only scan vocabulary sharing the first letter; fts5vocab seeks on term ranges
+    first = token[0]
+    candidates = session.execute(
+        text("SELECT term FROM search_vocab WHERE term >= :low AND term < :high"),
+        {'low': first, 'high': chr(ord(first) + 1)},
+    ).scalars().all()
+    return difflib.get_close_matches(token, candidates, n=limit, cutoff=MIN_FUZZY_RATIO)
+
+def _fts_search(session, match, kinds, limit):
+    kind_filter = ""
+    params = {'query': match, 'limit': limit}
+    if kinds:
+        kind_filter = " AND kind IN (" + ", ".join(f":kind{i}" for i in range(len(kinds))) + ")"
+        params.update((f"kind{i}", kind) for i, kind in enumerate(kinds))
+    stmt = text(
+        "SELECT kind, ref_id, title, snippet(search_index, -1, '[', ']', '...', 8) "
+        "FROM search_index WHERE search_index MATCH :query" + kind_filter +
+        " ORDER BY rank LIMIT :limit"
+    )
+    return session.execute(stmt, params).all()
+
+def _like_search(session, tokens, kinds, limit):
+    # Fallback for databases without FTS5 (e.g. PostgreSQL): substring ILIKE scans
+    sources = [
+        ('student', Student, Student.name, [Student.name, Student.email, Student.phone], Student.email),
+        ('room', Room, Room.room_number, [Room.room_number], literal('')),
+        ('complaint', Complaint, Complaint.title, [Complaint.title, Complaint.description], Complaint.description),
+    ]
+    rows = []
+    for kind, model, title, columns, body in sources:
+        if kinds and kind not in kinds:
+            continue
+        conditions = [or_(*(column.ilike(f"%{token}%") for column in columns)) for token in tokens]
+        stmt = select(literal(kind), model.id, title, body).where(*conditions).limit(limit - len(rows))
+        rows.extend(session.execute(stmt).all())
+        if len(rows) >= limit:
+            break
+    return rows
+
+def search(session, query, kinds=None, limit=20, fuzzy=True):
+    """(kind, ref_id, title, snippet) rows matching query, best first"""
+    tokens = tokenize(query)
+    if not tokens:
+        return []
+    if session.get_bind().dialect.name != 'sqlite':
+        return _like_search(session, tokens, kinds, limit)
+    rows = _fts_search(session, match_expression(tokens), kinds, limit)
+    if rows or not fuzzy:
+        return rows
+    # Swap each word that matches nothing for its nearest indexed terms
+    corrected = []
+    for token in tokens:
+        if _fts_search(session, match_expression([token]), kinds, 1):
+            corrected.append(f'"{token}"*')
+            continue
+        alternatives = closest_terms(session, token)
+        if not alternatives:
+            return []
+        corrected.append('(' + ' OR '.join(f'"{term}"' for term in alternatives) + ')')
+    return _fts_search(session, ' AND '.join(corrected), kinds, limit)
@@ -0,0 +1,309 @@
+import asyncio
+import json
+import re
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from urllib.parse import urlsplit, parse_qs
+from sqlalchemy.exc import OperationalError
+from .models import Session
+from .bookings import is_locked_error
+from .queries import PAGE_SIZE
+from . import services, search, cache, audit
+
+# Local HTTP/JSON API over lib.services. One asyncio loop accepts
+# keep-alive connections and parses requests; database work runs on a
+# bounded thread pool sharing the pooled engine, one scoped session per
+# thread. A semaphore caps in-flight database calls at the pool size so a
+# burst of clients queues in the loop instead of waiting on the pool.
+
+MAX_BODY = 1024 * 1024
+MAX_PAGE = 500
+REASONS = {200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+# Request helpers
+def _int(value, name):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise HttpError(400, f"'{name}' must be an integer")
+
+def _date(value, name):
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise HttpError(400, f"'{name}' must be a date (YYYY-MM-DD)")
+
+def _str(value, name):
+    # None passes through for optional fields; numbers and objects would fail deep in the validators
+    if value is not None and not isinstance(value, str):
+        raise HttpError(400, f"'{name}' must be a string")
+    return value
+
+def _required(body, *names):
+    missing = [name for name in names if body.get(name) in (None, '')]
+    if missing:
+        raise HttpError(400, f"missing field(s): {', '.join(missing)}")
+    return [body[name] for name in names]
+
+def _page(query):
+    limit = min(_int(query.get('limit', PAGE_SIZE), 'limit'), MAX_PAGE)
+    after_id = _int(query['after_id'], 'after_id') if 'after_id' in query else None
+    return after_id, limit
+
+# Route handlers: (session, params, query, body) -> (status, payload)
+def _lister(list_fn):
+    def handler(session, params, query, body):
+        after_id, limit = _page(query)
+        return 200, list_fn(session, after_id=after_id, limit=limit)
+    return handler
+
+def _getter(get_fn):
+    return lambda session, params, query, body: (200, get_fn(session, _int(params['id'], 'id')))
+
+def _deleter(delete_fn):
+    return lambda session, params, query, body: (200, delete_fn(session, _int(params['id'], 'id')))
+
+def _person_creator(add_fn):
+    def handler(session, params, query, body):
+        name, email, phone = _required(body, 'name', 'email', 'phone')
+        return 201, add_fn(session, _str(name, 'name'), _str(email, 'email'), _str(phone, 'phone'))
+    return handler
+
+def _person_updater(update_fn):
+    def handler(session, params, query, body):
+        return 200, update_fn(session, _int(params['id'], 'id'), _str(body.get('name'), 'name'),
+                              _str(body.get('email'), 'email'), _str(body.get('phone'), 'phone'))
+    return handler
+
+def add_room(session, params, query, body):
+    number, capacity, price = _required(body, 'room_number', 'capacity', 'price')
+    return 201, services.add_room(session, _str(number, 'room_number'), _int(capacity, 'capacity'),
+                                  _int(price, 'price'))
+
+def update_room(session, params, query, body):
+    capacity = _int(body['capacity'], 'capacity') if 'capacity' in body else None
+    price = _int(body['price'], 'price') if 'price' in body else None
+    return 200, services.update_room(session, _int(params['id'], 'id'), _str(body.get('room_number'), 'room_number'),
+                                     capacity, price)
+
+def available_rooms(session, params, query, body):
+    check_in = _date(query.get('check_in'), 'check_in')
+    check_out = _date(query.get('check_out'), 'check_out')
+    if check_out <= check_in:
+        raise HttpError(400, "check_out must be after check_in")
+    # Served from the lookup cache; commits made through this server invalidate it
+    rows = cache.rooms_with_free_beds(session, check_in, check_out, _int(query.get('beds', 1), 'beds'))
+    after_id, limit = _page(query)
+    if after_id is not None:
+        rows = [row for row in rows if row[0] > after_id]
+    return 200, [dict(zip(('id', 'room_number', 'price', 'free_beds'), row)) for row in rows[:limit]]
+
+def create_booking(session, params, query, body):
+    student_id, room_id, check_in, check_out = _required(body, 'student_id', 'room_id', 'check_in', 'check_out')
+    return 201, services.create_booking(session, _int(student_id, 'student_id'), _int(room_id, 'room_id'),
+                                        _date(check_in, 'check_in'), _date(check_out, 'check_out'))
+
+def cancel_booking(session, params, query, body):
+    return 200, services.cancel_booking(session, _int(params['id'], 'id'))
+
+def file_complaint(session, params, query, body):
+    student_id, title = _required(body, 'student_id', 'title')
+    # Without a manager_id the service assigns the least-loaded manager
+    manager_id = body.get('manager_id')
+    manager_id = _int(manager_id, 'manager_id') if manager_id not in (None, '') else None
+    return 201, services.file_complaint(session, _int(student_id, 'student_id'), manager_id,
+                                        _str(title, 'title'), _str(body.get('description', ''), 'description'))
+
+def update_complaint(session, params, query, body):
+    status, = _required(body, 'status')
+    return 200, services.set_complaint_status(session, _int(params['id'], 'id'), _str(status, 'status'))
+
+def search_records(session, params, query, body):
+    text = query.get('q', '')
+    kinds = [kind for kind in query.get('kind', '').split(',') if kind] or None
+    rows = search.search(session, text, kinds, min(_int(query.get('limit', 20), 'limit'), MAX_PAGE))
+    return 200, [dict(zip(('kind', 'id', 'title', 'snippet'), row)) for row in rows]
+
+def health(session, params, query, body):
+    return 200, {'status': 'ok'}
+
+ROUTES = [
+    ('GET', '/health', health),
+    ('GET', '/students', _lister(services.list_students)),
+    ('POST', '/students', _person_creator(services.add_student)),
+    ('GET', '/students/{id}', _getter(services.get_student)),
+    ('PATCH', '/students/{id}', _person_updater(services.update_student)),
+    ('DELETE', '/students/{id}', _deleter(services.delete_student)),
+    ('GET', '/rooms', _lister(services.list_rooms)),
+    ('POST', '/rooms', add_room),
+    ('GET', '/rooms/available', available_rooms),
+    ('GET', '/rooms/{id}', _getter(services.get_room)),
+    ('PATCH', '/rooms/{id}', update_room),
+    ('DELETE', '/rooms/{id}', _deleter(services.delete_room)),
+    ('GET', '/managers', _lister(services.list_managers)),
+    ('POST', '/managers', _person_creator(services.add_manager)),
+    ('GET', '/managers/{id}', _getter(services.get_manager)),
+    ('PATCH', '/managers/{id}', _person_updater(services.update_manager)),
+    ('DELETE', '/managers/{id}', _deleter(services.delete_manager)),
+    ('GET', '/bookings', _lister(services.list_bookings)),
+    ('POST', '/bookings', create_booking),
+    ('GET', '/bookings/{id}', _getter(services.get_booking)),
+    ('POST', '/bookings/{id}/cancel', cancel_booking),
+    ('GET', '/complaints', _lister(services.list_complaints)),
+    ('POST', '/complaints', file_complaint),
+    ('GET', '/complaints/{id}', _getter(services.get_complaint)),
+    ('PATCH', '/complaints/{id}', update_complaint),
+    ('GET', '/search', search_records),
+]
+
+def compile_routes(routes):
+    """[(method, regex, handler)] with {name} segments as named groups"""
+    return [(method, re.compile('^' + re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', path) + '$'), handler)
+            for method, path, handler in routes]
+
+def dispatch(routes, method, path):
+    """(handler, params) for a request; raises HttpError 404/405"""
+    allowed = False
+    for route_method, pattern, handler in routes:
+        match = pattern.match(path)
+        if match:
+            if route_method == method:
+                return handler, match.groupdict()
+            allowed = True
+    raise HttpError(405 if allowed else 404, "method not allowed" if allowed else "no such endpoint")
+
+def run_handler(handler, params, query, body, actor=None):
+    """Call a handler on this worker thread's session and release it afterwards"""
+    audit.set_actor(actor)
+    session = Session()
+    try:
+        return handler(session, params, query, body)
+    except services.NotFoundError as e:
+        session.rollback()
+        return 404, {'error': str(e)}
+    except services.ServiceError as e:
+        session.rollback()
+        return 400, {'error': str(e)}
+    except HttpError as e:
+        session.rollback()
+        return e.status, {'error': str(e)}
+    except OperationalError as e:
+        session.rollback()
+        if is_locked_error(e):
+            return 503, {'error': "database is busy, retry"}
+        raise
+    finally:
+        Session.remove()
+
+class ApiServer:
+    def __init__(self, host='127.0.0.1', port=8080, workers=5, log=None):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.log = log or sys.stderr
+        self.routes = compile_routes(ROUTES)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='hostel-db')
+        self.slots = None
+        self.server = None
+
+    async def start(self):
+        self.slots = asyncio.Semaphore(self.workers)
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port, backlog=1024)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        await self.start()
+        self.log.write(f"Serving on http://{self.host}:{self.port} with {self.workers} database workers\n")
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=True)
+
+    async def read_request(self, reader):
+        """(method, target, headers, body) or None when the client closed the connection"""
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode('latin-1').split()
+        except ValueError:
+            raise HttpError(400, "malformed request line")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = _int(headers.get('content-length', 0), 'content-length')
+        if length > MAX_BODY:
+            raise HttpError(413, "request body too large")
+        body = await reader.readexactly(length) if length else b''
+        headers['_version'] = version
+        return method.upper(), target, headers, body
+
+    async def respond(self, request):
+        method, target, headers, raw_body = request
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        handler, params = dispatch(self.routes, method, url.path.rstrip('/') or '/')
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            raise HttpError(400, "body must be JSON")
+        if not isinstance(body, dict):
+            raise HttpError(400, "body must be a JSON object")
+        async with self.slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, run_handler, handler, params, query, body,
+                                              f"api: {method} {url.path}")
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await self.read_request(reader)
+                    if request is None:
+                        break
+                    headers = request[2]
+                    keep_alive = (headers.get('connection', '').lower() != 'close'
+                                  and headers['_version'] == 'HTTP/1.1')
+                    status, payload = await self.respond(request)
+                except HttpError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception:
+                    traceback.print_exc(file=self.log)
+                    status, payload = 500, {'error': "internal error"}
+                data = json.dumps(payload, default=str).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+def serve(host='127.0.0.1', port=8080, workers=5):
+    """Run the API server until interrupted"""
+    try:
+        asyncio.run(ApiServer(host, port, workers).serve_forever())
+    except KeyboardInterrupt:
+        pass
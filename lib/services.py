@@ -0,0 +1,240 @@
+from sqlalchemy import select
+from .models import Student, Room, Manager, Booking, Complaint
+from .helpers import validate_email, validate_phone
+from .reports import COMPLAINT_STATUSES
+from . import queries, availability, bookings, complaints
+
+# Non-interactive operations on students, rooms, managers, bookings and
+# complaints. Each takes the session first, validates its arguments, and
+# returns plain dicts, so the CLI can print them as tables or JSON and batch
+# jobs can call them directly. Failures raise ServiceError with the same
+# messages the menu shows. Pass commit=False to group many writes into one
+# transaction and commit it yourself; bookings always commit, since they
+# run under the lock-retry loop in lib.bookings.
+
+class ServiceError(Exception):
+    """Raised when an operation is rejected"""
+
+class NotFoundError(ServiceError):
+    """Raised when the record an operation names does not exist"""
+
+def as_dict(obj):
+    """Column values of a model instance"""
+    return {column.key: getattr(obj, column.key) for column in obj.__table__.columns}
+
+def _rows(keys, rows):
+    return [dict(zip(keys, row)) for row in rows]
+
+def _get(session, model, object_id, label):
+    obj = session.get(model, object_id)
+    if obj is None:
+        raise NotFoundError(f"{label} with ID {object_id} not found!")
+    return obj
+
+def _save(session, commit):
+    if commit:
+        session.commit()
+    else:
+        session.flush()
+
+def _check_contact(email, phone):
+    if email is not None and not validate_email(email):
+        raise ServiceError("Invalid email format!")
+    if phone is not None and not validate_phone(phone):
+        raise ServiceError("Invalid phone number! Must start with 07 and be 10 digits.")
+
+def _check_unique(session, column, value, label, exclude_id=None):
+    stmt = select(column.class_.id).where(column == value)
+    if exclude_id is not None:
+        stmt = stmt.where(column.class_.id != exclude_id)
+    if session.execute(stmt.limit(1)).first():
+        raise ServiceError(f"A {label} already exists!")
+
+def _update(session, obj, changes, commit):
+    for key, value in changes.items():
+        if value is not None:
+            setattr(obj, key, value)
+    _save(session, commit)
+    return as_dict(obj)
+
+# Students
+STUDENT_KEYS = ('id', 'name', 'email', 'phone')
+
+def add_student(session, name, email, phone, commit=True):
+    _check_contact(email, phone)
+    _check_unique(session, Student.email, email, "student with this email")
+    student = Student(name=name, email=email, phone=phone)
+    session.add(student)
+    _save(session, commit)
+    return as_dict(student)
+
+def get_student(session, student_id):
+    student = _get(session, Student, student_id, "Student")
+    details = as_dict(student)
+    details['bookings'] = _rows(('room_number', 'status'), queries.student_bookings(session, student_id))
+    return details
+
+def update_student(session, student_id, name=None, email=None, phone=None, commit=True):
+    student = _get(session, Student, student_id, "Student")
+    _check_contact(email, phone)
+    if email is not None:
+        _check_unique(session, Student.email, email, "student with this email", student_id)
+    return _update(session, student, {'name': name, 'email': email, 'phone': phone}, commit)
+
+def delete_student(session, student_id, commit=True):
+    student = _get(session, Student, student_id, "Student")
+    details = as_dict(student)
+    session.delete(student)
+    _save(session, commit)
+    return details
+
+def list_students(session, after_id=None, limit=None):
+    return _rows(STUDENT_KEYS, queries.student_rows(session, after_id=after_id, limit=limit))
+
+# Rooms
+ROOM_KEYS = ('id', 'room_number', 'capacity', 'current_occupancy', 'price', 'is_available')
+
+def _check_room(capacity, price):
+    if capacity is not None and capacity < 1:
+        raise ServiceError("Capacity must be at least 1!")
+    if price is not None and price < 0:
+        raise ServiceError("Price cannot be negative!")
+
+def add_room(session, room_number, capacity, price, commit=True):
+    _check_room(capacity, price)
+    _check_unique(session, Room.room_number, room_number, "room with this number")
+    room = Room(room_number=room_number, capacity=capacity, price=price)
+    session.add(room)
+    _save(session, commit)
+    return as_dict(room)
+
+def get_room(session, room_id):
+    room = _get(session, Room, room_id, "Room")
+    details = as_dict(room)
+    details['bookings'] = _rows(('student_name', 'status'), queries.room_bookings(session, room_id))
+    return details
+
+def update_room(session, room_id, room_number=None, capacity=None, price=None, commit=True):
+    room = _get(session, Room, room_id, "Room")
+    _check_room(capacity, price)
+    if room_number is not None:
+        _check_unique(session, Room.room_number, room_number, "room with this number", room_id)
+    return _update(session, room, {'room_number': room_number, 'capacity': capacity, 'price': price}, commit)
+
+def delete_room(session, room_id, commit=True):
+    room = _get(session, Room, room_id, "Room")
+    details = as_dict(room)
+    session.delete(room)
+    _save(session, commit)
+    return details
+
+def list_rooms(session, after_id=None, limit=None):
+    return _rows(ROOM_KEYS, queries.room_rows(session, after_id=after_id, limit=limit))
+
+def available_rooms(session, check_in, check_out, beds=1):
+    if check_out <= check_in:
+        raise ServiceError("Check-out date must be after check-in date!")
+    rows = availability.rooms_with_free_beds(session, check_in, check_out, beds)
+    return _rows(('id', 'room_number', 'price', 'free_beds'), rows)
+
+# Managers
+MANAGER_KEYS = ('id', 'name', 'email', 'phone')
+
+def add_manager(session, name, email, phone, commit=True):
+    _check_contact(email, phone)
+    _check_unique(session, Manager.email, email, "manager with this email")
+    manager = Manager(name=name, email=email, phone=phone)
+    session.add(manager)
+    _save(session, commit)
+    return as_dict(manager)
+
+def get_manager(session, manager_id):
+    return as_dict(_get(session, Manager, manager_id, "Manager"))
+
+def update_manager(session, manager_id, name=None, email=None, phone=None, commit=True):
+    manager = _get(session, Manager, manager_id, "Manager")
+    _check_contact(email, phone)
+    if email is not None:
+        _check_unique(session, Manager.email, email, "manager with this email", manager_id)
+    return _update(session, manager, {'name': name, 'email': email, 'phone': phone}, commit)
+
+def delete_manager(session, manager_id, commit=True):
+    manager = _get(session, Manager, manager_id, "Manager")
+    details = as_dict(manager)
+    session.delete(manager)
+    _save(session, commit)
+    return details
+
+def list_managers(session, after_id=None, limit=None):
+    return _rows(MANAGER_KEYS, queries.manager_rows(session, after_id=after_id, limit=limit))
+
+# Bookings
+BOOKING_KEYS = ('id', 'student_name', 'room_number', 'check_in_date', 'check_out_date', 'status')
+
+def create_booking(session, student_id, room_id, check_in, check_out):
+    try:
+        return as_dict(bookings.create_booking(session, student_id, room_id, check_in, check_out))
+    except bookings.BookingError as e:
+        raise ServiceError(str(e)) from e
+
+def cancel_booking(session, booking_id):
+    try:
+        bookings.cancel_booking(session, booking_id)
+    except bookings.BookingError as e:
+        raise ServiceError(str(e)) from e
+    return get_booking(session, booking_id)
+
+def get_booking(session, booking_id):
+    return as_dict(_get(session, Booking, booking_id, "Booking"))
+
+def list_bookings(session, after_id=None, limit=None):
+    return _rows(BOOKING_KEYS, queries.booking_rows(session, after_id=after_id, limit=limit))
+
+# Complaints
+COMPLAINT_KEYS = ('id', 'student_name', 'manager_name', 'title', 'status', 'date')
+
+def file_complaint(session, student_id, manager_id, title, description='', commit=True):
+    """File a complaint; manager_id None assigns the least-loaded manager"""
+    _get(session, Student, student_id, "Student")
+    if not title:
+        raise ServiceError("Complaint title is required!")
+    if manager_id is None:
+        manager_id = complaints.least_loaded_manager(session)
+        if manager_id is None:
+            raise ServiceError("No managers available to assign!")
+    else:
+        _get(session, Manager, manager_id, "Manager")
+    complaint = Complaint(student_id=student_id, manager_id=manager_id,
+                          title=title, description=description, status='open')
+    session.add(complaint)
+    _save(session, commit)
+    return as_dict(complaint)
+
+def get_complaint(session, complaint_id):
+    return as_dict(_get(session, Complaint, complaint_id, "Complaint"))
+
+def set_complaint_status(session, complaint_id, status, commit=True):
+    if status not in COMPLAINT_STATUSES:
+        raise ServiceError(f"Status must be one of: {', '.join(COMPLAINT_STATUSES)}!")
+    complaint = _get(session, Complaint, complaint_id, "Complaint")
+    return _update(session, complaint, {'status': status}, commit)
+
+def list_complaints(session, after_id=None, limit=None):
+    return _rows(COMPLAINT_KEYS, queries.complaint_rows(session, after_id=after_id, limit=limit))
+
+QUEUE_KEYS = ('id', 'student_id', 'title', 'status', 'date')
+
+def next_complaints(session, manager_id, limit=1, status='open'):
+    _get(session, Manager, manager_id, "Manager")
+    return _rows(QUEUE_KEYS, complaints.next_complaints(session, manager_id, limit, status))
+
+def claim_next_complaint(session, manager_id):
+    """Start work on a manager's oldest open complaint; None when the queue is empty"""
+    _get(session, Manager, manager_id, "Manager")
+    row = complaints.claim_next(session, manager_id)
+    return dict(zip(QUEUE_KEYS, row)) if row else None
+
+def complaint_backlogs(session, manager_id=None):
+    if manager_id is not None:
+        _get(session, Manager, manager_id, "Manager")
+    return _rows(('manager_id', 'name', 'open', 'in_progress'), complaints.backlog_counts(session, manager_id))
@@ -0,0 +1,146 @@
+from datetime import date, timedelta
+from sqlalchemy import select, func, cast, String, union_all
+from .models import Room, Booking, ArchivedBooking, RoomSnapshot, DailySnapshot
+
+# Materialised daily history. `capture` sweeps bookings once per chunk of
+# days and appends one row per occupied room per day plus one hostel-wide
+# total per day, starting after the last captured day. Trend reports read
+# the daily totals (one row per day) or one room's rows, so their cost
+# depends on the day range, not on how many bookings exist. A day counts
+# the confirmed and completed stays covering it. Prices are those at
+# capture time, and revenue is price x occupied beds, the same estimate as
+# the finance summary.
+
+OCCUPYING_STATUSES = ('confirmed', 'completed')
+CHUNK_DAYS = 31
+INSERT_BATCH = 5000
+DEFAULT_HISTORY_DAYS = 366
+
+def last_captured_day(session):
+    return session.execute(select(func.max(DailySnapshot.day))).scalar()
+
+def first_uncaptured_day(session, until, since=None):
+    """Day the next capture starts from"""
+    last = last_captured_day(session)
+    if last is not None:
+        return max(last + timedelta(days=1), since or last)
+    if since is not None:
+        return since
+    earliest = min(filter(None, (
+        session.execute(select(func.min(model.check_in_date)).where(model.status.in_(OCCUPYING_STATUSES))).scalar()
+        for model in (Booking, ArchivedBooking)
+    )), default=None)
+    floor = until - timedelta(days=DEFAULT_HISTORY_DAYS - 1)
+    return max(earliest, floor) if earliest else until
+
+def occupancy_by_room(session, start, end):
+    """{room_id: [occupied beds per day]} for the days start..end inclusive"""
+    days = (end - start).days + 1
+    # Completed stays may already have been moved to the archive
+    stmt = union_all(*(
+        select(model.room_id, model.check_in_date, model.check_out_date).where(
+            model.status.in_(OCCUPYING_STATUSES),
+            model.check_in_date <= end,
+            model.check_out_date > start,
+        )
+        for model in (Booking, ArchivedBooking)
+    ))
+    # Difference arrays: +1 on the first night, -1 on check-out day
+    deltas = {}
+    for room_id, check_in, check_out in session.execute(stmt):
+        delta = deltas.get(room_id)
+        if delta is None:
+            delta = deltas[room_id] = [0] * (days + 1)
+        delta[max((check_in - start).days, 0)] += 1
+        delta[min((check_out - start).days, days)] -= 1
+    occupancy = {}
+    for room_id, delta in deltas.items():
+        running, counts = 0, []
+        for step in delta[:days]:
+            running += step
+            counts.append(running)
+        occupancy[room_id] = counts
+    return occupancy
+
+def _insert_rows(connection, table, columns, rows):
+    # Plain DBAPI executemany: the ORM bulk path spends most of a backfill
+    # building per-row parameter dicts
+    marker = '?' if connection.dialect.paramstyle == 'qmark' else '%s'
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join([marker] * len(columns))})"
+    for batch in range(0, len(rows), INSERT_BATCH):
+        connection.exec_driver_sql(sql, rows[batch:batch + INSERT_BATCH])
+
+def capture_chunk(session, rooms, start, end):
+    """Append snapshot rows for start..end; returns the number of room rows"""
+    days = (end - start).days + 1
+    labels = [(start + timedelta(days=offset)).isoformat() for offset in range(days)]
+    total_capacity = sum(capacity or 0 for capacity, _ in rooms.values())
+    occupied = [0] * days
+    revenue = [0] * days
+    rows = []
+    for room_id, counts in occupancy_by_room(session, start, end).items():
+        if room_id not in rooms:
+            continue
+        capacity, price = rooms[room_id]
+        price = price or 0
+        for offset, count in enumerate(counts):
+            if count:
+                rows.append((room_id, labels[offset], count, capacity, price, price * count))
+                occupied[offset] += count
+                revenue[offset] += price * count
+    connection = session.connection()
+    _insert_rows(connection, RoomSnapshot.__tablename__,
+                 ('room_id', 'day', 'occupied', 'capacity', 'price', 'revenue'), rows)
+    _insert_rows(connection, DailySnapshot.__tablename__, ('day', 'rooms', 'capacity', 'occupied', 'revenue'),
+                 [(labels[offset], len(rooms), total_capacity, occupied[offset], revenue[offset])
+                  for offset in range(days)])
+    return len(rows)
+
+def capture(session, until=None, since=None, chunk_days=CHUNK_DAYS):
+    """Snapshot every uncaptured day up to until (default yesterday); returns (days, room_rows)"""
+    until = until or date.today() - timedelta(days=1)
+    start = first_uncaptured_day(session, until, since)
+    rooms = {room_id: (capacity, price)
+             for room_id, capacity, price in session.execute(select(Room.id, Room.capacity, Room.price))}
+    captured_days = captured_rows = 0
+    while start <= until:
+        end = min(start + timedelta(days=chunk_days - 1), until)
+        captured_rows += capture_chunk(session, rooms, start, end)
+        # Commit per chunk so an interrupted backfill resumes where it stopped
+        session.commit()
+        captured_days += (end - start).days + 1
+        start = end + timedelta(days=1)
+    return captured_days, captured_rows
+
+def _month(column):
+    return func.substr(cast(column, String), 1, 7)
+
+def monthly_trend(session, start=None, end=None):
+    """(month, days, avg_occupied, avg_capacity, avg_revenue) per captured month"""
+    month = _month(DailySnapshot.day)
+    stmt = select(
+        month, func.count(), func.avg(DailySnapshot.occupied), func.avg(DailySnapshot.capacity),
+        func.avg(DailySnapshot.revenue),
+    ).group_by(month).order_by(month)
+    if start:
+        stmt = stmt.where(DailySnapshot.day >= start)
+    if end:
+        stmt = stmt.where(DailySnapshot.day <= end)
+    return session.execute(stmt).all()
+
+def room_trend(session, room_id, start=None, end=None):
+    """(month, occupied_days, bed_nights, peak_occupied, revenue_total) for one room"""
+    month = _month(RoomSnapshot.day)
+    stmt = select(
+        month, func.count(), func.sum(RoomSnapshot.occupied), func.max(RoomSnapshot.occupied),
+        func.sum(RoomSnapshot.revenue),
+    ).where(RoomSnapshot.room_id == room_id).group_by(month).order_by(month)
+    if start:
+        stmt = stmt.where(RoomSnapshot.day >= start)
+    if end:
+        stmt = stmt.where(RoomSnapshot.day <= end)
+    return session.execute(stmt).all()
+
+def change_percent(current, previous):
+    """Relative change from previous to current, None when there is no base"""
+    return (current - previous) / previous * 100 if previous else None
@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from lib.config import build_engine
+from lib.models import Student, Room, Manager
+from lib.commands.core import create_schema
+
+# Every test gets its own SQLite file under tmp_path, with the same schema
+# `initdb` creates. HOSTEL_* settings from the environment or a .env file
+# are ignored so a developer's configuration never leaks into a run.
+
+@pytest.fixture
+def database_url(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'hostel.db'}"
+    monkeypatch.setenv('HOSTEL_ENV_FILE', str(tmp_path / 'missing.env'))
+    monkeypatch.setenv('HOSTEL_DATABASE_URL', url)
+    return url
+
+@pytest.fixture
+def engine(database_url):
+    engine = build_engine(url=database_url)
+    create_schema(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def hostel(session):
+    """Kenyan sample data: two students, two rooms and two managers"""
+    session.add_all([
+        Student(name="Wanjiku Mwangi", email="wanjiku@student.ku.ac.ke", phone="0712345678"),
+        Student(name="Otieno Owino", email="owino@student.uonbi.ac.ke", phone="0723456789"),
+        Room(room_number="G12", capacity=4, price=15000),
+        Room(room_number="T7", capacity=2, price=25000),
+        Manager(name="Kamau Githinji", email="k.githinji@uonhostels.com", phone="0701234567"),
+        Manager(name="Nyambura Wairimu", email="n.wairimu@kuhostels.co.ke", phone="0712345678"),
+    ])
+    session.commit()
+    return session
+
+@pytest.fixture
+def statements(engine):
+    """List that collects every SQL statement the engine runs"""
+    seen = []
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement)
+    event.listen(engine, 'before_cursor_execute', collect)
+    yield seen
+    event.remove(engine, 'before_cursor_execute', collect)
@@ -0,0 +1,44 @@
+from datetime import date
+from sqlalchemy import select
+from lib.allocation import AllocationRequest, allocate
+from lib.bookings import create_booking
+from lib.models import Student, Room, Booking
+
+JAN, FEB, MAR, APR = (date(2027, month, 1) for month in range(1, 5))
+
+def setup(session):
+    """T7 (two beds) full in January; returns (t7, new student ids)"""
+    session.add_all([Student(name=f"Akinyi Ndungu {i}", email=f"akinyi{i}@students.ku.ac.ke", phone="0789012345")
+                     for i in range(2)])
+    session.commit()
+    wanjiku, otieno, *new = session.execute(select(Student.id).order_by(Student.id)).scalars().all()
+    t7 = session.query(Room).filter_by(room_number="T7").one()
+    create_booking(session, wanjiku, t7.id, JAN, FEB)
+    create_booking(session, otieno, t7.id, JAN, FEB)
+    return t7, new
+
+def test_beds_free_in_the_window_are_allocated(hostel):
+    t7, (first, second) = setup(hostel)
+    requests = [AllocationRequest(1, first, capacity=2), AllocationRequest(2, second, capacity=2)]
+    assignments, rejections = allocate(hostel, requests, MAR, APR)
+    assert rejections == []
+    assert [room_id for _, room_id, _ in assignments] == [t7.id, t7.id]
+    assert hostel.query(Booking).filter_by(room_id=t7.id, check_in_date=MAR).count() == 2
+
+def test_full_window_and_duplicates_are_rejected(hostel):
+    _, (first, second) = setup(hostel)
+    g12 = hostel.query(Room).filter_by(room_number="G12").one()
+    requests = [AllocationRequest(1, first), AllocationRequest(2, first),
+                AllocationRequest(3, 999), AllocationRequest(4, second, capacity=2)]
+    assignments, rejections = allocate(hostel, requests, JAN, FEB)
+    assert assignments == [(first, g12.id, 15000)]
+    assert rejections == [(2, first, "already booked for this window"), (3, 999, "unknown student"),
+                          (4, second, "no matching room with a free bed")]
+
+def test_cheapest_room_first_and_dry_run_writes_nothing(hostel):
+    _, (first, _) = setup(hostel)
+    g12 = hostel.query(Room).filter_by(room_number="G12").one()
+    before = hostel.query(Booking).count()
+    assignments, _ = allocate(hostel, [AllocationRequest(1, first)], MAR, APR, dry_run=True)
+    assert assignments == [(first, g12.id, 15000)]
+    assert hostel.query(Booking).count() == before
@@ -0,0 +1,44 @@
+from datetime import date
+from sqlalchemy import select, func
+from lib import archive, reports
+from lib.bookings import create_booking
+from lib.models import Student, Room, Booking, Complaint, ArchivedBooking, ArchivedComplaint, AuditEntry
+
+JAN, FEB, MAR = date(2026, 1, 5), date(2026, 2, 5), date(2026, 3, 5)
+
+def finished_booking(session, check_in=JAN, check_out=FEB):
+    student = session.query(Student).first()
+    room = session.query(Room).filter_by(room_number="G12").one()
+    booking = create_booking(session, student.id, room.id, check_in, check_out)
+    booking.status = 'completed'
+    session.commit()
+    return booking.id
+
+def count(session, model):
+    return session.execute(select(func.count()).select_from(model)).scalar()
+
+def test_round_trip_keeps_rows_and_totals(hostel):
+    kept = finished_booking(hostel, MAR, date(2026, 4, 5))
+    moved = finished_booking(hostel)
+    student = hostel.query(Student).first()
+    hostel.add(Complaint(student_id=student.id, manager_id=1, title="Leaking tap", date=JAN, status='resolved'))
+    hostel.commit()
+    before = reports.booking_status_counts(hostel)
+    assert archive.pending(hostel, MAR) == (1, 1)
+    assert archive.archive(hostel, MAR, chunk_size=1) == (1, 1)
+    assert [row.id for row in hostel.query(Booking)] == [kept]
+    assert hostel.get(ArchivedBooking, moved).archived_date is not None
+    assert count(hostel, ArchivedComplaint) == 1
+    assert reports.booking_status_counts(hostel, include_archive=True) == before
+    assert archive.archive(hostel, MAR) == (0, 0)
+
+def test_archived_ids_are_never_reused(hostel):
+    first = finished_booking(hostel)
+    archive.archive(hostel, MAR)
+    second = finished_booking(hostel)
+    assert second > first
+    archive.archive(hostel, MAR)
+    assert count(hostel, ArchivedBooking) == 2
+    history = hostel.execute(select(AuditEntry.action).where(
+        AuditEntry.entity == 'booking', AuditEntry.entity_id == first).order_by(AuditEntry.id)).scalars().all()
+    assert history[0] == 'insert' and history[-1] == 'archive'
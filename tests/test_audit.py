@@ -0,0 +1,77 @@
+import json
+from sqlalchemy import select, insert, update, delete
+from lib import audit
+from lib.models import Student, Room, AuditEntry
+
+def entries(session, entity, action=None):
+    stmt = select(AuditEntry.entity_id, AuditEntry.action, AuditEntry.changes).where(AuditEntry.entity == entity)
+    if action:
+        stmt = stmt.where(AuditEntry.action == action)
+    return [(entity_id, action, json.loads(changes)) for entity_id, action, changes in
+            session.execute(stmt.order_by(AuditEntry.id))]
+
+def test_orm_changes_are_recorded(hostel):
+    audit.set_actor("menu: Students")
+    try:
+        wanjiku = hostel.query(Student).filter_by(name="Wanjiku Mwangi").one()
+        wanjiku.phone = "0799999999"
+        hostel.commit()
+    finally:
+        audit.set_actor(None)
+    [(entity_id, action, changes)] = entries(hostel, 'student', 'update')
+    assert (entity_id, action, changes) == (wanjiku.id, 'update', {'phone': ["0712345678", "0799999999"]})
+    assert hostel.execute(select(AuditEntry.actor).where(AuditEntry.action == 'update')).scalar().endswith(
+        "menu: Students")
+    assert len(entries(hostel, 'room', 'insert')) == 2
+
+def test_bulk_update_records_only_rows_that_change(hostel):
+    g12 = hostel.query(Room).filter_by(room_number="G12").one()
+    hostel.execute(update(Room).where(Room.id == g12.id).values(current_occupancy=3))
+    hostel.execute(update(Room).values(price=25000, current_occupancy=Room.current_occupancy))
+    hostel.commit()
+    updates = entries(hostel, 'room', 'update')
+    assert updates[0] == (g12.id, 'update', {'current_occupancy': [0, 3]})
+    # T7 already cost 25000, so only G12 changed
+    assert updates[1:] == [(g12.id, 'update', {'price': [15000, 25000]})]
+
+def test_bulk_delete_records_the_old_row(hostel):
+    otieno = hostel.query(Student).filter_by(name="Otieno Owino").one()
+    hostel.execute(delete(Student).where(Student.id == otieno.id))
+    hostel.commit()
+    [(entity_id, _, changes)] = entries(hostel, 'student', 'delete')
+    assert entity_id == otieno.id
+    assert changes['email'] == "owino@student.uonbi.ac.ke"
+
+def test_bulk_insert_records_each_new_id(hostel):
+    rows = [{'name': f"Achieng Odhiambo {i}", 'email': f"achieng{i}@jkuat.ac.ke", 'phone': "0734567890"}
+            for i in range(3)]
+    # An explicit id ahead of the sequence must not shift the others
+    rows[0]['id'] = 100
+    hostel.execute(insert(Student), rows)
+    hostel.commit()
+    ids = {email: student_id for student_id, email in hostel.execute(select(Student.id, Student.email))}
+    recorded = {changes['email']: entity_id for entity_id, _, changes in entries(hostel, 'student', 'insert')}
+    assert {email: recorded[email] for email in ids} == ids
+
+def test_rollback_discards_entries(hostel):
+    before = len(entries(hostel, 'room'))
+    hostel.add(Room(room_number="B3", capacity=1, price=35000))
+    hostel.flush()
+    hostel.execute(update(Room).values(price=40000))
+    hostel.rollback()
+    assert len(entries(hostel, 'room')) == before
+
+def test_buffer_is_written_in_bounded_batches(hostel, monkeypatch):
+    monkeypatch.setattr(audit, 'BATCH_SIZE', 2)
+    hostel.add_all([Room(room_number=f"C{i}", capacity=2, price=20000) for i in range(5)])
+    hostel.flush()
+    assert len(hostel.connection().info.get(audit.BUFFER_KEY, [])) < 2
+    hostel.commit()
+    assert len(entries(hostel, 'room', 'insert')) == 7
+
+def test_where_parameters_are_not_taken_for_new_values(hostel):
+    hostel.execute(update(Room).where(Room.price == 15000).values(price=17000, capacity=Room.capacity + 1))
+    hostel.commit()
+    g12 = hostel.query(Room).filter_by(room_number="G12").one()
+    # capacity comes from an SQL expression, so only the plain price is diffed
+    assert entries(hostel, 'room', 'update') == [(g12.id, 'update', {'price': [15000, 17000]})]
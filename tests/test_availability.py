@@ -0,0 +1,38 @@
+from datetime import date
+from lib.availability import peak_occupancy, free_beds, rooms_with_free_beds
+from lib.models import Student, Room, Booking
+
+JAN, FEB, MAR, APR, MAY = (date(2027, month, 1) for month in range(1, 6))
+
+def book(session, room, check_in, check_out, status='confirmed'):
+    student = session.query(Student).first()
+    session.add(Booking(student_id=student.id, room_id=room.id, check_in_date=check_in,
+                        check_out_date=check_out, status=status))
+    session.commit()
+
+def test_back_to_back_stays_do_not_clash():
+    assert peak_occupancy([(JAN, FEB), (FEB, MAR)], JAN, MAR) == 1
+    assert peak_occupancy([(JAN, MAR), (FEB, APR)], JAN, APR) == 2
+    assert peak_occupancy([(JAN, FEB), (MAR, APR)], FEB, MAR) == 0
+
+def test_free_beds_counts_only_overlapping_confirmed(hostel):
+    t7 = hostel.query(Room).filter_by(room_number="T7").one()
+    book(hostel, t7, JAN, FEB)
+    book(hostel, t7, JAN, MAR)
+    book(hostel, t7, JAN, MAY, status='cancelled')
+    assert free_beds(hostel, t7.id, JAN, FEB) == 0
+    assert free_beds(hostel, t7.id, FEB, MAR) == 1
+    assert free_beds(hostel, t7.id, MAR, APR) == 2
+    assert free_beds(hostel, 999, JAN, FEB) is None
+
+def test_rooms_with_free_beds_sweeps_borderline_rooms(hostel):
+    t7 = hostel.query(Room).filter_by(room_number="T7").one()
+    # Two bookings overlap the window in a two-bed room, but never at the same time
+    book(hostel, t7, JAN, FEB)
+    book(hostel, t7, FEB, MAR)
+    found = {number: free for _, number, _, free in rooms_with_free_beds(hostel, JAN, MAR)}
+    assert found == {"G12": 4, "T7": 1}
+    book(hostel, t7, JAN, MAR)
+    found = {number: free for _, number, _, free in rooms_with_free_beds(hostel, JAN, MAR)}
+    assert found == {"G12": 4}
+    assert [row[1] for row in rooms_with_free_beds(hostel, MAR, APR, beds=3)] == ["G12"]
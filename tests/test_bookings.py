@@ -0,0 +1,76 @@
+import threading
+from datetime import date
+import pytest
+from sqlalchemy import select, func
+from sqlalchemy.orm import sessionmaker
+from lib.bookings import BookingError, create_booking, cancel_booking
+from lib.models import Student, Room, Booking
+
+JAN, FEB, MAR, APR = (date(2027, month, 1) for month in range(1, 5))
+
+def two_bed_room(session):
+    return session.query(Room).filter_by(room_number="T7").one()
+
+def student_ids(session):
+    return session.execute(select(Student.id).order_by(Student.id)).scalars().all()
+
+def test_later_window_is_bookable_when_room_is_full_now(hostel):
+    room, (wanjiku, otieno) = two_bed_room(hostel), student_ids(hostel)
+    create_booking(hostel, wanjiku, room.id, JAN, FEB)
+    create_booking(hostel, otieno, room.id, JAN, FEB)
+    with pytest.raises(BookingError, match="fully booked"):
+        create_booking(hostel, wanjiku, room.id, JAN, MAR)
+    booking = create_booking(hostel, wanjiku, room.id, MAR, APR)
+    assert booking.status == 'confirmed'
+    hostel.refresh(room)
+    # The counter caches confirmed bookings; it is not the guard
+    assert room.current_occupancy == 3 and room.is_available is False
+
+def test_rejects_unknown_room_student_and_bad_dates(hostel):
+    room, (wanjiku, _) = two_bed_room(hostel), student_ids(hostel)
+    with pytest.raises(BookingError, match="Room with ID 999"):
+        create_booking(hostel, wanjiku, 999, JAN, FEB)
+    with pytest.raises(BookingError, match="Student with ID 999"):
+        create_booking(hostel, 999, room.id, JAN, FEB)
+    with pytest.raises(BookingError, match="Check-out"):
+        create_booking(hostel, wanjiku, room.id, FEB, JAN)
+    assert hostel.execute(select(func.count(Booking.id))).scalar() == 0
+
+def test_cancel_releases_the_bed(hostel):
+    room, (wanjiku, otieno) = two_bed_room(hostel), student_ids(hostel)
+    first = create_booking(hostel, wanjiku, room.id, JAN, MAR)
+    create_booking(hostel, otieno, room.id, JAN, MAR)
+    cancel_booking(hostel, first.id)
+    with pytest.raises(BookingError, match="already cancelled"):
+        cancel_booking(hostel, first.id)
+    hostel.refresh(room)
+    assert room.current_occupancy == 1
+    create_booking(hostel, wanjiku, room.id, FEB, MAR)
+
+def test_concurrent_claims_never_overbook(hostel, engine):
+    room_id = two_bed_room(hostel).id
+    hostel.add_all([Student(name=f"Student {i}", email=f"s{i}@students.ac.ke", phone="0712345678")
+                    for i in range(6)])
+    hostel.commit()
+    ids = student_ids(hostel)
+    start = threading.Barrier(len(ids))
+    outcomes = []
+
+    def claim(student_id):
+        session = sessionmaker(bind=engine)()
+        try:
+            start.wait()
+            create_booking(session, student_id, room_id, JAN, MAR)
+            outcomes.append('booked')
+        except BookingError:
+            outcomes.append('rejected')
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=claim, args=(student_id,)) for student_id in ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(outcomes) == ['booked'] * 2 + ['rejected'] * (len(ids) - 2)
+    assert hostel.execute(select(func.count(Booking.id)).where(Booking.room_id == room_id)).scalar() == 2
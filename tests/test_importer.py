@@ -0,0 +1,37 @@
+import json
+from sqlalchemy import select
+from lib import importer, search
+from lib.models import Student, AuditEntry
+
+def write_jsonl(tmp_path, rows):
+    path = tmp_path / "students.jsonl"
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n", encoding='utf-8')
+    return str(path)
+
+def test_bad_rows_are_reported_and_the_rest_imported(hostel, tmp_path):
+    path = write_jsonl(tmp_path, [
+        {'name': "Achieng Odhiambo", 'email': "achieng@jkuat.ac.ke", 'phone': "0734567890"},
+        {'name': "Kiprono Korir", 'email': "kiprono@jkuat.ac.ke", 'phone': 712345678},
+        {'name': "Chebet Rotich", 'email': "wanjiku@student.ku.ac.ke", 'phone': "0745678901"},
+        {'name': {'first': "Njeri"}, 'email': "njeri@jkuat.ac.ke", 'phone': "0756789012"},
+    ])
+    imported, errors = importer.import_students(hostel, path)
+    assert imported == 1
+    assert errors == [(2, "phone is not text"), (3, "duplicate email 'wanjiku@student.ku.ac.ke'"),
+                      (4, "name is not text")]
+    assert hostel.execute(select(Student.name).where(Student.email == "achieng@jkuat.ac.ke")).scalar() \
+        == "Achieng Odhiambo"
+
+def test_imported_students_are_searchable(hostel, tmp_path):
+    path = write_jsonl(tmp_path, [
+        {'name': f"Mutua Wekesa {i}", 'email': f"mutua{i}@students.ku.ac.ke", 'phone': "0767890123"}
+        for i in range(3)])
+    assert importer.import_students(hostel, path, chunk_size=2) == (3, [])
+    assert len(search.search(hostel, "wekesa", ['student'])) == 3
+    audited = hostel.execute(select(AuditEntry.changes).where(
+        AuditEntry.entity == 'student', AuditEntry.action == 'insert', AuditEntry.changes.like('%Wekesa%'))).all()
+    assert len(audited) == 3
+    # The insert trigger is back for ordinary writes
+    hostel.add(Student(name="Gitau Macharia", email="gitau@jkuat.ac.ke", phone="0778901234"))
+    hostel.commit()
+    assert len(search.search(hostel, "macharia", ['student'])) == 1
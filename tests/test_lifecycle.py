@@ -0,0 +1,40 @@
+from datetime import date
+from sqlalchemy import select
+from lib.bookings import create_booking
+from lib.lifecycle import expire_bookings
+from lib.models import Student, Room, Booking
+
+JAN, FEB, MAR, APR = (date(2027, month, 1) for month in range(1, 5))
+
+def booked(session):
+    """Wanjiku in G12 until February, Otieno in T7 until April"""
+    wanjiku, otieno = session.execute(select(Student.id).order_by(Student.id)).scalars().all()
+    g12 = session.query(Room).filter_by(room_number="G12").one()
+    t7 = session.query(Room).filter_by(room_number="T7").one()
+    return (create_booking(session, wanjiku, g12.id, JAN, FEB).id,
+            create_booking(session, otieno, t7.id, JAN, APR).id)
+
+def statuses(session):
+    return dict(session.execute(select(Booking.id, Booking.status)).all())
+
+def test_dry_run_counts_without_changing(hostel):
+    booked(hostel)
+    assert tuple(expire_bookings(hostel, MAR, dry_run=True)) == (1, 1)
+    assert set(statuses(hostel).values()) == {'confirmed'}
+
+def test_expired_bookings_complete_and_free_their_beds(hostel):
+    ended, current = booked(hostel)
+    assert expire_bookings(hostel, MAR) == (1, 1)
+    assert statuses(hostel) == {ended: 'completed', current: 'confirmed'}
+    occupancy = dict(hostel.execute(select(Room.room_number, Room.current_occupancy)).all())
+    assert occupancy == {"G12": 0, "T7": 1}
+
+def test_check_out_day_counts_as_expired(hostel):
+    ended, _ = booked(hostel)
+    assert expire_bookings(hostel, FEB) == (1, 1)
+    assert statuses(hostel)[ended] == 'completed'
+
+def test_second_run_changes_nothing(hostel):
+    booked(hostel)
+    expire_bookings(hostel, MAR)
+    assert expire_bookings(hostel, MAR) == (0, 0)
@@ -0,0 +1,60 @@
+from datetime import date
+from sqlalchemy import update
+from lib.models import Student, Room, Booking
+from lib.occupancy import drifted_rooms, reconcile
+
+JAN, MAR = date(2027, 1, 1), date(2027, 3, 1)
+
+def rooms(session):
+    return {room.room_number: room for room in session.query(Room)}
+
+def add_booking(session, room, status='confirmed'):
+    student = session.query(Student).first()
+    booking = Booking(student_id=student.id, room_id=room.id, check_in_date=JAN, check_out_date=MAR, status=status)
+    session.add(booking)
+    session.commit()
+    return booking
+
+def test_counters_follow_booking_changes(hostel):
+    t7 = rooms(hostel)["T7"]
+    first = add_booking(hostel, t7)
+    add_booking(hostel, t7)
+    add_booking(hostel, t7, status='cancelled')
+    assert (t7.current_occupancy, t7.is_available) == (2, False)
+    first.status = 'completed'
+    hostel.commit()
+    assert (t7.current_occupancy, t7.is_available) == (1, True)
+    t7.capacity = 1
+    hostel.commit()
+    assert t7.is_available is False
+
+def test_moving_a_booking_refreshes_both_rooms(hostel):
+    g12, t7 = rooms(hostel)["G12"], rooms(hostel)["T7"]
+    booking = add_booking(hostel, g12)
+    booking.room_id = t7.id
+    hostel.commit()
+    assert (g12.current_occupancy, t7.current_occupancy) == (0, 1)
+
+def test_deleting_a_student_ends_their_stays(hostel):
+    t7 = rooms(hostel)["T7"]
+    booking = add_booking(hostel, t7)
+    hostel.delete(booking.student)
+    hostel.commit()
+    assert booking.status == 'cancelled' and t7.current_occupancy == 0
+
+def test_reconcile_fixes_drift(hostel):
+    g12, t7 = rooms(hostel)["G12"], rooms(hostel)["T7"]
+    add_booking(hostel, t7)
+    # Drift made behind the listeners' back, e.g. by another tool
+    hostel.execute(update(Room.__table__).values(current_occupancy=3, is_available=None))
+    hostel.commit()
+    connection = hostel.connection()
+    drift = {row[1]: row[2:] for row in drifted_rooms(connection)}
+    assert drift == {"G12": (3, 0, None, True), "T7": (3, 1, None, True)}
+    assert reconcile(connection, dry_run=True) and drifted_rooms(connection)
+    reconcile(connection)
+    hostel.commit()
+    assert drifted_rooms(hostel.connection()) == []
+    hostel.expire_all()
+    assert (g12.current_occupancy, t7.current_occupancy, t7.is_available) == (0, 1, True)
+    assert reconcile(hostel.connection()) == []
@@ -0,0 +1,48 @@
+from datetime import date
+from lib import queries
+from lib.models import Student, Room, Booking, Complaint
+
+def add_bookings(session, count, block="B"):
+    students = [Student(name=f"Student {i}", email=f"{block.lower()}{i}@students.ac.ke", phone="0712345678")
+                for i in range(count)]
+    room = Room(room_number=f"{block}1", capacity=count, price=12000)
+    session.add_all(students + [room])
+    session.flush()
+    session.add_all([Booking(student_id=student.id, room_id=room.id, check_in_date=date(2027, 1, 8),
+                             check_out_date=date(2027, 4, 30), status='confirmed') for student in students])
+    session.commit()
+
+def test_booking_rows_join_names(hostel):
+    wanjiku = hostel.query(Student).filter_by(name="Wanjiku Mwangi").one()
+    g12 = hostel.query(Room).filter_by(room_number="G12").one()
+    hostel.add(Booking(student_id=wanjiku.id, room_id=g12.id, check_in_date=date(2027, 1, 8),
+                       check_out_date=date(2027, 4, 30), status='confirmed'))
+    hostel.commit()
+    rows = queries.booking_rows(hostel)
+    assert [tuple(row[1:3]) for row in rows] == [("Wanjiku Mwangi", "G12")]
+
+def test_listing_statement_count_is_fixed(session, statements):
+    add_bookings(session, 3)
+    statements.clear()
+    queries.booking_rows(session)
+    few = len(statements)
+    add_bookings(session, 40, block="C")
+    statements.clear()
+    assert len(queries.booking_rows(session)) == 43
+    assert len(statements) == few
+
+def test_complaint_rows_keep_missing_manager(hostel):
+    student = hostel.query(Student).first()
+    hostel.add(Complaint(student_id=student.id, manager_id=None, title="Leaking tap", status='open'))
+    hostel.commit()
+    (row,) = queries.complaint_rows(hostel)
+    assert row[1] == student.name and row[2] is None
+
+def test_keyset_pages(session):
+    add_bookings(session, 25)
+    first = queries.booking_rows(session, limit=10)
+    second = queries.booking_rows(session, after_id=first[-1][0], limit=10)
+    back = queries.booking_rows(session, before_id=second[0][0], limit=10)
+    assert [row[0] for row in back] == [row[0] for row in first]
+    assert second[0][0] == first[-1][0] + 1
+    assert len(list(queries.iter_rows(session, queries.booking_rows, batch=7))) == 25
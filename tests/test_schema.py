@@ -0,0 +1,58 @@
+import click
+import pytest
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+from benchmarks.datagen import generate
+from lib import search
+from lib.commands.core import ALEMBIC_INI, create_schema
+from lib.config import build_engine
+
+def head_revision():
+    return ScriptDirectory.from_config(Config(ALEMBIC_INI)).get_current_head()
+
+def test_schema_matches_initdb(engine):
+    tables = set(inspect(engine).get_table_names())
+    assert {'students', 'rooms', 'bookings', 'search_index', 'alembic_version'} <= tables
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT version_num FROM alembic_version")).scalar() == head_revision()
+
+def test_generated_database_is_searchable(tmp_path, database_url):
+    engine = build_engine(url=f"sqlite:///{tmp_path / 'bench.db'}")
+    assert generate(engine, 60, seed=7)['students'] == 60
+    with Session(engine) as session:
+        assert session.execute(text("SELECT version_num FROM alembic_version")).scalar() == head_revision()
+        name = session.execute(text("SELECT name FROM students WHERE id = 1")).scalar()
+        assert 1 in [ref_id for _, ref_id, _, _ in search.search(session, name, ['student'], limit=100)]
+    # Running it again leaves an Alembic-managed database alone
+    create_schema(engine)
+    engine.dispose()
+
+def test_initdb_upgrades_a_database_behind_head(tmp_path, database_url):
+    from alembic import command
+    engine = build_engine(url=f"sqlite:///{tmp_path / 'old.db'}")
+    config = Config(ALEMBIC_INI)
+    with engine.begin() as connection:
+        config.attributes['connection'] = connection
+        command.upgrade(config, 'ec96fdd51d07')
+    create_schema(engine)
+    tables = set(inspect(engine).get_table_names())
+    assert {'room_snapshots', 'bookings_archive', 'audit_log', 'search_index'} <= tables
+    assert 'ix_bookings_student_status' in {index['name'] for index in inspect(engine).get_indexes('bookings')}
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT version_num FROM alembic_version")).scalar() == head_revision()
+        triggers = dict(connection.execute(text("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'")).all())
+    # Update triggers narrowed to indexed columns; the complaint rebuild kept its triggers
+    assert "AFTER UPDATE OF room_number ON rooms" in triggers['rooms_search_update']
+    assert {'complaints_search_insert', 'complaints_search_update', 'complaints_search_delete'} <= set(triggers)
+    engine.dispose()
+
+def test_unmanaged_tables_are_left_alone(tmp_path, database_url):
+    engine = build_engine(url=f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE students (id INTEGER PRIMARY KEY, name VARCHAR)"))
+    with pytest.raises(click.ClickException):
+        create_schema(engine)
+    assert inspect(engine).get_table_names() == ['students']
+    engine.dispose()
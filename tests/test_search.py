@@ -0,0 +1,42 @@
+from sqlalchemy import update
+from lib import search
+from lib.models import Student, Room, Complaint
+
+def found(session, query, kind):
+    return [ref_id for _, ref_id, _, _ in search.search(session, query, [kind])]
+
+def writes(session, statement):
+    """Rows changed by statement, including rows changed by triggers (audit entries left out)"""
+    connection = session.connection()
+    dbapi = connection.connection.dbapi_connection
+    before = dbapi.total_changes
+    connection.execute(statement)
+    return dbapi.total_changes - before
+
+def test_triggers_follow_inserts_updates_and_deletes(hostel):
+    wanjiku = hostel.query(Student).filter_by(name="Wanjiku Mwangi").one()
+    assert found(hostel, "wanj", 'student') == [wanjiku.id]
+    wanjiku.name = "Wanjiku Kariuki"
+    hostel.commit()
+    assert found(hostel, "kariuki", 'student') == [wanjiku.id]
+    assert found(hostel, "mwangi", 'student') == []
+    hostel.add(Complaint(student_id=wanjiku.id, title="Leaking tap", description="Bathroom on floor two"))
+    hostel.commit()
+    assert len(found(hostel, "bathroom", 'complaint')) == 1
+    hostel.delete(wanjiku)
+    hostel.commit()
+    assert found(hostel, "kariuki", 'student') == []
+
+def test_fuzzy_match_corrects_typos(hostel):
+    assert found(hostel, "otieon", 'student') != []
+
+def test_unindexed_columns_leave_the_index_alone(hostel):
+    g12 = hostel.query(Room).filter_by(room_number="G12").one()
+    hostel.add(Complaint(student_id=1, title="Broken window", status='open'))
+    hostel.commit()
+    assert writes(hostel, update(Room).where(Room.id == g12.id).values(current_occupancy=3, is_available=True)) == 1
+    assert writes(hostel, update(Complaint).values(status='resolved')) == 1
+    # Indexed columns still rewrite their index row
+    assert writes(hostel, update(Room).where(Room.id == g12.id).values(room_number="G14")) > 1
+    hostel.commit()
+    assert found(hostel, "g14", 'room') == [g12.id]
@@ -0,0 +1,38 @@
+import pytest
+from lib import server
+from lib.models import Student, Manager, Complaint
+
+def test_complaint_without_manager_is_auto_assigned(hostel):
+    student = hostel.query(Student).first()
+    kamau = hostel.query(Manager).filter_by(name="Kamau Githinji").one()
+    hostel.add(Complaint(student_id=student.id, manager_id=kamau.id, title="Broken window", status='open'))
+    hostel.commit()
+    status, complaint = server.file_complaint(hostel, {}, {}, {'student_id': student.id, 'title': "No hot water"})
+    assert status == 201
+    assert hostel.get(Complaint, complaint['id']).manager.name == "Nyambura Wairimu"
+
+def test_complaint_with_manager_keeps_it(hostel):
+    student = hostel.query(Student).first()
+    kamau = hostel.query(Manager).filter_by(name="Kamau Githinji").one()
+    body = {'student_id': str(student.id), 'manager_id': str(kamau.id), 'title': "Leaking tap"}
+    status, complaint = server.file_complaint(hostel, {}, {}, body)
+    assert status == 201 and complaint['manager_id'] == kamau.id
+
+def test_complaint_rejects_bad_fields(hostel):
+    with pytest.raises(server.HttpError, match="student_id"):
+        server.file_complaint(hostel, {}, {}, {'title': "Leaking tap"})
+    with pytest.raises(server.HttpError, match="manager_id"):
+        server.file_complaint(hostel, {}, {}, {'student_id': 1, 'manager_id': 'kamau', 'title': "Leaking tap"})
+
+def test_non_text_fields_are_bad_requests(hostel):
+    student = hostel.query(Student).first()
+    with pytest.raises(server.HttpError, match="'email' must be a string") as error:
+        server._person_updater(server.services.update_student)(hostel, {'id': str(student.id)}, {}, {'email': 5})
+    assert error.value.status == 400
+    with pytest.raises(server.HttpError, match="'name' must be a string"):
+        server._person_creator(server.services.add_student)(
+            hostel, {}, {}, {'name': {'first': "Njeri"}, 'email': "njeri@jkuat.ac.ke", 'phone': "0756789012"})
+    with pytest.raises(server.HttpError, match="'description' must be a string"):
+        server.file_complaint(hostel, {}, {}, {'student_id': student.id, 'title': "Leaking tap", 'description': []})
+    with pytest.raises(server.HttpError, match="'status' must be a string"):
+        server.update_complaint(hostel, {'id': '1'}, {}, {'status': 1})
@@ -0,0 +1,25 @@
+from datetime import date
+from sqlalchemy import select, func
+from lib import snapshots
+from lib.models import Student, Room, Booking, RoomSnapshot, DailySnapshot
+
+def test_capture_is_incremental(hostel):
+    t7 = hostel.query(Room).filter_by(room_number="T7").one()
+    student = hostel.query(Student).first()
+    hostel.add(Booking(student_id=student.id, room_id=t7.id, check_in_date=date(2027, 1, 1),
+                       check_out_date=date(2027, 1, 11), status='confirmed'))
+    hostel.commit()
+    assert snapshots.capture(hostel, until=date(2027, 1, 5), since=date(2027, 1, 1)) == (5, 5)
+    assert snapshots.capture(hostel, until=date(2027, 1, 5)) == (0, 0)
+    assert snapshots.capture(hostel, until=date(2027, 1, 14))[0] == 9
+    revenue = hostel.execute(select(func.sum(DailySnapshot.occupied))).scalar()
+    assert revenue == 10
+
+def test_deleting_a_room_removes_its_snapshots(hostel):
+    # build_engine turns foreign keys on, so the cascade runs as in the app
+    t7 = hostel.query(Room).filter_by(room_number="T7").one()
+    hostel.add(RoomSnapshot(room_id=t7.id, day=date(2027, 1, 1), occupied=1, capacity=2, price=25000, revenue=25000))
+    hostel.commit()
+    hostel.delete(t7)
+    hostel.commit()
+    assert hostel.execute(select(func.count()).select_from(RoomSnapshot)).scalar() == 0